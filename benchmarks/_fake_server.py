@@ -0,0 +1,661 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""In-process stand-in for the Geometry service used by the benchmarks.
+
+The server implements the subset of the ``ansys.api.discovery.v1`` services
+that the client needs to connect, to read, tessellate and plot a design, to
+query the faces, edges and vertices of its bodies and the surfaces of the
+faces, to create sphere bodies, to translate bodies, to set its driving
+dimensions, to measure the gaps between its bodies and to check their
+collisions.
+Every answer is generated from a :class:`SyntheticDesign`, so the measured
+time is dominated by client-side work (message parsing, object creation,
+conversions) and not by any geometry kernel.
+"""
+
+from concurrent import futures
+from dataclasses import dataclass
+from functools import cached_property
+import itertools
+
+from ansys.api.discovery.v1.commands import (
+    application_pb2,
+    application_pb2_grpc,
+    communication_pb2,
+    communication_pb2_grpc,
+)
+from ansys.api.discovery.v1.commonenums_pb2 import BackendType
+from ansys.api.discovery.v1.commonmessages_pb2 import (
+    DeleteResponse,
+    Direction,
+    EntityIdentifier,
+    Point,
+    Quantity,
+)
+from ansys.api.discovery.v1.design import designdoc_pb2, designdoc_pb2_grpc
+from ansys.api.discovery.v1.design.designmessages_pb2 import (
+    BodyEntity,
+    Box,
+    ComponentEntity,
+    DrivingDimensionEntity,
+    EdgeEntity,
+    FaceEntity,
+    GetBoundingBoxResponse,
+    GetBoundingBoxResponseData,
+    GetFacesResponse,
+    GetFacesResponseData,
+    Matrix,
+    NamedSelectionEntity,
+    PartEntity,
+    Surface,
+    Tessellation,
+    Vertex,
+)
+from ansys.api.discovery.v1.design.geometry import (
+    body_pb2,
+    body_pb2_grpc,
+    edge_pb2,
+    edge_pb2_grpc,
+    face_pb2,
+    face_pb2_grpc,
+)
+from ansys.api.discovery.v1.design.parameters import (
+    drivingdimension_pb2,
+    drivingdimension_pb2_grpc,
+)
+from ansys.api.discovery.v1.design.selections import namedselection_pb2, namedselection_pb2_grpc
+from ansys.api.discovery.v1.geometryenums_pb2 import DimensionType
+from ansys.api.discovery.v1.operations import edit_pb2, edit_pb2_grpc, measure_pb2, measure_pb2_grpc
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+
+#: Backend version reported by the fake server.
+FAKE_BACKEND_VERSION = (27, 1, 0)
+
+# Unit cube faces, as indices into the eight corners generated by ``_box_corners``
+_CUBE_FACES = (
+    (0, 1, 3, 2),
+    (4, 6, 7, 5),
+    (0, 4, 5, 1),
+    (2, 3, 7, 6),
+    (0, 2, 6, 4),
+    (1, 5, 7, 3),
+)
+
+# Unit cube edges, as pairs of indices into the eight corners generated by ``_box_corners``
+_CUBE_EDGES = tuple((a, b) for a in range(8) for b in range(a + 1, 8) if bin(a ^ b).count("1") == 1)
+
+
+def _box_corners(offset: float) -> list[tuple[float, float, float]]:
+    """Return the eight corners of a unit cube shifted along X by ``offset``."""
+    return [(offset + x, float(y), float(z)) for x in (0.0, 1.0) for y in (0, 1) for z in (0, 1)]
+
+
+def _id(value: str) -> EntityIdentifier:
+    return EntityIdentifier(id=value)
+
+
+def _point(x: float, y: float, z: float) -> Point:
+    return Point(
+        x=Quantity(value_in_geometry_units=x),
+        y=Quantity(value_in_geometry_units=y),
+        z=Quantity(value_in_geometry_units=z),
+    )
+
+
+def _master_id(entity_id: str) -> str:
+    # Client side body ids are "<component id>/<master body id>"
+    return entity_id.rsplit("/", 1)[-1]
+
+
+def _corners_of(entity_id: str) -> list[tuple[float, float, float]]:
+    """Corners of a body, face or edge.
+
+    Face and edge ids are "<master body id>/<face|edge>-<index>".
+    """
+    if "/face-" not in entity_id and "/edge-" not in entity_id:
+        return _box_corners(2.0 * int(entity_id.rsplit("-", 1)[-1]))
+
+    body_id, entity = entity_id.rsplit("/", 2)[-2:]
+    corners = _box_corners(2.0 * int(body_id.rsplit("-", 1)[-1]))
+    kind, index = entity.split("-")
+    indices = _CUBE_FACES[int(index)] if kind == "face" else _CUBE_EDGES[int(index)]
+    return [corners[i] for i in indices]
+
+
+def _bounding_box(entity_id: str) -> GetBoundingBoxResponseData:
+    corners = _corners_of(entity_id)
+    low = [min(coords) for coords in zip(*corners)]
+    high = [max(coords) for coords in zip(*corners)]
+    return GetBoundingBoxResponseData(
+        id=_id(entity_id),
+        box=Box(
+            min=_point(*low),
+            max=_point(*high),
+            center=_point(*((lo + hi) / 2 for lo, hi in zip(low, high))),
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class SyntheticDesign:
+    """Description of a synthetic design served by :class:`FakeGeometryServer`.
+
+    Parameters
+    ----------
+    n_bodies : int
+        Total number of bodies in the design.
+    bodies_per_component : int, default: 100
+        Number of bodies placed in each component. The design holds
+        ``ceil(n_bodies / bodies_per_component)`` components.
+    n_named_selections : int, default: 10
+        Number of named selections in the design.
+    n_parameters : int, default: 20
+        Number of driving dimensions in the design.
+    instances_per_part : int, default: 1
+        Number of consecutive components that are instances of the same part, and
+        so share its master bodies. Instances of a part are placed side by side
+        along the X axis.
+    """
+
+    n_bodies: int
+    bodies_per_component: int = 100
+    n_named_selections: int = 10
+    n_parameters: int = 20
+    instances_per_part: int = 1
+
+    design_id: str = "design-1"
+    main_part_id: str = "part-root"
+
+    @property
+    def n_components(self) -> int:
+        """Number of components in the design."""
+        return -(-self.n_bodies // self.bodies_per_component)
+
+    def component_id(self, index: int) -> str:
+        """Id of the component at ``index``."""
+        return f"comp-{index}"
+
+    def body_id(self, index: int) -> str:
+        """Id of the master body at ``index``."""
+        return f"body-{index}"
+
+    def master_index(self, index: int) -> int:
+        """Index of the master body of the body occurrence at ``index``."""
+        component, slot = divmod(index, self.bodies_per_component)
+        return (component // self.instances_per_part) * self.bodies_per_component + slot
+
+    def master_indices(self) -> list[int]:
+        """Indices of the master bodies of the design."""
+        return sorted({self.master_index(i) for i in range(self.n_bodies)})
+
+    def body_ids(self) -> list[str]:
+        """Ids of the bodies as exposed by ``Component.bodies`` on the client."""
+        return [
+            f"{self.component_id(i // self.bodies_per_component)}/"
+            f"{self.body_id(self.master_index(i))}"
+            for i in range(self.n_bodies)
+        ]
+
+    @cached_property
+    def assembly(self) -> designdoc_pb2.GetAssemblyResponse:
+        """Assembly message returned by ``DesignDoc.GetAssembly``."""
+        parts = [PartEntity(id=_id(self.main_part_id), name="root")]
+        transformed_parts = []
+        components = []
+        for c in range(self.n_components):
+            p, instance = divmod(c, self.instances_per_part)
+            if not instance:
+                parts.append(PartEntity(id=_id(f"part-{p}"), name=f"Part{p}"))
+            part = parts[-1]
+            placement = Matrix(m00=1, m11=1, m22=1, m33=1, m03=1000.0 * instance)
+            transformed_parts.append(
+                ComponentEntity(
+                    id=_id(f"master-{c}"), name=f"Part{p}", placement=placement, part_master=part
+                )
+            )
+            components.append(
+                ComponentEntity(
+                    id=_id(self.component_id(c)),
+                    name=f"Component{c}",
+                    parent_id=_id(self.main_part_id),
+                    master_id=_id(f"master-{c}"),
+                    placement=placement,
+                    part_master=part,
+                )
+            )
+
+        bodies = [
+            BodyEntity(
+                id=_id(self.body_id(i)),
+                name=f"Body{i}",
+                master_id=_id(self.body_id(i)),
+                parent_id=_id(f"part-{i // self.bodies_per_component}"),
+            )
+            for i in self.master_indices()
+        ]
+        named_selections = [
+            NamedSelectionEntity(id=_id(f"ns-{i}"), name=f"NamedSelection{i}")
+            for i in range(self.n_named_selections)
+        ]
+        return designdoc_pb2.GetAssemblyResponse(
+            parts=parts,
+            transformed_parts=transformed_parts,
+            components=components,
+            bodies=bodies,
+            named_selections=named_selections,
+        )
+
+    def named_selection(self, named_selection_id: str) -> NamedSelectionEntity:
+        """Named selection holding every ``n_named_selections``-th body of the design."""
+        index = int(named_selection_id.rsplit("-", 1)[-1])
+        body_ids = self.body_ids()[index :: self.n_named_selections]
+        return NamedSelectionEntity(
+            id=_id(named_selection_id),
+            name=f"NamedSelection{index}",
+            bodies=[BodyEntity(id=_id(body_id)) for body_id in body_ids],
+        )
+
+    def body_tessellation(self, body_id: str) -> dict[str, Tessellation]:
+        """Face tessellation of a body, keyed by face id."""
+        index = int(body_id.rsplit("-", 1)[-1])
+        corners = _box_corners(2.0 * index)
+        tessellation = {}
+        for f, quad in enumerate(_CUBE_FACES):
+            vertices = [coord for corner in quad for coord in corners[corner]]
+            tessellation[f"{body_id}/face-{f}"] = Tessellation(
+                vertices=vertices, faces=[3, 0, 1, 2, 3, 0, 2, 3]
+            )
+        return tessellation
+
+    def driving_dimensions(self) -> list[DrivingDimensionEntity]:
+        """Linear driving dimensions of the design, named ``p0``, ``p1`` and so on."""
+        return [
+            DrivingDimensionEntity(
+                id=_id(f"param-{index}"),
+                name=f"p{index}",
+                dimension_type=DimensionType.DIMENSIONTYPE_LINEAR,
+                dimension_value=Quantity(value_in_geometry_units=0.01 * (index + 1)),
+            )
+            for index in range(self.n_parameters)
+        ]
+
+
+class _Communication(communication_pb2_grpc.CommunicationServicer):
+    def Health(self, request, context):  # noqa: N802
+        return communication_pb2.HealthResponse(message="I am healthy!")
+
+
+class _Application(application_pb2_grpc.ApplicationServicer):
+    def GetBackend(self, request, context):  # noqa: N802
+        major, minor, service_pack = FAKE_BACKEND_VERSION
+        return application_pb2.GetBackendResponse(
+            type=BackendType.BACKENDTYPE_LINUX_DMS,
+            version=application_pb2.VersionIdentifier(
+                major_release=major, minor_release=minor, service_pack=service_pack
+            ),
+            backend_version_info="benchmarks fake server",
+        )
+
+
+class _DesignDoc(designdoc_pb2_grpc.DesignDocServicer):
+    def __init__(self, server: "FakeGeometryServer"):
+        self._server = server
+
+    def Get(self, request, context):  # noqa: N802
+        design = self._server.design
+        return designdoc_pb2.GetResponse(
+            design=designdoc_pb2.DesignDocEntity(
+                id=_id(design.design_id),
+                main_part_id=_id(design.main_part_id),
+                name="SyntheticDesign",
+            )
+        )
+
+    def GetAssembly(self, request, context):  # noqa: N802
+        return self._server.design.assembly
+
+    def StreamDesignTessellation(self, request, context):  # noqa: N802
+        design = self._server.design
+        for body_id in (design.body_id(i) for i in design.master_indices()):
+            data = designdoc_pb2.DesignTessellationResponseData(
+                face_tessellation=design.body_tessellation(body_id)
+            )
+            yield designdoc_pb2.DesignTessellationResponse(body_tessellation={body_id: data})
+
+
+class _Body(body_pb2_grpc.BodyServicer):
+    def __init__(self, server: "FakeGeometryServer"):
+        self._server = server
+        self._created = itertools.count()
+
+    def CreateSphereBody(self, request, context):  # noqa: N802
+        # Created bodies only exist in the answer, the synthetic design is left untouched
+        bodies = []
+        for request_data in request.request_data:
+            body_id = f"created-{next(self._created)}"
+            bodies.append(
+                BodyEntity(
+                    id=_id(body_id),
+                    name=request_data.name,
+                    master_id=_id(body_id),
+                    parent_id=request_data.parent_id,
+                )
+            )
+        return body_pb2.CreateSphereBodyResponse(bodies=bodies)
+
+    def GetFaces(self, request, context):  # noqa: N802
+        return GetFacesResponse(
+            response_data=[
+                GetFacesResponseData(
+                    associated_id=body_id,
+                    faces=[
+                        FaceEntity(id=_id(f"{_master_id(body_id.id)}/face-{f}"), surface_type=1)
+                        for f in range(len(_CUBE_FACES))
+                    ],
+                )
+                for body_id in request.ids
+            ]
+        )
+
+    def GetEdges(self, request, context):  # noqa: N802
+        return body_pb2.GetEdgesResponse(
+            response_data=[
+                body_pb2.GetEdgesResponseData(
+                    body_id=body_id,
+                    edges=[
+                        EdgeEntity(id=_id(f"{_master_id(body_id.id)}/edge-{e}"), curve_type=1)
+                        for e in range(len(_CUBE_EDGES))
+                    ],
+                )
+                for body_id in request.ids
+            ]
+        )
+
+    def GetVertices(self, request, context):  # noqa: N802
+        response_data = []
+        for body_id in request.ids:
+            master_id = _master_id(body_id.id)
+            corners = _box_corners(2.0 * int(master_id.rsplit("-", 1)[-1]))
+            response_data.append(
+                body_pb2.GetVerticesResponseData(
+                    id=body_id,
+                    vertices=[
+                        Vertex(id=_id(f"{master_id}/vertex-{v}"), position=_point(*corner))
+                        for v, corner in enumerate(corners)
+                    ],
+                )
+            )
+        return body_pb2.GetVerticesResponse(response_data=response_data)
+
+    def GetBoundingBox(self, request, context):  # noqa: N802
+        return GetBoundingBoxResponse(
+            response_data=[_bounding_box(body_id.id) for body_id in request.ids]
+        )
+
+    def GetCollision(self, request, context):  # noqa: N802
+        # Bodies are axis aligned boxes, which intersect when their boxes overlap
+        response_data = []
+        for request_data in request.request_data:
+            boxes = [
+                _bounding_box(body_id.id).box
+                for body_id in (request_data.body_1_id, request_data.body_2_id)
+            ]
+            overlap = all(
+                getattr(boxes[0].min, axis).value_in_geometry_units
+                <= getattr(boxes[1].max, axis).value_in_geometry_units
+                and getattr(boxes[1].min, axis).value_in_geometry_units
+                <= getattr(boxes[0].max, axis).value_in_geometry_units
+                for axis in "xyz"
+            )
+            response_data.append(
+                body_pb2.GetCollisionResponseData(
+                    body_1_id=request_data.body_1_id,
+                    body_2_id=request_data.body_2_id,
+                    collision=2 if overlap else 0,
+                )
+            )
+        return body_pb2.GetCollisionResponse(response_data=response_data)
+
+    def GetTessellationStream(self, request, context):  # noqa: N802
+        for request_data in request.request_data:
+            body_id = _master_id(request_data.id.id)
+            yield body_pb2.GetTessellationResponse(
+                response_data=[
+                    body_pb2.GetTessellationResponseData(
+                        id=request_data.id,
+                        face_tessellation=self._server.design.body_tessellation(body_id),
+                    )
+                ]
+            )
+
+
+class _Face(face_pb2_grpc.FaceServicer):
+    def GetArea(self, request, context):  # noqa: N802
+        return face_pb2.GetAreaResponse(
+            response_data=[
+                face_pb2.GetAreaResponseData(id=face_id, area=Quantity(value_in_geometry_units=1.0))
+                for face_id in request.ids
+            ]
+        )
+
+    def GetBoundingBox(self, request, context):  # noqa: N802
+        return GetBoundingBoxResponse(
+            response_data=[_bounding_box(face_id.id) for face_id in request.ids]
+        )
+
+    def GetSurface(self, request, context):  # noqa: N802
+        # Faces are planes normal to the axis along which their corners do not vary
+        response_data = []
+        for face_id in request.ids:
+            corners = _corners_of(face_id.id)
+            normal = next(axis for axis in range(3) if len({c[axis] for c in corners}) == 1)
+            axis, reference = [0.0] * 3, [0.0] * 3
+            axis[normal] = 1.0
+            reference[(normal + 1) % 3] = 1.0
+            response_data.append(
+                face_pb2.GetSurfaceResponseData(
+                    id=face_id,
+                    surface=Surface(
+                        origin=_point(*corners[0]),
+                        reference=Direction(x=reference[0], y=reference[1], z=reference[2]),
+                        axis=Direction(x=axis[0], y=axis[1], z=axis[2]),
+                    ),
+                )
+            )
+        return face_pb2.GetSurfaceResponse(response_data=response_data)
+
+    def GetBoxUV(self, request, context):  # noqa: N802
+        unit = Quantity(value_in_geometry_units=1.0)
+        return face_pb2.GetBoxUVResponse(
+            response_data=[
+                face_pb2.GetBoxUVResponseData(
+                    id=face_id, start_u=Quantity(), end_u=unit, start_v=Quantity(), end_v=unit
+                )
+                for face_id in request.ids
+            ]
+        )
+
+
+class _Edge(edge_pb2_grpc.EdgeServicer):
+    def GetLength(self, request, context):  # noqa: N802
+        return edge_pb2.GetLengthResponse(
+            response_data=[
+                edge_pb2.GetLengthResponseData(
+                    id=edge_id, length=Quantity(value_in_geometry_units=1.0)
+                )
+                for edge_id in request.ids
+            ]
+        )
+
+    def GetBoundingBox(self, request, context):  # noqa: N802
+        return GetBoundingBoxResponse(
+            response_data=[_bounding_box(edge_id.id) for edge_id in request.ids]
+        )
+
+
+class _Measure(measure_pb2_grpc.MeasureServicer):
+    def MinDistanceBetweenSelectionObjects(self, request, context):  # noqa: N802
+        # Every entity is axis aligned, so the gap is the distance between the boxes
+        (low_a, high_a), (low_b, high_b) = (
+            (
+                [min(coords) for coords in zip(*corners)],
+                [max(coords) for coords in zip(*corners)],
+            )
+            for corners in (_corners_of(entity_id.id) for entity_id in request.selection)
+        )
+        gap = sum(
+            max(lo_b - hi_a, lo_a - hi_b, 0.0) ** 2
+            for lo_a, hi_a, lo_b, hi_b in zip(low_a, high_a, low_b, high_b)
+        )
+        return measure_pb2.MinDistanceBetweenSelectionObjectsResponse(
+            gap=measure_pb2.Gap(distance=Quantity(value_in_geometry_units=gap**0.5))
+        )
+
+
+class _Edit(edit_pb2_grpc.EditServicer):
+    def Translate(self, request, context):  # noqa: N802
+        return edit_pb2.TranslateResponse()
+
+
+class _DrivingDimension(drivingdimension_pb2_grpc.DrivingDimensionServicer):
+    def __init__(self, server: "FakeGeometryServer"):
+        self._server = server
+
+    def GetAll(self, request, context):  # noqa: N802
+        return drivingdimension_pb2.GetAllResponse(
+            driving_dimensions=self._server.design.driving_dimensions()
+        )
+
+    def Set(self, request, context):  # noqa: N802
+        # Every update succeeds, the synthetic design does not change
+        return drivingdimension_pb2.SetDrivingDimensionResponse(
+            response_data=[
+                drivingdimension_pb2.SetDrivingDimensionResponseData(
+                    id=request_data.id, status=drivingdimension_pb2.UpdateStatus.SUCCESS
+                )
+                for request_data in request.request_data
+            ]
+        )
+
+
+class _NamedSelection(namedselection_pb2_grpc.NamedSelectionServicer):
+    def __init__(self, server: "FakeGeometryServer"):
+        self._server = server
+        self._created = itertools.count()
+        self._named_selections = {}
+
+    def Get(self, request, context):  # noqa: N802
+        named_selection = self._named_selections.get(request.id.id)
+        if named_selection is None:
+            named_selection = self._server.design.named_selection(request.id.id)
+        return namedselection_pb2.GetResponse(named_selection=named_selection)
+
+    def Create(self, request, context):  # noqa: N802
+        # Created named selections only hold bodies, faces and edges of the synthetic design
+        named_selections = []
+        for request_data in request.request_data:
+            members = [member.id for member in request_data.members_ids]
+            named_selection = NamedSelectionEntity(
+                id=_id(f"created-{next(self._created)}"),
+                name=request_data.name,
+                bodies=[
+                    BodyEntity(id=_id(id))
+                    for id in members
+                    if "/face-" not in id and "/edge-" not in id
+                ],
+                faces=[
+                    FaceEntity(
+                        id=_id(id),
+                        surface_type=1,
+                        parent=BodyEntity(id=_id(id.rsplit("/", 1)[0])),
+                    )
+                    for id in members
+                    if "/face-" in id
+                ],
+                edges=[EdgeEntity(id=_id(id)) for id in members if "/edge-" in id],
+            )
+            self._named_selections[named_selection.id.id] = named_selection
+            named_selections.append(named_selection)
+        return namedselection_pb2.CreateResponse(named_selections=named_selections)
+
+    def Delete(self, request, context):  # noqa: N802
+        for named_selection_id in request.ids:
+            self._named_selections.pop(named_selection_id.id, None)
+        return DeleteResponse()
+
+
+class FakeGeometryServer:
+    """In-process gRPC server answering with a synthetic design.
+
+    Parameters
+    ----------
+    design : SyntheticDesign
+        Design served until it is replaced through the :attr:`design` attribute.
+    max_workers : int, default: 4
+        Number of threads used by the gRPC server.
+    """
+
+    def __init__(self, design: SyntheticDesign, max_workers: int = 4):
+        self.design = design
+
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            options=[
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+            ],
+        )
+
+        health_servicer = health.HealthServicer()
+        health_servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self._server)
+        communication_pb2_grpc.add_CommunicationServicer_to_server(_Communication(), self._server)
+        application_pb2_grpc.add_ApplicationServicer_to_server(_Application(), self._server)
+        designdoc_pb2_grpc.add_DesignDocServicer_to_server(_DesignDoc(self), self._server)
+        body_pb2_grpc.add_BodyServicer_to_server(_Body(self), self._server)
+        face_pb2_grpc.add_FaceServicer_to_server(_Face(), self._server)
+        edge_pb2_grpc.add_EdgeServicer_to_server(_Edge(), self._server)
+        edit_pb2_grpc.add_EditServicer_to_server(_Edit(), self._server)
+        measure_pb2_grpc.add_MeasureServicer_to_server(_Measure(), self._server)
+        drivingdimension_pb2_grpc.add_DrivingDimensionServicer_to_server(
+            _DrivingDimension(self), self._server
+        )
+        namedselection_pb2_grpc.add_NamedSelectionServicer_to_server(
+            _NamedSelection(self), self._server
+        )
+
+        self.port = self._server.add_insecure_port("127.0.0.1:0")
+
+    @property
+    def target(self) -> str:
+        """Address the server listens on."""
+        return f"127.0.0.1:{self.port}"
+
+    def start(self) -> "FakeGeometryServer":
+        """Start serving requests."""
+        self._server.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server immediately."""
+        self._server.stop(grace=None)
@@ -0,0 +1,59 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for creating bodies one by one and in bulk."""
+
+import numpy as np
+import pytest
+
+from ansys.geometry.core.math import Point3D
+from ansys.geometry.core.misc import Distance
+
+N_SPHERES = 500
+
+
+@pytest.fixture
+def centers():
+    return np.column_stack([np.arange(N_SPHERES), np.zeros(N_SPHERES), np.zeros(N_SPHERES)])
+
+
+def bench_create_sphere_loop(benchmark, modeler, synthetic_design, centers):
+    def create(design):
+        return [
+            design.create_sphere("sphere", Point3D(center), Distance(0.25)) for center in centers
+        ]
+
+    bodies = benchmark.pedantic(
+        create, setup=lambda: ((modeler.read_existing_design(),), {}), rounds=3
+    )
+
+    assert len(bodies) == N_SPHERES
+
+
+def bench_create_spheres(benchmark, modeler, synthetic_design, centers):
+    def create(design):
+        return design.create_spheres("sphere", centers, 0.25)
+
+    bodies = benchmark.pedantic(
+        create, setup=lambda: ((modeler.read_existing_design(),), {}), rounds=3
+    )
+
+    assert len(bodies) == N_SPHERES
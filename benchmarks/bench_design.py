@@ -0,0 +1,336 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for reading a design and resolving its entities."""
+
+from ansys.geometry.core.designer.body import CollisionType
+from ansys.geometry.core.designer.selection import NamedSelection
+from ansys.geometry.core.math import UnitVector3D
+from ansys.geometry.core.misc.auxiliary import get_bodies_from_ids, get_shapes_from_faces
+from ansys.geometry.core.parameters import ParameterSweep
+
+
+def _count_bodies(component) -> int:
+    return len(component.bodies) + sum(_count_bodies(comp) for comp in component.components)
+
+
+def bench_read_existing_design(benchmark, modeler, synthetic_design):
+    design = benchmark(modeler.read_existing_design)
+
+    assert len(design.components) == synthetic_design.n_components
+    assert _count_bodies(design) == synthetic_design.n_bodies
+
+
+def bench_get_bodies_from_ids(benchmark, design, synthetic_design):
+    body_ids = synthetic_design.body_ids()[:: synthetic_design.n_named_selections]
+
+    bodies = benchmark(get_bodies_from_ids, design, body_ids)
+
+    assert len(bodies) == len(body_ids)
+
+
+def bench_named_selection_bodies(benchmark, design, synthetic_design):
+    def setup():
+        # A fresh selection has nothing resolved yet
+        named_selection = NamedSelection(
+            "NamedSelection0", design, design._grpc_client, preexisting_id="ns-0"
+        )
+        return (named_selection,), {}
+
+    def resolve(named_selection):
+        return named_selection.bodies
+
+    bodies = benchmark.pedantic(resolve, setup=setup, rounds=10)
+
+    assert len(bodies) == len(synthetic_design.body_ids()[:: synthetic_design.n_named_selections])
+
+
+def bench_bodies_get_named_selections(benchmark, design, synthetic_design):
+    bodies = design.get_all_bodies()
+
+    def setup():
+        # Members of the named selections are requested again in every round
+        design._named_selection_index.invalidate()
+        return (), {}
+
+    def lookup():
+        return [body.get_named_selections() for body in bodies]
+
+    named_selections = benchmark.pedantic(lookup, setup=setup, rounds=10)
+
+    assert all(len(found) == 1 for found in named_selections)
+
+
+def bench_create_named_selections(benchmark, design, synthetic_design):
+    faces = [face for body in design.get_all_bodies() for face in body.faces]
+
+    def create():
+        return design.create_named_selections({f"face_{i}": [face] for i, face in enumerate(faces)})
+
+    named_selections = benchmark.pedantic(create, rounds=3)
+
+    assert len(named_selections) == 6 * synthetic_design.n_bodies
+
+
+def bench_create_named_selection_loop(benchmark, design, synthetic_design):
+    # Reference for ``bench_create_named_selections``: one request per named selection
+    faces = [face for body in design.get_all_bodies() for face in body.faces]
+
+    def create():
+        return [
+            design.create_named_selection(f"face_{i}", faces=[face]) for i, face in enumerate(faces)
+        ]
+
+    named_selections = benchmark.pedantic(create, rounds=3)
+
+    assert len(named_selections) == 6 * synthetic_design.n_bodies
+
+
+def bench_update_named_selections(benchmark, design, synthetic_design):
+    bodies = design.get_all_bodies()
+    named_selections = design.create_named_selections(
+        {f"body_{i}": [body] for i, body in enumerate(bodies)}
+    )
+
+    def update():
+        return design.update_named_selections(
+            add={ns: [body.faces[0]] for ns, body in zip(named_selections, bodies)}
+        )
+
+    updated = benchmark.pedantic(update, rounds=3)
+
+    assert len(updated) == synthetic_design.n_bodies
+
+
+def bench_set_parameters(benchmark, design, synthetic_design):
+    parameters = design.parameters
+
+    statuses = benchmark.pedantic(design.set_parameters, args=(parameters,), rounds=3)
+
+    assert len(statuses) == synthetic_design.n_parameters
+
+
+def bench_set_parameter_loop(benchmark, design, synthetic_design):
+    # Reference for ``bench_set_parameters``: one request and one full sync per parameter
+    parameters = design.parameters
+
+    def update():
+        return [design.set_parameter(parameter) for parameter in parameters]
+
+    statuses = benchmark.pedantic(update, rounds=3)
+
+    assert len(statuses) == synthetic_design.n_parameters
+
+
+def bench_parameter_sweep(benchmark, design, synthetic_design):
+    variants = [
+        {f"p{j}": 0.001 * (i + j) for j in range(synthetic_design.n_parameters)} for i in range(20)
+    ]
+
+    def evaluate(design, values):
+        return len(design.get_all_bodies())
+
+    def sweep():
+        return ParameterSweep(design, variants, evaluate=evaluate).run()
+
+    results = benchmark.pedantic(sweep, rounds=3)
+
+    assert all(result.result == synthetic_design.n_bodies for result in results)
+
+
+def bench_parameter_sweep_loop(benchmark, design, synthetic_design):
+    # Reference for ``bench_parameter_sweep``: one request and one full sync per parameter
+    variants = [
+        {f"p{j}": 0.001 * (i + j) for j in range(synthetic_design.n_parameters)} for i in range(20)
+    ]
+
+    def sweep():
+        parameters = {parameter.name: parameter for parameter in design.parameters}
+        results = []
+        for values in variants:
+            for name, value in values.items():
+                parameters[name].dimension_value = value
+                design.set_parameter(parameters[name])
+            results.append(len(design.get_all_bodies()))
+        return results
+
+    results = benchmark.pedantic(sweep, rounds=3)
+
+    assert results == [synthetic_design.n_bodies] * len(variants)
+
+
+def bench_design_raw_tessellation(benchmark, design, synthetic_design):
+    tessellation = benchmark(design.get_raw_tessellation, reset_cache=True)
+
+    assert len(tessellation) == synthetic_design.n_bodies
+
+
+def bench_instanced_tessellation(benchmark, instanced_design, synthetic_design):
+    tessellation = benchmark(instanced_design.get_instanced_tessellation, reset_cache=True)
+
+    assert len(tessellation.meshes) == 1
+    assert len(tessellation.instances) == synthetic_design.n_bodies
+
+
+def bench_export_to_glb(benchmark, instanced_design, synthetic_design, tmp_path):
+    instanced_design.get_instanced_tessellation()
+
+    file_location = benchmark(instanced_design.export_to_glb, tmp_path)
+
+    assert file_location.stat().st_size > 0
+
+
+def bench_translate_bodies(benchmark, design, synthetic_design):
+    bodies = design.get_all_bodies()
+
+    benchmark(design.translate_bodies, bodies, UnitVector3D([1, 0, 0]), 1)
+
+
+def bench_min_distance_matrix(benchmark, modeler, design, synthetic_design):
+    # Bodies are unit cubes one unit apart along X: only neighbours are closer than 1.5
+    bodies = design.get_all_bodies()
+
+    rows, cols, gaps = benchmark.pedantic(
+        modeler.measurement_tools.min_distance_matrix,
+        args=(bodies,),
+        kwargs={"max_distance": 1.5, "as_pairs": True},
+        rounds=3,
+    )
+
+    assert len(gaps) == synthetic_design.n_bodies - 1
+
+
+def bench_min_distance_matrix_dense(benchmark, modeler, design):
+    bodies = design.get_all_bodies()[:40]
+
+    matrix = benchmark.pedantic(
+        modeler.measurement_tools.min_distance_matrix, args=(bodies,), rounds=3
+    )
+
+    assert matrix.shape == (len(bodies), len(bodies))
+
+
+def bench_min_distance_loop(benchmark, modeler, design):
+    # Reference for ``bench_min_distance_matrix_dense``: one blocking request per pair
+    bodies = design.get_all_bodies()[:40]
+    measurement_tools = modeler.measurement_tools
+
+    def measure():
+        return [
+            measurement_tools.min_distance_between_objects(a, b)
+            for i, a in enumerate(bodies)
+            for b in bodies[i + 1 :]
+        ]
+
+    gaps = benchmark.pedantic(measure, rounds=3)
+
+    assert len(gaps) == len(bodies) * (len(bodies) - 1) // 2
+
+
+def bench_get_collisions(benchmark, design):
+    # Bodies are unit cubes one unit apart: no bounding boxes overlap, so no pair is checked
+    bodies = design.get_all_bodies()[:60]
+
+    collisions = benchmark.pedantic(design.get_collisions, args=(bodies,), rounds=3)
+
+    assert collisions == []
+
+
+def bench_get_collision_loop(benchmark, design):
+    # Reference for ``bench_get_collisions``: one request per pair
+    bodies = design.get_all_bodies()[:60]
+
+    def check():
+        return [
+            (a, b, collision)
+            for i, a in enumerate(bodies)
+            for b in bodies[i + 1 :]
+            if (collision := a.get_collision(b)) is not CollisionType.NONE
+        ]
+
+    collisions = benchmark.pedantic(check, rounds=1)
+
+    assert collisions == []
+
+
+def bench_topology_table(benchmark, design, synthetic_design):
+    table = benchmark(design.topology_table)
+
+    assert len(table.faces["id"]) == 6 * synthetic_design.n_bodies
+    assert len(table.edges["id"]) == 12 * synthetic_design.n_bodies
+
+
+def bench_topology_from_objects(benchmark, design, synthetic_design):
+    # Reference for ``bench_topology_table``: one request per entity and property
+    def collect():
+        return [
+            (face.id, body.id, face.surface_type, face.area, face.bounding_box)
+            for body in design.get_all_bodies()
+            for face in body.faces
+        ]
+
+    def setup():
+        # Start from empty face caches, as a fresh session would
+        for body in design.get_all_bodies():
+            body._template._topology.clear()
+        return (), {}
+
+    rows = benchmark.pedantic(collect, setup=setup, rounds=3)
+
+    assert len(rows) == 6 * synthetic_design.n_bodies
+
+
+def bench_face_shapes(benchmark, modeler, design, synthetic_design):
+    # Fresh face objects find their shapes in the client shape cache
+    bodies = design.get_all_bodies()
+    get_shapes_from_faces([face for body in bodies for face in body.faces])
+
+    def setup():
+        for body in bodies:
+            body._template._topology.clear()
+        return (), {}
+
+    shapes = benchmark.pedantic(
+        lambda: get_shapes_from_faces([face for body in bodies for face in body.faces]),
+        setup=setup,
+        rounds=3,
+    )
+
+    assert len(shapes) == 6 * synthetic_design.n_bodies
+
+
+def bench_face_shapes_uncached(benchmark, modeler, design, synthetic_design):
+    # Reference for ``bench_face_shapes``: every shape is requested from the server
+    bodies = design.get_all_bodies()
+
+    def setup():
+        modeler.client.shape_cache.clear()
+        for body in bodies:
+            body._template._topology.clear()
+        return (), {}
+
+    shapes = benchmark.pedantic(
+        lambda: get_shapes_from_faces([face for body in bodies for face in body.faces]),
+        setup=setup,
+        rounds=3,
+    )
+
+    assert len(shapes) == 6 * synthetic_design.n_bodies
@@ -0,0 +1,66 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for the import time of the package.
+
+Every round imports the package in a fresh interpreter, since imports are cached
+by Python for the lifetime of a process.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must not be loaded by a bare "import ansys.geometry.core"
+HEAVY_MODULES = (
+    "grpc",
+    "pint",
+    "ansys.geometry.core.connection",
+    "ansys.geometry.core.modeler",
+)
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import ansys.geometry.core", "from ansys.geometry.core import Modeler"],
+)
+def bench_import_time(benchmark, statement):
+    benchmark.pedantic(_run, args=(statement,), rounds=5)
+
+
+def bench_import_is_lazy(benchmark):
+    loaded = benchmark.pedantic(
+        _run,
+        args=(
+            "import sys; import ansys.geometry.core; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ),
+        rounds=1,
+    )
+
+    assert loaded.strip() == ""
@@ -0,0 +1,95 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for the construction of the math primitives and for bounding boxes."""
+
+import numpy as np
+import pytest
+
+from ansys.geometry.core.math import BoundingBox, BoundingBoxArray, Point3D
+from ansys.geometry.core.misc import UNITS
+
+N_POINTS = 1_000
+N_CELLS = 64
+
+
+@pytest.fixture(scope="module")
+def coordinates():
+    return np.random.default_rng(seed=0).random((N_POINTS, 3))
+
+
+def bench_point3d_from_list(benchmark, coordinates):
+    coords = coordinates.tolist()
+
+    points = benchmark(lambda: [Point3D(xyz) for xyz in coords])
+
+    assert len(points) == N_POINTS
+
+
+def bench_point3d_from_array(benchmark, coordinates):
+    points = benchmark(lambda: [Point3D(xyz) for xyz in coordinates])
+
+    assert len(points) == N_POINTS
+
+
+def bench_point3d_with_units(benchmark, coordinates):
+    coords = coordinates.tolist()
+
+    points = benchmark(lambda: [Point3D(xyz, unit=UNITS.mm) for xyz in coords])
+
+    assert points[0].unit == UNITS.mm
+
+
+@pytest.fixture(scope="module")
+def boxes(coordinates):
+    return BoundingBoxArray.from_corners(coordinates, coordinates + 0.05)
+
+
+@pytest.fixture(scope="module")
+def cells():
+    # Cubic grid of work cells covering the unit cube
+    side = round(N_CELLS ** (1 / 3))
+    low = np.stack(np.meshgrid(*[np.arange(side) / side] * 3, indexing="ij"), axis=-1)
+    low = low.reshape(-1, 3)
+    return BoundingBoxArray.from_corners(low, low + 1 / side)
+
+
+def bench_bounding_box_array_partition(benchmark, boxes, cells):
+    overlaps = benchmark(boxes.overlaps, cells)
+
+    assert overlaps.shape == (N_POINTS, N_CELLS)
+    assert overlaps.any(axis=1).all()
+
+
+def bench_bounding_box_partition_loop(benchmark, boxes, cells):
+    # Reference for ``bench_bounding_box_array_partition``: one pair of boxes at a time
+    box_objects = [boxes[i] for i in range(len(boxes))]
+    cell_objects = [cells[i] for i in range(len(cells))]
+
+    def partition():
+        return [
+            [BoundingBox.intersect_bboxes(box, cell) is not None for cell in cell_objects]
+            for box in box_objects
+        ]
+
+    overlaps = benchmark.pedantic(partition, rounds=1)
+
+    assert len(overlaps) == N_POINTS
@@ -0,0 +1,57 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for the preparation of the datasets that are plotted."""
+
+import pytest
+
+from ansys.geometry.core.misc.checks import run_if_graphics_required
+
+try:
+    run_if_graphics_required()
+except ImportError:
+    pytest.skip("Graphics dependencies are not installed.", allow_module_level=True)
+
+import pyvista as pv  # noqa: E402
+
+
+def bench_design_tessellate(benchmark, modeler, synthetic_design):
+    # Tessellations are cached on the bodies, so every round reads a fresh design
+    def setup():
+        return (modeler.read_existing_design(),), {}
+
+    polydata = benchmark.pedantic(lambda design: design.tessellate(), setup=setup, rounds=1)
+
+    assert polydata.n_cells == 12 * synthetic_design.n_bodies
+
+
+def bench_instanced_design_tessellate(benchmark, instanced_design, synthetic_design):
+    polydata = benchmark(instanced_design.tessellate)
+
+    assert polydata.n_cells == 12 * synthetic_design.n_bodies
+
+
+def bench_body_tessellate_merged(benchmark, design):
+    body = design.components[0].bodies[0]
+
+    polydata = benchmark(body.tessellate, merge=True, reset_cache=True)
+
+    assert isinstance(polydata, pv.PolyData)
@@ -0,0 +1,56 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for building and converting sketches."""
+
+import numpy as np
+import pytest
+
+from ansys.geometry.core.math import Point2D
+from ansys.geometry.core.misc import UNITS
+from ansys.geometry.core.sketch import Sketch
+
+N_POINTS = 1_000
+
+
+@pytest.fixture(scope="module")
+def contour():
+    angles = np.linspace(0, 2 * np.pi, N_POINTS, endpoint=False)
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+def bench_segments_to_point(benchmark, contour):
+    def build():
+        sketch = Sketch()
+        sketch.segment(Point2D(contour[0], UNITS.mm), Point2D(contour[1], UNITS.mm))
+        for point in contour[2:]:
+            sketch.segment_to_point(Point2D(point, UNITS.mm))
+        return sketch.compile("v1")
+
+    geometries = benchmark(build)
+
+    assert len(geometries.lines) == N_POINTS - 1
+
+
+def bench_polyline(benchmark, contour):
+    geometries = benchmark(lambda: Sketch().polyline(contour, unit=UNITS.mm).compile("v1"))
+
+    assert len(geometries.lines) == N_POINTS - 1
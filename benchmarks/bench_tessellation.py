@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks for the conversion of tessellation messages into client side data."""
+
+from ansys.api.discovery.v1.commonmessages_pb2 import Point as GRPCPoint, Quantity as GRPCQuantity
+from ansys.api.discovery.v1.design.designmessages_pb2 import EdgeTessellation, Tessellation
+import numpy as np
+import pytest
+
+from ansys.geometry.core._grpc._services.v1.conversions import (
+    from_grpc_edge_tess_to_raw_data,
+    from_grpc_tess_to_pd,
+    from_grpc_tess_to_raw_data,
+)
+from ansys.geometry.core.misc.checks import run_if_graphics_required
+
+MESH_SIZES = [100, 10_000, 100_000]
+
+
+def _grid_tessellation(n_triangles: int) -> Tessellation:
+    """Triangulated strip with ``n_triangles`` triangles."""
+    n_columns = n_triangles // 2 + 1
+    x = np.repeat(np.arange(n_columns, dtype=float), 2)
+    y = np.tile([0.0, 1.0], n_columns)
+    vertices = np.column_stack((x, y, np.zeros_like(x))).ravel()
+
+    first = np.arange(n_triangles)
+    triangles = np.column_stack((np.full(n_triangles, 3), first, first + 1, first + 2)).ravel()
+    return Tessellation(vertices=vertices.tolist(), faces=triangles.tolist())
+
+
+def _polyline_tessellation(n_points: int) -> EdgeTessellation:
+    return EdgeTessellation(
+        vertices=[
+            GRPCPoint(
+                x=GRPCQuantity(value_in_geometry_units=float(i)),
+                y=GRPCQuantity(value_in_geometry_units=0.0),
+                z=GRPCQuantity(value_in_geometry_units=0.0),
+            )
+            for i in range(n_points)
+        ]
+    )
+
+
+@pytest.mark.parametrize("n_triangles", MESH_SIZES)
+def bench_face_tessellation_to_raw_data(benchmark, n_triangles):
+    tess = _grid_tessellation(n_triangles)
+
+    raw = benchmark(from_grpc_tess_to_raw_data, tess)
+
+    assert len(raw["faces"]) == 4 * n_triangles
+
+
+@pytest.mark.parametrize("n_triangles", MESH_SIZES)
+def bench_face_tessellation_to_polydata(benchmark, n_triangles):
+    try:
+        run_if_graphics_required()
+    except ImportError:
+        pytest.skip("Graphics dependencies are not installed.")
+    tess = _grid_tessellation(n_triangles)
+
+    polydata = benchmark(from_grpc_tess_to_pd, tess)
+
+    assert polydata.n_cells == n_triangles
+
+
+@pytest.mark.parametrize("n_points", MESH_SIZES)
+def bench_edge_tessellation_to_raw_data(benchmark, n_points):
+    tess = _polyline_tessellation(n_points)
+
+    raw = benchmark(from_grpc_edge_tess_to_raw_data, tess)
+
+    assert len(raw["vertices"]) == 3 * n_points
@@ -0,0 +1,102 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Fixtures shared by the benchmarks.
+
+The benchmarks never talk to a real Geometry service: a :class:`FakeGeometryServer`
+is started in-process and serves synthetic designs whose size is controlled with
+the ``--design-sizes`` option, for example ``--design-sizes=10,1000,100000``.
+"""
+
+import grpc
+import pytest
+
+from ansys.geometry.core import Modeler
+
+from ._fake_server import FakeGeometryServer, SyntheticDesign
+
+DEFAULT_DESIGN_SIZES = "10,1000"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--design-sizes",
+        action="store",
+        default=DEFAULT_DESIGN_SIZES,
+        help=(
+            "Comma separated number of bodies of the synthetic designs served by the fake"
+            f" server. By default, '{DEFAULT_DESIGN_SIZES}'."
+        ),
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "n_bodies" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--design-sizes").split(",")]
+        metafunc.parametrize("n_bodies", sizes, scope="session")
+
+
+@pytest.fixture(scope="session")
+def fake_server():
+    server = FakeGeometryServer(SyntheticDesign(n_bodies=0)).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def modeler(fake_server):
+    channel = grpc.insecure_channel(
+        fake_server.target,
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+    modeler = Modeler(channel=channel, proto_version="v1", timeout=10)
+    yield modeler
+    modeler.close(close_design=False)
+
+
+@pytest.fixture(scope="session")
+def synthetic_design(fake_server, n_bodies):
+    """Synthetic design with ``n_bodies`` bodies, served by the fake server."""
+    fake_server.design = SyntheticDesign(n_bodies=n_bodies)
+    # Build the assembly message up front so that it is not part of the measurements
+    _ = fake_server.design.assembly
+    return fake_server.design
+
+
+@pytest.fixture
+def design(modeler, synthetic_design):
+    """Client side design read from the fake server."""
+    return modeler.read_existing_design()
+
+
+@pytest.fixture
+def instanced_design(fake_server, modeler, synthetic_design):
+    """Client side design whose bodies are all instances of a single master body."""
+    fake_server.design = SyntheticDesign(
+        n_bodies=synthetic_design.n_bodies,
+        bodies_per_component=1,
+        instances_per_part=synthetic_design.n_bodies,
+    )
+    yield modeler.read_existing_design()
+    fake_server.design = synthetic_design
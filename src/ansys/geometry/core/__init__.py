@@ -32,23 +32,62 @@ __version__ = importlib_metadata.version(__name__.replace(".", "-"))
 
 # Ease import statements
 # ------------------------------------------------------------------------------
+#
+# The public objects are imported on first access (PEP 562) so that importing
+# the package does not pull in the gRPC client, the tools and their dependencies.
 
+import importlib
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.geometry.core.connection.launcher import (
+        launch_docker_modeler,
+        launch_modeler,
+        launch_modeler_with_core_service,
+        launch_modeler_with_discovery,
+        launch_modeler_with_discovery_and_pimlight,
+        launch_modeler_with_geometry_service,
+        launch_modeler_with_geometry_service_and_pimlight,
+        launch_modeler_with_spaceclaim,
+        launch_modeler_with_spaceclaim_and_pimlight,
+        launch_remote_modeler,
+    )
+    from ansys.geometry.core.logger import LOG
+    from ansys.geometry.core.modeler import Modeler
+
+_LAZY_IMPORTS = {
+    "launch_docker_modeler": "ansys.geometry.core.connection.launcher",
+    "launch_modeler": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_core_service": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_discovery": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_discovery_and_pimlight": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_geometry_service": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_geometry_service_and_pimlight": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_spaceclaim": "ansys.geometry.core.connection.launcher",
+    "launch_modeler_with_spaceclaim_and_pimlight": "ansys.geometry.core.connection.launcher",
+    "launch_remote_modeler": "ansys.geometry.core.connection.launcher",
+    "LOG": "ansys.geometry.core.logger",
+    "Modeler": "ansys.geometry.core.modeler",
+}
+
+
+def __getattr__(name: str):
+    """Import the public objects of the package on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache the object so that later accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the lazily imported ones."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
-from ansys.geometry.core.connection.launcher import (
-    launch_docker_modeler,
-    launch_modeler,
-    launch_modeler_with_core_service,
-    launch_modeler_with_discovery,
-    launch_modeler_with_discovery_and_pimlight,
-    launch_modeler_with_geometry_service,
-    launch_modeler_with_geometry_service_and_pimlight,
-    launch_modeler_with_spaceclaim,
-    launch_modeler_with_spaceclaim_and_pimlight,
-    launch_remote_modeler,
-)
-from ansys.geometry.core.logger import LOG
-from ansys.geometry.core.modeler import Modeler
 
 # Global config constants
 # ------------------------------------------------------------------------------
@@ -45,11 +45,21 @@ class GRPCBodyService(ABC):  # pragma: no cover
         """Create a sphere body."""
         pass
 
+    @abstractmethod
+    def create_sphere_bodies(self, **kwargs) -> dict:
+        """Create several sphere bodies."""
+        pass
+
     @abstractmethod
     def create_extruded_body(self, **kwargs) -> dict:
         """Create an extruded body."""
         pass
 
+    @abstractmethod
+    def create_extruded_bodies(self, **kwargs) -> dict:
+        """Create several extruded bodies."""
+        pass
+
     @abstractmethod
     def create_sweeping_profile_body(self, **kwargs) -> dict:
         """Create a sweeping profile body."""
@@ -130,6 +140,11 @@ class GRPCBodyService(ABC):  # pragma: no cover
         """Get the vertices of a body."""
         pass
 
+    @abstractmethod
+    def get_topology(self, **kwargs) -> dict:
+        """Get the faces, edges and vertices of one or more bodies."""
+        pass
+
     @abstractmethod
     def get_volume(self, **kwargs) -> dict:
         """Get the volume of a body."""
@@ -140,6 +155,11 @@ class GRPCBodyService(ABC):  # pragma: no cover
         """Get the bounding box of a body."""
         pass
 
+    @abstractmethod
+    def get_bounding_boxes(self, **kwargs) -> dict:
+        """Get the bounding boxes of several bodies."""
+        pass
+
     @abstractmethod
     def set_assigned_material(self, **kwargs) -> dict:
         """Set the assigned material of a body."""
@@ -293,3 +313,8 @@ class GRPCBodyService(ABC):  # pragma: no cover
     def create_block_body(self, **kwargs) -> dict:
         """Create a block body."""
         pass
+
+    @abstractmethod
+    def create_block_bodies(self, **kwargs) -> dict:
+        """Create several block bodies."""
+        pass
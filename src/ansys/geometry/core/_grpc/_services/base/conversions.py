@@ -24,6 +24,7 @@
 
 from pint import Quantity
 
+from ansys.geometry.core.errors import GeometryRuntimeError
 from ansys.geometry.core.misc.measurements import DEFAULT_UNITS, Distance, Measurement
 
 
@@ -115,3 +116,32 @@ def to_area(value: float | int) -> Quantity:
     The value should represent an area in the server's unit system.
     """
     return Quantity(value, DEFAULT_UNITS.SERVER_AREA)
+
+
+def check_response_data(response_data: list, ids: list[str], rpc_name: str) -> list:
+    """Check that a batched response holds one entry per requested ID.
+
+    Parameters
+    ----------
+    response_data : list
+        Entries of the batched gRPC response.
+    ids : list[str]
+        IDs of the entities in the request.
+    rpc_name : str
+        Name of the gRPC method, used in the error message.
+
+    Returns
+    -------
+    list
+        The entries of the response, in the order of the requested IDs.
+
+    Raises
+    ------
+    GeometryRuntimeError
+        If the number of entries does not match the number of requested IDs.
+    """
+    if len(response_data) != len(ids):
+        raise GeometryRuntimeError(
+            f"{rpc_name} returned {len(response_data)} entries for {len(ids)} requested IDs."
+        )
+    return response_data
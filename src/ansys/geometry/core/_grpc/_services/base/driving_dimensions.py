@@ -49,3 +49,8 @@ class GRPCDrivingDimensionsService(ABC):  # pragma: no cover
     def set_parameter(self, **kwargs) -> dict:
         """Set driving dimensions."""
         pass
+
+    @abstractmethod
+    def set_parameters(self, **kwargs) -> dict:
+        """Set several driving dimensions at once."""
+        pass
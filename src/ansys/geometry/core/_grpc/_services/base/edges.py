@@ -65,6 +65,16 @@ class GRPCEdgesService(ABC):  # pragma: no cover
         """Get the interval of the edge."""
         pass
 
+    @abstractmethod
+    def get_geometry(self, **kwargs) -> dict:
+        """Get the curve, endpoints, length and interval of one or more edges."""
+        pass
+
+    @abstractmethod
+    def get_properties(self, **kwargs) -> dict:
+        """Get the length and bounding box of one or more edges."""
+        pass
+
     @abstractmethod
     def get_faces(self, **kwargs) -> dict:
         """Get the faces that are connected to the edge."""
@@ -80,6 +90,11 @@ class GRPCEdgesService(ABC):  # pragma: no cover
         """Get the bounding box of the edge."""
         pass
 
+    @abstractmethod
+    def get_bounding_boxes(self, **kwargs) -> dict:
+        """Get the bounding boxes of several edges."""
+        pass
+
     @abstractmethod
     def extrude_edges(self, **kwargs) -> dict:
         """Extrude edges."""
@@ -50,11 +50,21 @@ class GRPCFacesService(ABC):  # pragma: no cover
         """Get the UV box of a face."""
         pass
 
+    @abstractmethod
+    def get_geometry(self, **kwargs) -> dict:
+        """Get the surface and UV box of one or more faces."""
+        pass
+
     @abstractmethod
     def get_area(self, **kwargs) -> dict:
         """Get the area of a face."""
         pass
 
+    @abstractmethod
+    def get_properties(self, **kwargs) -> dict:
+        """Get the area and bounding box of one or more faces."""
+        pass
+
     @abstractmethod
     def get_edges(self, **kwargs) -> dict:
         """Get the edges of a face."""
@@ -80,6 +90,11 @@ class GRPCFacesService(ABC):  # pragma: no cover
         """Get the bounding box of a face."""
         pass
 
+    @abstractmethod
+    def get_bounding_boxes(self, **kwargs) -> dict:
+        """Get the bounding boxes of several faces."""
+        pass
+
     @abstractmethod
     def set_color(self, **kwargs) -> dict:
         """Set the color of a face."""
@@ -44,3 +44,8 @@ class GRPCMeasurementToolsService(ABC):  # pragma: no cover
     def min_distance_between_objects(self, **kwargs) -> dict:
         """Calculate the minimum distance between two objects."""
         pass
+
+    @abstractmethod
+    def min_distances_between_objects(self, **kwargs) -> dict:
+        """Calculate the minimum distance between each pair of objects."""
+        pass
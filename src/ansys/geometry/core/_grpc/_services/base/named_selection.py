@@ -50,11 +50,29 @@ class GRPCNamedSelectionService(ABC):  # pragma: no cover
         """Create a named selection."""
         pass
 
+    @abstractmethod
+    def create_named_selections(self, **kwargs) -> dict:
+        """Create several named selections.
+
+        Each named selection is also added to the optional ``completed`` list once it
+        is created, so that callers can roll back the ones created before a failure.
+        """
+        pass
+
     @abstractmethod
     def delete_named_selection(self, **kwargs) -> dict:
         """Delete a named selection by id."""
         pass
 
+    @abstractmethod
+    def delete_named_selections(self, **kwargs) -> dict:
+        """Delete several named selections by id.
+
+        Each id is also added to the optional ``completed`` list once it is deleted,
+        so that callers know which ones were deleted before a failure.
+        """
+        pass
+
     @abstractmethod
     def rename_named_selection(self, **kwargs) -> dict:
         """Rename a named selection by id."""
@@ -38,7 +38,7 @@ from .conversions import (
     from_grpc_tess_to_raw_data,
     from_plane_to_grpc_plane,
     from_point3d_to_grpc_point,
-    from_sketch_shapes_to_grpc_geometries,
+    from_sketch_to_grpc_geometries,
     from_tess_options_to_grpc_tess_options,
     from_trimmed_curve_to_grpc_trimmed_curve,
     from_trimmed_surface_to_grpc_trimmed_surface,
@@ -91,6 +91,18 @@ class GRPCBodyServiceV0(GRPCBodyService):
             "is_surface": resp.is_surface,
         }
 
+    @protect_grpc
+    def create_sphere_bodies(self, **kwargs) -> dict:  # noqa: D102
+        # The v0 API only creates one sphere body per request
+        return {
+            "bodies": [
+                self.create_sphere_body(
+                    name=name, parent=kwargs["parent"], center=center, radius=radius
+                )
+                for name, center, radius in zip(kwargs["names"], kwargs["centers"], kwargs["radii"])
+            ]
+        }
+
     @protect_grpc
     def create_extruded_body(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.geometry.v0.bodies_pb2 import CreateExtrudedBodyRequest
@@ -101,9 +113,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
             parent=kwargs["parent_id"],
             plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
             distance=from_measurement_to_server_length(kwargs["distance"]) * kwargs["direction"],
-            geometries=from_sketch_shapes_to_grpc_geometries(
-                kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-            ),
+            geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
         )
 
         # HACK: we should inform the user that NURBS curve sketches are not supported
@@ -121,6 +131,25 @@ class GRPCBodyServiceV0(GRPCBodyService):
             "is_surface": resp.is_surface,
         }
 
+    @protect_grpc
+    def create_extruded_bodies(self, **kwargs) -> dict:  # noqa: D102
+        # The v0 API only creates one extruded body per request
+        return {
+            "bodies": [
+                self.create_extruded_body(
+                    name=name,
+                    parent_id=kwargs["parent_id"],
+                    sketch=sketch,
+                    distance=distance,
+                    direction=direction,
+                    backend_version=kwargs["backend_version"],
+                )
+                for name, sketch, distance, direction in zip(
+                    kwargs["names"], kwargs["sketches"], kwargs["distances"], kwargs["directions"]
+                )
+            ]
+        }
+
     @protect_grpc
     def create_sweeping_profile_body(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.geometry.v0.bodies_pb2 import CreateSweepingProfileRequest
@@ -130,9 +159,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
             name=kwargs["name"],
             parent=kwargs["parent_id"],
             plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
-            geometries=from_sketch_shapes_to_grpc_geometries(
-                kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-            ),
+            geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
             path=[from_trimmed_curve_to_grpc_trimmed_curve(tc) for tc in kwargs["path"]],
         )
 
@@ -188,11 +215,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
                     name=sweep_item.name,
                     parent=build_grpc_id(sweep_item.parent_id),
                     plane=from_plane_to_grpc_plane(sweep_item.sketch.plane),
-                    geometries=from_sketch_shapes_to_grpc_geometries(
-                        sweep_item.sketch.plane,
-                        sweep_item.sketch.edges,
-                        sweep_item.sketch.faces,
-                    ),
+                    geometries=from_sketch_to_grpc_geometries(sweep_item.sketch),
                     path=from_trimmed_curve_to_grpc_trimmed_curve(sweep_item.path),
                     guide=from_trimmed_curve_to_grpc_trimmed_curve(sweep_item.guide),
                     tight_tolerance=sweep_item.tight_tolerance,
@@ -279,9 +302,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
             name=kwargs["name"],
             parent=kwargs["parent_id"],
             plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
-            geometries=from_sketch_shapes_to_grpc_geometries(
-                kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-            ),
+            geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
         )
 
         # HACK: we should inform the user that NURBS curve sketches are not supported
@@ -458,6 +479,44 @@ class GRPCBodyServiceV0(GRPCBodyService):
             ]
         }
 
+    @protect_grpc
+    def get_topology(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the bodies one by one
+        bodies = []
+        for id in kwargs["ids"]:
+            request = build_grpc_id(id)
+            bodies.append(
+                {
+                    "id": id,
+                    "faces": [
+                        {
+                            "id": face.id,
+                            "surface_type": face.surface_type,
+                            "is_reversed": face.is_reversed,
+                        }
+                        for face in self.stub.GetFaces(request=request).faces
+                    ],
+                    "edges": [
+                        {
+                            "id": edge.id,
+                            "curve_type": edge.curve_type,
+                            "is_reversed": edge.is_reversed,
+                        }
+                        for edge in self.stub.GetEdges(request=request).edges
+                    ],
+                    "vertices": [
+                        {
+                            "id": vertex.id.id,
+                            "position": (vertex.position.x, vertex.position.y, vertex.position.z),
+                        }
+                        for vertex in self.stub.GetVertices(request=request).vertices
+                    ],
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"bodies": bodies}
+
     @protect_grpc
     def get_volume(self, **kwargs) -> dict:  # noqa: D102
         from .conversions import from_grpc_volume_to_volume
@@ -488,6 +547,23 @@ class GRPCBodyServiceV0(GRPCBodyService):
             "center": from_grpc_point_to_point3d(resp.box.center),
         }
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the bodies one by one
+        boxes = []
+        for id in kwargs["ids"]:
+            box = self.stub.GetBoundingBox(request=build_grpc_id(id)).box
+            boxes.append(
+                {
+                    "id": id,
+                    "min_corner": (box.min.x, box.min.y, box.min.z),
+                    "max_corner": (box.max.x, box.max.y, box.max.z),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"boxes": boxes}
+
     @protect_grpc
     def set_assigned_material(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.geometry.v0.bodies_pb2 import SetAssignedMaterialRequest
@@ -1001,7 +1077,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
         sketch = kwargs["sketch"]
         curves = None
         if sketch:
-            curves = from_sketch_shapes_to_grpc_geometries(sketch.plane, sketch.edges, sketch.faces)
+            curves = from_sketch_to_grpc_geometries(sketch)
 
         trimmed_curves = None
         if kwargs["tc"]:
@@ -1045,9 +1121,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
 
         # Convert sketch and trimmed curves to gRPC format
         sketch = kwargs["sketch"]
-        curves = from_sketch_shapes_to_grpc_geometries(
-            sketch.plane, sketch.edges, sketch.faces, kwargs["only_one_curve"]
-        )
+        curves = from_sketch_to_grpc_geometries(sketch, kwargs["only_one_curve"])
 
         # Create the request - assumes all inputs are valid and of the proper type
         request = ProjectCurvesRequest(
@@ -1079,9 +1153,7 @@ class GRPCBodyServiceV0(GRPCBodyService):
 
         # Convert sketch and trimmed curves to gRPC format
         sketch = kwargs["sketch"]
-        curves = from_sketch_shapes_to_grpc_geometries(
-            sketch.plane, sketch.edges, sketch.faces, kwargs["only_one_curve"]
-        )
+        curves = from_sketch_to_grpc_geometries(sketch, kwargs["only_one_curve"])
 
         # Create the request - assumes all inputs are valid and of the proper type
         request = ProjectCurvesRequest(
@@ -1201,3 +1273,15 @@ class GRPCBodyServiceV0(GRPCBodyService):
             "master_id": resp.master_id,
             "is_surface": resp.is_surface,
         }
+
+    @protect_grpc
+    def create_block_bodies(self, **kwargs) -> dict:  # noqa: D102
+        # The v0 API only creates one block body per request
+        return {
+            "bodies": [
+                self.create_block_body(
+                    name=name, parent_id=kwargs["parent_id"], start=start, end=end
+                )
+                for name, start, end in zip(kwargs["names"], kwargs["starts"], kwargs["ends"])
+            ]
+        }
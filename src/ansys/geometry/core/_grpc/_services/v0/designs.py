@@ -353,19 +353,14 @@ class GRPCDesignsServiceV0(GRPCDesignsService):
             return serialized_cs
 
         def serialize_component_coordinate_systems(component_coordinate_system):
-            serialized_component_coordinate_systems = []
             for (
                 component_coordinate_system_id,
                 coordinate_systems,
             ) in component_coordinate_system.items():
-                serialized_component_coordinate_systems.append(
-                    {
-                        "component_id": component_coordinate_system_id,
-                        "coordinate_systems": serialize_coordinate_systems(coordinate_systems),
-                    }
-                )
-
-            return serialized_component_coordinate_systems
+                yield {
+                    "component_id": component_coordinate_system_id,
+                    "coordinate_systems": serialize_coordinate_systems(coordinate_systems),
+                }
 
         def serialize_component_shared_topologies(component_share_topology):
             serialized_share_topology = []
@@ -477,15 +472,17 @@ class GRPCDesignsServiceV0(GRPCDesignsService):
             "transformed_parts": [serialize_transformed_part(tp) for tp in transformed_parts],
             "bodies": [serialize_body(body) for body in bodies] if len(bodies) > 0 else [],
             "components": [serialize_component(component) for component in components],
-            "materials": [serialize_material(material) for material in materials],
-            "named_selections": [serialize_named_selection(ns) for ns in named_selections],
+            # Sections not needed to build the design tree are serialized on iteration,
+            # which lets the design defer them until they are first accessed
+            "materials": (serialize_material(material) for material in materials),
+            "named_selections": (serialize_named_selection(ns) for ns in named_selections),
             "component_coordinate_systems": serialize_component_coordinate_systems(
                 component_coordinate_systems
             ),
             "component_shared_topologies": serialize_component_shared_topologies(
                 component_shared_topologies
             ),
-            "beams": [serialize_beam(beam) for beam in beams],
+            "beams": (serialize_beam(beam) for beam in beams),
             "design_points": [serialize_design_point(dp) for dp in design_points],
             "datum_planes": [],
             "design_curves": [serialize_design_curve(dc) for dc in design_curves],
@@ -86,3 +86,21 @@ class GRPCDrivingDimensionsServiceV0(GRPCDrivingDimensionsService):
         return {
             "status": from_grpc_update_status_to_parameter_update_status(response.status),
         }
+
+    @protect_grpc
+    def set_parameters(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.dbu.v0.drivingdimensions_pb2 import UpdateRequest
+
+        # The v0 API updates one driving dimension per request
+        statuses = []
+        for driving_dimension in kwargs["driving_dimensions"]:
+            request = UpdateRequest(
+                driving_dimension=from_driving_dimension_to_grpc_driving_dimension(
+                    driving_dimension
+                ),
+            )
+            response = self.stub.UpdateParameter(request)
+            statuses.append(from_grpc_update_status_to_parameter_update_status(response.status))
+
+        # Return the response - formatted as a dictionary
+        return {"statuses": statuses}
@@ -127,6 +127,46 @@ class GRPCEdgesServiceV0(GRPCEdgesService):
             "end": response.end,
         }
 
+    @protect_grpc
+    def get_geometry(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the edges one by one
+        edges = []
+        for id in kwargs["ids"]:
+            points = self.get_start_and_end_points(id=id)
+            interval = self.get_interval(id=id)
+            edges.append(
+                {
+                    "id": id,
+                    "curve": self.get_curve(id=id).get("curve"),
+                    "start": points.get("start"),
+                    "end": points.get("end"),
+                    "length": self.get_length(id=id).get("length"),
+                    "interval": (interval.get("start"), interval.get("end")),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"edges": edges}
+
+    @protect_grpc
+    def get_properties(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the edges one by one
+        edges = []
+        for id in kwargs["ids"]:
+            request = build_grpc_id(id)
+            box = self.stub.GetBoundingBox(request=request)
+            edges.append(
+                {
+                    "id": id,
+                    "length": self.stub.GetLength(request=request).length,
+                    "min_corner": (box.min.x, box.min.y, box.min.z),
+                    "max_corner": (box.max.x, box.max.y, box.max.z),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"edges": edges}
+
     @protect_grpc
     def get_faces(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -168,6 +208,23 @@ class GRPCEdgesServiceV0(GRPCEdgesService):
             ],
         }
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the edges one by one
+        boxes = []
+        for id in kwargs["ids"]:
+            box = self.stub.GetBoundingBox(request=build_grpc_id(id))
+            boxes.append(
+                {
+                    "id": id,
+                    "min_corner": (box.min.x, box.min.y, box.min.z),
+                    "max_corner": (box.max.x, box.max.y, box.max.z),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"boxes": boxes}
+
     @protect_grpc
     def get_bounding_box(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
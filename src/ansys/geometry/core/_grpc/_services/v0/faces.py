@@ -96,6 +96,22 @@ class GRPCFacesServiceV0(GRPCFacesService):
             }
         }
 
+    @protect_grpc
+    def get_geometry(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the faces one by one
+        faces = []
+        for id, surface_type in zip(kwargs["ids"], kwargs["surface_types"]):
+            faces.append(
+                {
+                    "id": id,
+                    "surface": self.get_surface(id=id, surface_type=surface_type).get("surface"),
+                    "uv_box": self.get_box_uv(id=id).get("uv_box"),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"faces": faces}
+
     @protect_grpc
     def get_area(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -107,6 +123,25 @@ class GRPCFacesServiceV0(GRPCFacesService):
         # Return the response - formatted as a dictionary
         return {"area": to_area(response.area)}
 
+    @protect_grpc
+    def get_properties(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the faces one by one
+        faces = []
+        for id in kwargs["ids"]:
+            request = build_grpc_id(id)
+            box = self.stub.GetBoundingBox(request=request)
+            faces.append(
+                {
+                    "id": id,
+                    "area": self.stub.GetArea(request=request).area,
+                    "min_corner": (box.min.x, box.min.y, box.min.z),
+                    "max_corner": (box.max.x, box.max.y, box.max.z),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"faces": faces}
+
     @protect_grpc
     def get_edges(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -181,6 +216,23 @@ class GRPCFacesServiceV0(GRPCFacesService):
         # Return the response - formatted as a dictionary
         return {"color": response.color}
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        # This protofile version has no batched requests: query the faces one by one
+        boxes = []
+        for id in kwargs["ids"]:
+            box = self.stub.GetBoundingBox(request=build_grpc_id(id))
+            boxes.append(
+                {
+                    "id": id,
+                    "min_corner": (box.min.x, box.min.y, box.min.z),
+                    "max_corner": (box.max.x, box.max.y, box.max.z),
+                }
+            )
+
+        # Return the response - formatted as a dictionary
+        return {"boxes": boxes}
+
     @protect_grpc
     def get_bounding_box(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
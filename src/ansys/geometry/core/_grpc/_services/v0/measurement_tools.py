@@ -22,6 +22,8 @@
 
 """Module containing the measurement tools service implementation for v0."""
 
+from collections import deque
+
 import grpc
 
 from ansys.geometry.core.errors import protect_grpc
@@ -30,6 +32,9 @@ from ..base.conversions import to_distance
 from ..base.measurement_tools import GRPCMeasurementToolsService
 from .conversions import build_grpc_id
 
+# Number of requests kept in flight when measuring many pairs of objects
+_MAX_PENDING_REQUESTS = 64
+
 
 class GRPCMeasurementToolsServiceV0(GRPCMeasurementToolsService):
     """Measurement tools service for gRPC communication with the Geometry server.
@@ -72,3 +77,39 @@ class GRPCMeasurementToolsServiceV0(GRPCMeasurementToolsService):
 
         # Return the response - formatted as a dictionary
         return {"distance": to_distance(response.gap.distance)}
+
+    @protect_grpc
+    def min_distances_between_objects(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.geometry.v0.measuretools_pb2 import MinDistanceBetweenObjectsRequest
+
+        # Request and GRPC call are different based on backend_version (25.2 vs. earlier)
+        if kwargs["backend_version"] < (25, 2, 0):
+            call = self.stub.MinDistanceBetweenObjects
+        else:
+            call = self.stub.MinDistanceBetweenSelectionObjects
+
+        # The service measures one pair per request. Keep several requests in flight,
+        # so that the pairs are measured back to back instead of one round trip each.
+        pending = deque()
+        distances = []
+        try:
+            for id1, id2 in kwargs["pairs"]:
+                if kwargs["backend_version"] < (25, 2, 0):
+                    request = MinDistanceBetweenObjectsRequest(bodies=[id1, id2])
+                else:
+                    request = MinDistanceBetweenObjectsRequest(
+                        selection=[build_grpc_id(id1), build_grpc_id(id2)]
+                    )
+                pending.append(call.future(request))
+                if len(pending) == _MAX_PENDING_REQUESTS:
+                    distances.append(pending.popleft().result().gap.distance)
+
+            while pending:
+                distances.append(pending.popleft().result().gap.distance)
+        finally:
+            # Do not leave the remaining requests running if one of them failed
+            for future in pending:
+                future.cancel()
+
+        # Return the response - formatted as a dictionary
+        return {"distances": distances}
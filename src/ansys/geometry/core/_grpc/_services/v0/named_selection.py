@@ -98,6 +98,24 @@ class GRPCNamedSelectionServiceV0(GRPCNamedSelectionService):
             "design_curves": [],
         }
 
+    @protect_grpc
+    def create_named_selections(self, **kwargs):  # noqa: D102
+        from ansys.api.geometry.v0.namedselections_pb2 import CreateRequest
+
+        # The v0 API creates one named selection per request, so a failure may leave
+        # some of them created: they are reported through the "completed" list
+        completed = kwargs.get("completed", [])
+        named_selections = []
+        for selection in kwargs["selections"]:
+            response = self.stub.Create(
+                CreateRequest(name=selection["name"], members=selection["members"])
+            )
+            named_selections.append({"id": response.id, "name": response.name})
+            completed.append(named_selections[-1])
+
+        # Return the response - formatted as a dictionary
+        return {"named_selections": named_selections}
+
     @protect_grpc
     def delete_named_selection(self, **kwargs):  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -109,6 +127,18 @@ class GRPCNamedSelectionServiceV0(GRPCNamedSelectionService):
         # Return the response - empty dictionary
         return {}
 
+    @protect_grpc
+    def delete_named_selections(self, **kwargs):  # noqa: D102
+        # The v0 API deletes one named selection per request, so a failure may leave
+        # some of them deleted: they are reported through the "completed" list
+        completed = kwargs.get("completed", [])
+        for id in kwargs["ids"]:
+            self.stub.Delete(build_grpc_id(id))
+            completed.append(id)
+
+        # Return the response - empty dictionary
+        return {}
+
     @protect_grpc
     def rename_named_selection(self, **kwargs):  # noqa: D102
         from ansys.api.geometry.v0.namedselections_pb2 import SetNameRequest
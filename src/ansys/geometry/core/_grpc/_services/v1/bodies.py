@@ -28,7 +28,7 @@ from ansys.geometry.core.errors import protect_grpc
 from ansys.geometry.core.misc.measurements import Distance
 
 from ..base.bodies import GRPCBodyService
-from ..base.conversions import from_measurement_to_server_length
+from ..base.conversions import check_response_data, from_measurement_to_server_length
 from .conversions import (
     build_grpc_id,
     from_frame_to_grpc_frame,
@@ -40,7 +40,7 @@ from .conversions import (
     from_length_to_grpc_quantity,
     from_plane_to_grpc_plane,
     from_point3d_to_grpc_point,
-    from_sketch_shapes_to_grpc_geometries,
+    from_sketch_to_grpc_geometries,
     from_tess_options_to_grpc_tess_options,
     from_trimmed_curve_to_grpc_trimmed_curve,
     from_unit_vector_to_grpc_direction,
@@ -104,6 +104,43 @@ class GRPCBodyServiceV1(GRPCBodyService):
             "is_surface": body.is_surface,
         }
 
+    @protect_grpc
+    def create_sphere_bodies(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.design.geometry.body_pb2 import (
+            CreateSphereBodyRequest,
+            CreateSphereBodyRequestData,
+        )
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        parent_id = build_grpc_id(kwargs["parent"])
+        request = CreateSphereBodyRequest(
+            request_data=[
+                CreateSphereBodyRequestData(
+                    name=name,
+                    parent_id=parent_id,
+                    center=from_point3d_to_grpc_point(center),
+                    radius=from_length_to_grpc_quantity(radius),
+                )
+                for name, center, radius in zip(kwargs["names"], kwargs["centers"], kwargs["radii"])
+            ]
+        )
+
+        # Call the gRPC service
+        resp = self.stub.CreateSphereBody(request=request)
+
+        # Return the response - formatted as a dictionary
+        return {
+            "bodies": [
+                {
+                    "id": body.id.id,
+                    "name": body.name,
+                    "master_id": body.master_id.id,
+                    "is_surface": body.is_surface,
+                }
+                for body in resp.bodies
+            ]
+        }
+
     @protect_grpc
     def create_extruded_body(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.design.geometry.body_pb2 import (
@@ -123,9 +160,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
                     name=kwargs["name"],
                     parent_id=build_grpc_id(kwargs["parent_id"]),
                     plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
-                    geometries=from_sketch_shapes_to_grpc_geometries(
-                        kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-                    ),
+                    geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
                     distance=from_length_to_grpc_quantity(distance),
                 )
             ]
@@ -143,6 +178,48 @@ class GRPCBodyServiceV1(GRPCBodyService):
             "is_surface": body.is_surface,
         }
 
+    @protect_grpc
+    def create_extruded_bodies(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.design.geometry.body_pb2 import (
+            CreateExtrudedBodyRequest,
+            CreateExtrudedBodyRequestData,
+        )
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        parent_id = build_grpc_id(kwargs["parent_id"])
+        request_data = []
+        for name, sketch, distance, direction in zip(
+            kwargs["names"], kwargs["sketches"], kwargs["distances"], kwargs["directions"]
+        ):
+            # Apply direction (can be 1 or -1) to distance
+            distance = Distance(distance.value * direction, distance.unit)
+            request_data.append(
+                CreateExtrudedBodyRequestData(
+                    name=name,
+                    parent_id=parent_id,
+                    plane=from_plane_to_grpc_plane(sketch.plane),
+                    geometries=from_sketch_to_grpc_geometries(sketch),
+                    distance=from_length_to_grpc_quantity(distance),
+                )
+            )
+        request = CreateExtrudedBodyRequest(request_data=request_data)
+
+        # Call the gRPC service
+        resp = self.stub.CreateExtrudedBody(request=request)
+
+        # Return the response - formatted as a dictionary
+        return {
+            "bodies": [
+                {
+                    "id": body.id.id,
+                    "name": body.name,
+                    "master_id": body.master_id.id,
+                    "is_surface": body.is_surface,
+                }
+                for body in resp.bodies
+            ]
+        }
+
     @protect_grpc
     def create_sweeping_profile_body(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.design.geometry.body_pb2 import (
@@ -157,9 +234,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
                     name=kwargs["name"],
                     parent_id=build_grpc_id(kwargs["parent_id"]),
                     plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
-                    geometries=from_sketch_shapes_to_grpc_geometries(
-                        kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-                    ),
+                    geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
                     path=[from_trimmed_curve_to_grpc_trimmed_curve(tc) for tc in kwargs["path"]],
                 )
             ]
@@ -222,11 +297,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
                     name=sweep_item.name,
                     parent_id=build_grpc_id(sweep_item.parent_id),
                     plane=from_plane_to_grpc_plane(sweep_item.sketch.plane),
-                    geometries=from_sketch_shapes_to_grpc_geometries(
-                        sweep_item.sketch.plane,
-                        sweep_item.sketch.edges,
-                        sweep_item.sketch.faces,
-                    ),
+                    geometries=from_sketch_to_grpc_geometries(sweep_item.sketch),
                     path=from_trimmed_curve_to_grpc_trimmed_curve(sweep_item.path),
                     guide=from_trimmed_curve_to_grpc_trimmed_curve(sweep_item.guide),
                     tight_tolerance=sweep_item.tight_tolerance,
@@ -337,9 +408,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
                     name=kwargs["name"],
                     parent_id=build_grpc_id(kwargs["parent_id"]),
                     plane=from_plane_to_grpc_plane(kwargs["sketch"].plane),
-                    geometries=from_sketch_shapes_to_grpc_geometries(
-                        kwargs["sketch"].plane, kwargs["sketch"].edges, kwargs["sketch"].faces
-                    ),
+                    geometries=from_sketch_to_grpc_geometries(kwargs["sketch"]),
                 )
             ]
         )
@@ -620,6 +689,62 @@ class GRPCBodyServiceV1(GRPCBodyService):
             ]
         }
 
+    @protect_grpc
+    def get_topology(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.commonmessages_pb2 import MultipleEntitiesRequest
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - each call covers all the requested bodies
+        ids = kwargs["ids"]
+        faces = check_response_data(
+            self.stub.GetFaces(request=request).response_data, ids, "GetFaces"
+        )
+        edges = check_response_data(
+            self.stub.GetEdges(request=request).response_data, ids, "GetEdges"
+        )
+        vertices = check_response_data(
+            self.stub.GetVertices(request=request).response_data, ids, "GetVertices"
+        )
+
+        # Return the response - formatted as a dictionary
+        return {
+            "bodies": [
+                {
+                    "id": id,
+                    "faces": [
+                        {
+                            "id": face.id.id,
+                            "surface_type": face.surface_type,
+                            "is_reversed": face.is_reversed,
+                        }
+                        for face in body_faces.faces
+                    ],
+                    "edges": [
+                        {
+                            "id": edge.id.id,
+                            "curve_type": edge.curve_type,
+                            "is_reversed": edge.is_reversed,
+                        }
+                        for edge in body_edges.edges
+                    ],
+                    "vertices": [
+                        {
+                            "id": vertex.id.id,
+                            "position": (
+                                vertex.position.x.value_in_geometry_units,
+                                vertex.position.y.value_in_geometry_units,
+                                vertex.position.z.value_in_geometry_units,
+                            ),
+                        }
+                        for vertex in body_vertices.vertices
+                    ],
+                }
+                for id, body_faces, body_edges, body_vertices in zip(ids, faces, edges, vertices)
+            ]
+        }
+
     @protect_grpc
     def get_volume(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.commonmessages_pb2 import MultipleEntitiesRequest
@@ -669,6 +794,40 @@ class GRPCBodyServiceV1(GRPCBodyService):
             "center": from_grpc_point_to_point3d(resp.box.center),
         }
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.commonmessages_pb2 import MultipleEntitiesRequest
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - a single call covers all the requested bodies
+        ids = kwargs["ids"]
+        boxes = check_response_data(
+            self.stub.GetBoundingBox(request).response_data, ids, "GetBoundingBox"
+        )
+
+        # Return the response - formatted as a dictionary. Values are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {
+            "boxes": [
+                {
+                    "id": id,
+                    "min_corner": (
+                        data.box.min.x.value_in_geometry_units,
+                        data.box.min.y.value_in_geometry_units,
+                        data.box.min.z.value_in_geometry_units,
+                    ),
+                    "max_corner": (
+                        data.box.max.x.value_in_geometry_units,
+                        data.box.max.y.value_in_geometry_units,
+                        data.box.max.z.value_in_geometry_units,
+                    ),
+                }
+                for id, data in zip(ids, boxes)
+            ]
+        }
+
     @protect_grpc
     def set_assigned_material(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.design.geometry.body_pb2 import (
@@ -1257,11 +1416,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
 
         # Convert sketch and trimmed curves to gRPC format
         sketch = kwargs["sketch"]
-        curves = (
-            from_sketch_shapes_to_grpc_geometries(sketch.plane, sketch.edges, sketch.faces)
-            if sketch
-            else None
-        )
+        curves = from_sketch_to_grpc_geometries(sketch) if sketch else None
 
         # Convert trimmed curves to gRPC format
         trimmed_curves = []
@@ -1313,7 +1468,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
 
         # Convert sketch to geometries
         sketch = kwargs["sketch"]
-        curves = from_sketch_shapes_to_grpc_geometries(sketch.plane, sketch.edges, sketch.faces)
+        curves = from_sketch_to_grpc_geometries(sketch)
 
         # Create the request using ProjectCurvesRequestData
         request = ProjectCurvesRequest(
@@ -1352,7 +1507,7 @@ class GRPCBodyServiceV1(GRPCBodyService):
 
         # Convert sketch to geometries
         sketch = kwargs["sketch"]
-        curves = from_sketch_shapes_to_grpc_geometries(sketch.plane, sketch.edges, sketch.faces)
+        curves = from_sketch_to_grpc_geometries(sketch)
 
         # Create the request using ImprintProjectedCurvesRequestData
         request = ImprintProjectedCurvesRequest(
@@ -1492,3 +1647,15 @@ class GRPCBodyServiceV1(GRPCBodyService):
             "master_id": resp.master_id.id,
             "is_surface": resp.is_surface,
         }
+
+    @protect_grpc
+    def create_block_bodies(self, **kwargs) -> dict:  # noqa: D102
+        # The CreateBlockBody request only holds a single block
+        return {
+            "bodies": [
+                self.create_block_body(
+                    name=name, parent_id=kwargs["parent_id"], start=start, end=end
+                )
+                for name, start, end in zip(kwargs["names"], kwargs["starts"], kwargs["ends"])
+            ]
+        }
@@ -144,6 +144,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.sketch.nurbs import SketchNurbs
     from ansys.geometry.core.sketch.polygon import Polygon
     from ansys.geometry.core.sketch.segment import SketchSegment
+    from ansys.geometry.core.sketch.segment_array import SketchSegmentArray
+    from ansys.geometry.core.sketch.sketch import Sketch
     from ansys.geometry.core.tools.prepare_tools import EnclosureOptions
 
 
@@ -722,6 +724,37 @@ def from_sketch_shapes_to_grpc_geometries(
         return geometries
 
 
+def from_sketch_to_grpc_geometries(
+    sketch: "Sketch", only_one_curve: bool = False
+) -> GRPCGeometries:
+    """Convert a ``Sketch`` to a gRPC message, reusing it while the sketch is unchanged.
+
+    Parameters
+    ----------
+    sketch : Sketch
+        Sketch to convert.
+    only_one_curve : bool, default: False
+        Whether to project only one curve of the entire sketch. When ``True``,
+        only one curve is projected.
+
+    Returns
+    -------
+    GRPCGeometries
+        Geometry service gRPC geometries message.
+
+    Notes
+    -----
+    The message is cached in the sketch and returned again as long as its plane,
+    edges and faces are the same objects. It must not be modified by the caller.
+    """
+    return sketch._get_compiled(
+        (__name__, only_one_curve),
+        lambda: from_sketch_shapes_to_grpc_geometries(
+            sketch.plane, sketch.edges, sketch.faces, only_one_curve
+        ),
+    )
+
+
 def from_sketch_edges_to_grpc_geometries(
     edges: list["SketchEdge"],
     plane: "Plane",
@@ -743,6 +776,7 @@ def from_sketch_edges_to_grpc_geometries(
     from ansys.geometry.core.sketch.arc import Arc
     from ansys.geometry.core.sketch.nurbs import SketchNurbs
     from ansys.geometry.core.sketch.segment import SketchSegment
+    from ansys.geometry.core.sketch.segment_array import SketchSegmentArray
 
     arcs = []
     segments = []
@@ -750,6 +784,8 @@ def from_sketch_edges_to_grpc_geometries(
     for edge in edges:
         if isinstance(edge, SketchSegment):
             segments.append(from_sketch_segment_to_grpc_line(edge, plane))
+        elif isinstance(edge, SketchSegmentArray):
+            segments.extend(from_sketch_segment_array_to_grpc_lines(edge, plane))
         elif isinstance(edge, Arc):
             arcs.append(from_sketch_arc_to_grpc_arc(edge, plane))
         elif isinstance(edge, SketchNurbs):
@@ -919,6 +955,40 @@ def from_sketch_segment_to_grpc_line(segment: "SketchSegment", plane: "Plane") -
     )
 
 
+def from_sketch_segment_array_to_grpc_lines(
+    segments: "SketchSegmentArray", plane: "Plane"
+) -> list[GRPCLine]:
+    """Convert a v1 ``SketchSegmentArray`` class to a list of line gRPC messages.
+
+    Parameters
+    ----------
+    segments : SketchSegmentArray
+        Source segments data.
+    plane : Plane
+        Plane for positioning the segments.
+
+    Returns
+    -------
+    list[GRPCLine]
+        Geometry service gRPC line messages. The unit is meters.
+    """
+    # Transform all the coordinates at once, without intermediate point objects
+    starts, ends = segments.global_coordinates(plane, DEFAULT_UNITS.SERVER_LENGTH)
+    grpc_points = [
+        GRPCPoint(
+            x=GRPCQuantity(value_in_geometry_units=x),
+            y=GRPCQuantity(value_in_geometry_units=y),
+            z=GRPCQuantity(value_in_geometry_units=z),
+        )
+        for x, y, z in starts.tolist() + ends.tolist()
+    ]
+    n_segments = len(starts)
+    return [
+        GRPCLine(start=start, end=end)
+        for start, end in zip(grpc_points[:n_segments], grpc_points[n_segments:])
+    ]
+
+
 def from_trimmed_curve_to_grpc_trimmed_curve(curve: "TrimmedCurve") -> GRPCTrimmedCurve:
     """Convert a v1 ``TrimmedCurve`` to a trimmed curve gRPC message.
 
@@ -2156,7 +2226,7 @@ def serialize_tracked_changes(tracked_changes: GRPCTrackedChanges) -> dict:
     ]
     deleted_parts = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "deleted_parts", [])
+        for entity in getattr(tracked_changes, "deleted_part_ids", [])
     ]
 
     # Extract and serialize components
@@ -2187,27 +2257,27 @@ def serialize_tracked_changes(tracked_changes: GRPCTrackedChanges) -> dict:
 
     created_faces = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "created_faces", [])
+        for entity in getattr(tracked_changes, "created_face_ids", [])
     ]
     modified_faces = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "modified_faces", [])
+        for entity in getattr(tracked_changes, "modified_face_ids", [])
     ]
     deleted_faces = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "deleted_faces", [])
+        for entity in getattr(tracked_changes, "deleted_face_ids", [])
     ]
     created_edges = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "created_edges", [])
+        for entity in getattr(tracked_changes, "created_edge_ids", [])
     ]
     modified_edges = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "modified_edges", [])
+        for entity in getattr(tracked_changes, "modified_edge_ids", [])
     ]
     deleted_edges = [
         serialize_entity_identifier(entity)
-        for entity in getattr(tracked_changes, "deleted_edges", [])
+        for entity in getattr(tracked_changes, "deleted_edge_ids", [])
     ]
 
     return {
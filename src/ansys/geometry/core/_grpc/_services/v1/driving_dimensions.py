@@ -98,3 +98,28 @@ class GRPCDrivingDimensionsServiceV1(GRPCDrivingDimensionsService):
                 response.response_data[0].status
             ),
         }
+
+    @protect_grpc
+    def set_parameters(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.design.parameters.drivingdimension_pb2 import (
+            SetDrivingDimensionRequest,
+        )
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = SetDrivingDimensionRequest(
+            request_data=[
+                from_driving_dimension_to_grpc_driving_dimension(driving_dimension)
+                for driving_dimension in kwargs["driving_dimensions"]
+            ]
+        )
+
+        # Call the gRPC service
+        response = self.stub.Set(request)
+
+        # Return the response - formatted as a dictionary
+        return {
+            "statuses": [
+                from_grpc_update_status_to_parameter_update_status(response_data.status)
+                for response_data in response.response_data
+            ],
+        }
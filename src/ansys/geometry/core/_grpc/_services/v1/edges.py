@@ -27,7 +27,7 @@ import grpc
 
 from ansys.geometry.core.errors import protect_grpc
 
-from ..base.conversions import to_distance
+from ..base.conversions import check_response_data, to_distance
 from ..base.edges import GRPCEdgesService
 from .conversions import (
     build_grpc_id,
@@ -134,6 +134,81 @@ class GRPCEdgesServiceV1(GRPCEdgesService):
             "end": response.end,
         }
 
+    @protect_grpc
+    def get_geometry(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - each call covers all the requested edges
+        ids = kwargs["ids"]
+        curves = check_response_data(
+            self.stub.GetCurve(request=request).response_data, ids, "GetCurve"
+        )
+        points = check_response_data(
+            self.stub.GetStartAndEndPoints(request=request).response_data,
+            ids,
+            "GetStartAndEndPoints",
+        )
+        lengths = check_response_data(
+            self.stub.GetLength(request=request).response_data, ids, "GetLength"
+        )
+        intervals = check_response_data(
+            self.stub.GetInterval(request=request).response_data, ids, "GetInterval"
+        )
+
+        # Return the response - formatted as a dictionary
+        return {
+            "edges": [
+                {
+                    "id": id,
+                    "curve": from_grpc_curve_to_curve(curve.curve),
+                    "start": from_grpc_point_to_point3d(point.start),
+                    "end": from_grpc_point_to_point3d(point.end),
+                    "length": to_distance(length.length.value_in_geometry_units),
+                    "interval": (interval.start, interval.end),
+                }
+                for id, curve, point, length, interval in zip(
+                    ids, curves, points, lengths, intervals
+                )
+            ]
+        }
+
+    @protect_grpc
+    def get_properties(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - each call covers all the requested edges
+        ids = kwargs["ids"]
+        lengths = check_response_data(
+            self.stub.GetLength(request=request).response_data, ids, "GetLength"
+        )
+        boxes = check_response_data(
+            self.stub.GetBoundingBox(request=request).response_data, ids, "GetBoundingBox"
+        )
+
+        # Return the response - formatted as a dictionary. Values are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {
+            "edges": [
+                {
+                    "id": id,
+                    "length": length.length.value_in_geometry_units,
+                    "min_corner": (
+                        box.box.min.x.value_in_geometry_units,
+                        box.box.min.y.value_in_geometry_units,
+                        box.box.min.z.value_in_geometry_units,
+                    ),
+                    "max_corner": (
+                        box.box.max.x.value_in_geometry_units,
+                        box.box.max.y.value_in_geometry_units,
+                        box.box.max.z.value_in_geometry_units,
+                    ),
+                }
+                for id, length, box in zip(ids, lengths, boxes)
+            ]
+        }
+
     @protect_grpc
     def get_faces(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -173,6 +248,38 @@ class GRPCEdgesServiceV1(GRPCEdgesService):
             ],
         }
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - a single call covers all the requested edges
+        ids = kwargs["ids"]
+        boxes = check_response_data(
+            self.stub.GetBoundingBox(request=request).response_data, ids, "GetBoundingBox"
+        )
+
+        # Return the response - formatted as a dictionary. Values are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {
+            "boxes": [
+                {
+                    "id": id,
+                    "min_corner": (
+                        box.box.min.x.value_in_geometry_units,
+                        box.box.min.y.value_in_geometry_units,
+                        box.box.min.z.value_in_geometry_units,
+                    ),
+                    "max_corner": (
+                        box.box.max.x.value_in_geometry_units,
+                        box.box.max.y.value_in_geometry_units,
+                        box.box.max.z.value_in_geometry_units,
+                    ),
+                }
+                for id, box in zip(ids, boxes)
+            ]
+        }
+
     @protect_grpc
     def get_bounding_box(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.design.designmessages_pb2 import (
@@ -295,10 +402,12 @@ class GRPCEdgesServiceV1(GRPCEdgesService):
 
         # Call the gRPC service
         response = self.edit_stub.MoveImprintEdges(request)
+        tracked_response = serialize_tracked_command_response(response.tracked_command_response)
 
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_command_response.command_response.success,
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
@@ -320,10 +429,12 @@ class GRPCEdgesServiceV1(GRPCEdgesService):
 
         # Call the gRPC service
         response = self.edit_stub.OffsetEdges(request)
+        tracked_response = serialize_tracked_command_response(response.tracked_command_response)
 
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_command_response.command_response.success,
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
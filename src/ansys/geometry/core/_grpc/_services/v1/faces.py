@@ -28,6 +28,7 @@ import grpc
 from ansys.geometry.core.errors import protect_grpc
 
 from ..base.conversions import (
+    check_response_data,
     to_area,
 )
 from ..base.faces import GRPCFacesService
@@ -104,6 +105,43 @@ class GRPCFacesServiceV1(GRPCFacesService):
             }
         }
 
+    @protect_grpc
+    def get_geometry(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - each call covers all the requested faces
+        ids = kwargs["ids"]
+        surfaces = check_response_data(
+            self.stub.GetSurface(request=request).response_data, ids, "GetSurface"
+        )
+        boxes = check_response_data(
+            self.stub.GetBoxUV(request=request).response_data, ids, "GetBoxUV"
+        )
+
+        # Return the response - formatted as a dictionary
+        return {
+            "faces": [
+                {
+                    "id": id,
+                    "surface": from_grpc_surface_to_surface(surface.surface, surface_type),
+                    "uv_box": {
+                        "u": (
+                            box.start_u.value_in_geometry_units,
+                            box.end_u.value_in_geometry_units,
+                        ),
+                        "v": (
+                            box.start_v.value_in_geometry_units,
+                            box.end_v.value_in_geometry_units,
+                        ),
+                    },
+                }
+                for id, surface_type, surface, box in zip(
+                    ids, kwargs["surface_types"], surfaces, boxes
+                )
+            ]
+        }
+
     @protect_grpc
     def get_area(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -115,6 +153,42 @@ class GRPCFacesServiceV1(GRPCFacesService):
         # Return the response - formatted as a dictionary
         return {"area": to_area(response.area.value_in_geometry_units)}
 
+    @protect_grpc
+    def get_properties(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - each call covers all the requested faces
+        ids = kwargs["ids"]
+        areas = check_response_data(
+            self.stub.GetArea(request=request).response_data, ids, "GetArea"
+        )
+        boxes = check_response_data(
+            self.stub.GetBoundingBox(request=request).response_data, ids, "GetBoundingBox"
+        )
+
+        # Return the response - formatted as a dictionary. Values are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {
+            "faces": [
+                {
+                    "id": id,
+                    "area": area.area.value_in_geometry_units,
+                    "min_corner": (
+                        box.box.min.x.value_in_geometry_units,
+                        box.box.min.y.value_in_geometry_units,
+                        box.box.min.z.value_in_geometry_units,
+                    ),
+                    "max_corner": (
+                        box.box.max.x.value_in_geometry_units,
+                        box.box.max.y.value_in_geometry_units,
+                        box.box.max.z.value_in_geometry_units,
+                    ),
+                }
+                for id, area, box in zip(ids, areas, boxes)
+            ]
+        }
+
     @protect_grpc
     def get_edges(self, **kwargs) -> dict:  # noqa: D102
         # Create the request - assumes all inputs are valid and of the proper type
@@ -190,6 +264,38 @@ class GRPCFacesServiceV1(GRPCFacesService):
         color = response.colors.get(kwargs["id"], "")
         return {"color": color}
 
+    @protect_grpc
+    def get_bounding_boxes(self, **kwargs) -> dict:  # noqa: D102
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - a single call covers all the requested faces
+        ids = kwargs["ids"]
+        boxes = check_response_data(
+            self.stub.GetBoundingBox(request=request).response_data, ids, "GetBoundingBox"
+        )
+
+        # Return the response - formatted as a dictionary. Values are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {
+            "boxes": [
+                {
+                    "id": id,
+                    "min_corner": (
+                        box.box.min.x.value_in_geometry_units,
+                        box.box.min.y.value_in_geometry_units,
+                        box.box.min.z.value_in_geometry_units,
+                    ),
+                    "max_corner": (
+                        box.box.max.x.value_in_geometry_units,
+                        box.box.max.y.value_in_geometry_units,
+                        box.box.max.z.value_in_geometry_units,
+                    ),
+                }
+                for id, box in zip(ids, boxes)
+            ]
+        }
+
     @protect_grpc
     def get_bounding_box(self, **kwargs) -> dict:  # noqa: D102
         from ansys.api.discovery.v1.design.designmessages_pb2 import (
@@ -663,7 +769,7 @@ class GRPCFacesServiceV1(GRPCFacesService):
 
         # Return the response - formatted as a dictionary
         return {
-            "results": [face.get("id").id for face in tracked_response.get("created_faces")],
+            "results": [face.get("id") for face in tracked_response.get("created_faces")],
             "tracked_response": tracked_response,
         }
 
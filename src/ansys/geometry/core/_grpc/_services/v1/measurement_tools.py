@@ -22,6 +22,8 @@
 
 """Module containing the measurement tools service implementation for v0."""
 
+from collections import deque
+
 import grpc
 
 from ansys.geometry.core.errors import protect_grpc
@@ -30,6 +32,9 @@ from ..base.conversions import to_distance
 from ..base.measurement_tools import GRPCMeasurementToolsService
 from .conversions import build_grpc_id
 
+# Number of requests kept in flight when measuring many pairs of objects
+_MAX_PENDING_REQUESTS = 64
+
 
 class GRPCMeasurementToolsServiceV1(GRPCMeasurementToolsService):
     """Measurement tools service for gRPC communication with the Geometry server.
@@ -64,3 +69,33 @@ class GRPCMeasurementToolsServiceV1(GRPCMeasurementToolsService):
 
         # Return the response - formatted as a dictionary
         return {"distance": to_distance(response.gap.distance.value_in_geometry_units)}
+
+    @protect_grpc
+    def min_distances_between_objects(self, **kwargs) -> dict:  # noqa: D102
+        from ansys.api.discovery.v1.operations.measure_pb2 import MinDistanceBetweenObjectsRequest
+
+        # The service measures one pair per request. Keep several requests in flight,
+        # so that the pairs are measured back to back instead of one round trip each.
+        pending = deque()
+        distances = []
+        try:
+            for id1, id2 in kwargs["pairs"]:
+                request = MinDistanceBetweenObjectsRequest(
+                    selection=[build_grpc_id(id1), build_grpc_id(id2)]
+                )
+                pending.append(self.stub.MinDistanceBetweenSelectionObjects.future(request))
+                if len(pending) == _MAX_PENDING_REQUESTS:
+                    response = pending.popleft().result()
+                    distances.append(response.gap.distance.value_in_geometry_units)
+
+            while pending:
+                response = pending.popleft().result()
+                distances.append(response.gap.distance.value_in_geometry_units)
+        finally:
+            # Do not leave the remaining requests running if one of them failed
+            for future in pending:
+                future.cancel()
+
+        # Return the response - formatted as a dictionary. Distances are kept as plain
+        # floats in server units so that large batches avoid per-item conversions
+        return {"distances": distances}
@@ -69,12 +69,14 @@ class GRPCModelToolsServiceV1(GRPCModelToolsService):
             ]
         )
 
-        # Call the gRPC service
-        response = self.stub.Chamfer(request).response_data[0]
+        # Call the gRPC service and serialize the response
+        response = self.stub.Chamfer(request)
+        tracked_response = serialize_tracked_command_response(response.tracked_command_response)
 
         # Return the response as a dictionary
         return {
-            "success": response.success,
+            "success": response.response_data[0].success,
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
@@ -98,6 +100,7 @@ class GRPCModelToolsServiceV1(GRPCModelToolsService):
         # Return the response as a dictionary
         return {
             "success": tracked_response.get("success"),
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
@@ -116,6 +119,7 @@ class GRPCModelToolsServiceV1(GRPCModelToolsService):
         # Return the response as a dictionary
         return {
             "success": tracked_response.get("success"),
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
@@ -148,6 +152,7 @@ class GRPCModelToolsServiceV1(GRPCModelToolsService):
             "modified_bodies": [body.get("id") for body in tracked_response.get("modified_bodies")],
             "modified_faces": [face.get("id") for face in tracked_response.get("modified_faces")],
             "modified_edges": [edge.get("id") for edge in tracked_response.get("modified_edges")],
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
@@ -176,6 +181,7 @@ class GRPCModelToolsServiceV1(GRPCModelToolsService):
         # Return the response as a dictionary
         return {
             "success": tracked_response.get("success"),
+            "tracked_response": tracked_response,
         }
 
     @protect_grpc
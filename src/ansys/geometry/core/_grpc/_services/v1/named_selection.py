@@ -124,6 +124,35 @@ class GRPCNamedSelectionServiceV1(GRPCNamedSelectionService):
             "datum_points": [dp.id.id for dp in response.datum_points],
         }
 
+    @protect_grpc
+    def create_named_selections(self, **kwargs):  # noqa: D102
+        from ansys.api.discovery.v1.design.selections.namedselection_pb2 import (
+            CreateRequest,
+            CreateRequestData,
+        )
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = CreateRequest(
+            request_data=[
+                CreateRequestData(
+                    name=selection["name"],
+                    members_ids=[build_grpc_id(id) for id in selection["members"]],
+                )
+                for selection in kwargs["selections"]
+            ]
+        )
+
+        # Call the gRPC service
+        response = self.stub.Create(request)
+
+        # Return the response - formatted as a dictionary
+        named_selections = [
+            {"id": named_selection.id.id, "name": named_selection.name}
+            for named_selection in response.named_selections
+        ]
+        kwargs.get("completed", []).extend(named_selections)
+        return {"named_selections": named_selections}
+
     @protect_grpc
     def delete_named_selection(self, **kwargs):  # noqa: D102
         from ansys.api.discovery.v1.commonmessages_pb2 import MultipleEntitiesRequest
@@ -137,6 +166,20 @@ class GRPCNamedSelectionServiceV1(GRPCNamedSelectionService):
         # Return the response - empty dictionary
         return {}
 
+    @protect_grpc
+    def delete_named_selections(self, **kwargs):  # noqa: D102
+        from ansys.api.discovery.v1.commonmessages_pb2 import MultipleEntitiesRequest
+
+        # Create the request - assumes all inputs are valid and of the proper type
+        request = MultipleEntitiesRequest(ids=[build_grpc_id(id) for id in kwargs["ids"]])
+
+        # Call the gRPC service - a single request deletes all the named selections
+        self.stub.Delete(request)
+        kwargs.get("completed", []).extend(kwargs["ids"])
+
+        # Return the response - empty dictionary
+        return {}
+
     @protect_grpc
     def rename_named_selection(self, **kwargs):  # noqa: D102
         from ansys.api.discovery.v1.design.designmessages_pb2 import (
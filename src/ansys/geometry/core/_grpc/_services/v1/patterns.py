@@ -31,6 +31,7 @@ from .conversions import (
     build_grpc_id,
     from_angle_to_grpc_quantity,
     from_length_to_grpc_quantity,
+    serialize_tracked_changes,
 )
 
 
@@ -81,6 +82,9 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_creation_response.creation_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_creation_response.tracked_changes
+            ),
         }
 
     @protect_grpc
@@ -111,6 +115,9 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_set_response.set_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_set_response.tracked_changes
+            ),
         }
 
     @protect_grpc
@@ -161,6 +168,9 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_creation_response.creation_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_creation_response.tracked_changes
+            ),
         }
 
     @protect_grpc
@@ -189,6 +199,9 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_set_response.set_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_set_response.tracked_changes
+            ),
         }
 
     @protect_grpc
@@ -222,6 +235,9 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_creation_response.creation_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_creation_response.tracked_changes
+            ),
         }
 
     @protect_grpc
@@ -239,4 +255,7 @@ class GRPCPatternsServiceV1(GRPCPatternsService):
         # Return the response - formatted as a dictionary
         return {
             "success": response.tracked_command_response.command_response.success,
+            "tracked_response": serialize_tracked_changes(
+                response.tracked_command_response.tracked_changes
+            ),
         }
@@ -40,6 +40,7 @@ from ansys.geometry.core.connection.docker_instance import LocalDockerInstance
 from ansys.geometry.core.connection.product_instance import ProductInstance
 from ansys.geometry.core.errors import GeometryExitedError, GeometryRuntimeError
 from ansys.geometry.core.logger import LOG, PyGeometryCustomAdapter
+from ansys.geometry.core.misc.cache import LRUCache
 from ansys.geometry.core.misc.checks import check_input_types
 from ansys.geometry.core.typing import Real
 
@@ -325,6 +326,9 @@ class GrpcClient:
         # Initialize the gRPC services
         self._services = _GRPCServices(self._channel, version=proto_version)
 
+        # Shapes of faces and edges, shared by all the objects of the client
+        self._shape_cache = LRUCache(pygeom_defaults.SHAPE_CACHE_SIZE)
+
         # Once connection with the client is established, create a logger
         self._log = LOG.add_instance_logger(
             name=self._target, client_instance=self, level=logging_level
@@ -392,6 +396,18 @@ class GrpcClient:
         """GRPC services."""
         return self._services
 
+    @property
+    def shape_cache(self) -> LRUCache:
+        """Cache of the shapes of the faces and edges retrieved through this client.
+
+        Shapes are keyed by their design, by the ID of their face or edge and by the
+        revisions of the design and of their body, so modifying the geometry makes the
+        cached shapes unreachable.
+        Set the ``max_size`` attribute of the cache to bound its memory use, or to
+        ``0`` to disable it.
+        """
+        return self._shape_cache
+
     @property
     def log(self) -> PyGeometryCustomAdapter:
         """Specific instance logger."""
@@ -47,6 +47,14 @@ By default, PyAnsys Geometry searches for the environment variable
 it uses ``256Mb`` as the maximum message length.
 """
 
+SHAPE_CACHE_SIZE = int(os.environ.get("PYGEOMETRY_SHAPE_CACHE_SIZE", 10_000))
+"""Default for the maximum number of face and edge shapes cached by a client.
+
+By default, PyAnsys Geometry searches for the environment variable
+``PYGEOMETRY_SHAPE_CACHE_SIZE``, and if this variable does not exist,
+it caches up to ``10000`` shapes. A value of ``0`` disables the cache.
+"""
+
 GEOMETRY_SERVICE_DOCKER_IMAGE = "ghcr.io/ansys/geometry"
 """Default for the Geometry service Docker image location.
 
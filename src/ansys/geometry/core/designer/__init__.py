@@ -40,5 +40,7 @@ from ansys.geometry.core.designer.geometry_commands import (
     SplitFaceParameterType,
     SplitFaceType,
 )
+from ansys.geometry.core.designer.instanced_tessellation import InstancedTessellation
 from ansys.geometry.core.designer.part import MasterComponent, Part
 from ansys.geometry.core.designer.selection import NamedSelection
+from ansys.geometry.core.designer.topology_table import TopologyTable
@@ -431,12 +431,9 @@ class Beam:
         list[NamedSelection]
             List of named selections that include this beam.
         """
-        included_ns = []
-        for ns in get_design_from_component(self.parent_component).named_selections:
-            if any(beam.id == self.id for beam in ns.beams):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_component(self.parent_component)._get_named_selections_containing(
+            "beams", self.id
+        )
 
     def __repr__(self) -> str:
         """Represent the beam as a string."""
@@ -23,7 +23,7 @@
 """Provides for managing a body."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from enum import Enum, unique
 from functools import wraps
 from typing import TYPE_CHECKING, Union
@@ -53,6 +53,7 @@ from ansys.geometry.core.misc.auxiliary import (
 )
 from ansys.geometry.core.misc.checks import (
     _F,
+    bump_design_revision,
     check_input_types,
     check_nurbs_compatibility,
     check_type,
@@ -120,6 +121,8 @@ class IBody(ABC):  # pragma: no cover
     class. All child classes must implement all abstract methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def id(self) -> str:
         """Get the ID of the body as a string."""
@@ -1003,6 +1006,23 @@ class MasterBody(IBody):
         master body is a 3D object (with volume).
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_grpc_client",
+        "_is_surface",
+        "_is_lightweight",
+        "_surface_thickness",
+        "_surface_offset",
+        "_is_alive",
+        "_tessellation",
+        "_raw_tessellation",
+        "_topology",
+        "_geometry_revision",
+        "_fill_style",
+        "_color",
+    )
+
     def __init__(
         self,
         id: str,
@@ -1028,6 +1048,9 @@ class MasterBody(IBody):
         self._is_alive = True
         self._tessellation = None
         self._raw_tessellation = None
+        self._topology = {}
+        # Shapes of the faces and edges are tagged with it, along with the design revision
+        self._geometry_revision = 0
         self._fill_style = FillStyle.DEFAULT
         self._color = None
 
@@ -1047,12 +1070,18 @@ class MasterBody(IBody):
 
         @wraps(func)
         def wrapper(self: "MasterBody", *args, **kwargs):
-            self._tessellation = None
-            self._raw_tessellation = None
+            self._reset_cache()
             return func(self, *args, **kwargs)
 
         return wrapper  # type: ignore[return-value]
 
+    def _reset_cache(self) -> None:
+        """Reset the cached tessellation and topology, and the shapes of the faces and edges."""
+        self._tessellation = None
+        self._raw_tessellation = None
+        self._topology.clear()
+        self._geometry_revision += 1
+
     @property
     def id(self) -> str:  # noqa: D102
         return self._id
@@ -1140,8 +1169,25 @@ class MasterBody(IBody):
     def faces(self) -> list[Face]:  # noqa: D102
         return self._get_faces_from_id(self)
 
+    def _get_cached_topology(
+        self, kind: str, body: Union["Body", "MasterBody"], retrieve: Callable[[], list]
+    ) -> list:
+        """Get the faces, edges or vertices of a body, retrieving them only once.
+
+        The entities are cached per body until the tessellation cache of the master
+        body is reset, which happens whenever an operation modifies its geometry.
+        """
+        cached = self._topology.get((kind, body.id))
+        if cached is None or cached[0] is not body:
+            cached = (body, retrieve())
+            self._topology[(kind, body.id)] = cached
+        return list(cached[1])
+
     def _get_faces_from_id(self, body: Union["Body", "MasterBody"]) -> list[Face]:
         """Retrieve faces from a body ID."""
+        return self._get_cached_topology("faces", body, lambda: self.__retrieve_faces(body))
+
+    def __retrieve_faces(self, body: Union["Body", "MasterBody"]) -> list[Face]:
         self._grpc_client.log.debug(f"Retrieving faces for body {body.id} from server.")
         response = self._grpc_client.services.bodies.get_faces(id=body.id)
         return [
@@ -1161,6 +1207,9 @@ class MasterBody(IBody):
 
     def _get_edges_from_id(self, body: Union["Body", "MasterBody"]) -> list[Edge]:
         """Retrieve edges from a body ID."""
+        return self._get_cached_topology("edges", body, lambda: self.__retrieve_edges(body))
+
+    def __retrieve_edges(self, body: Union["Body", "MasterBody"]) -> list[Edge]:
         self._grpc_client.log.debug(f"Retrieving edges for body {body.id} from server.")
         response = self._grpc_client.services.bodies.get_edges(id=body.id)
         return [
@@ -1181,6 +1230,9 @@ class MasterBody(IBody):
 
     def _get_vertices_from_id(self, body: Union["Body", "MasterBody"]) -> list[Vertex]:
         """Retrieve vertices from a body ID."""
+        return self._get_cached_topology("vertices", body, lambda: self.__retrieve_vertices(body))
+
+    def __retrieve_vertices(self, body: Union["Body", "MasterBody"]) -> list[Vertex]:
         self._grpc_client.log.debug(f"Retrieving vertices for body {body.id} from server.")
         response = self._grpc_client.services.bodies.get_vertices(id=body.id)
 
@@ -1816,6 +1868,7 @@ class Body(IBody):
         self._id = id
         self._name = name
         self._parent_component = parent_component
+        self._design_ref = parent_component._design_ref
         self._template = template
         self._grpc_client = template._grpc_client
 
@@ -1841,9 +1894,13 @@ class Body(IBody):
         return wrapper  # type: ignore[return-value]
 
     def _reset_tessellation_cache(self):  # noqa: N805
-        """Reset the cached tessellation for a body."""
-        self._template._tessellation = None
-        self._template._raw_tessellation = None
+        """Reset the cached tessellation and topology for a body."""
+        design = self._design_ref()
+        if design is not None:
+            # Only this body changed, so the revision of the design and the shapes of
+            # the other bodies are kept
+            design._design_tess = None
+        self._template._reset_cache()
         # if this reference is stale, reset the real cache in the part
         # this gets the matching id master body in the part
         master_in_part = next(
@@ -1854,9 +1911,8 @@ class Body(IBody):
             ),
             None,
         )
-        if master_in_part is not None:
-            master_in_part._tessellation = None
-            master_in_part._raw_tessellation = None
+        if master_in_part is not None and master_in_part is not self._template:
+            master_in_part._reset_cache()
 
     @property
     def id(self) -> str:  # noqa: D102
@@ -2036,6 +2092,7 @@ class Body(IBody):
         self._template.add_midsurface_offset(offset)
 
     @ensure_design_is_active
+    @bump_design_revision
     def imprint_curves(  # noqa: D102
         self, faces: list[Face], sketch: Sketch = None, trimmed_curves: list[TrimmedCurve] = None
     ) -> tuple[list[Edge], list[Face]]:
@@ -2067,6 +2124,7 @@ class Body(IBody):
             face_ids=[face.id for face in faces],
             tc=trimmed_curves,
         )
+        self._reset_tessellation_cache()
 
         new_edges = [
             Edge(
@@ -2109,6 +2167,7 @@ class Body(IBody):
             closest_face=closest_face,
             only_one_curve=only_one_curve,
         )
+        self._reset_tessellation_cache()
 
         projected_faces = [
             Face(
@@ -2124,6 +2183,7 @@ class Body(IBody):
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def imprint_projected_curves(  # noqa: D102
         self,
         direction: UnitVector3D,
@@ -2142,6 +2202,7 @@ class Body(IBody):
             closest_face=closest_face,
             only_one_curve=only_one_curve,
         )
+        self._reset_tessellation_cache()
 
         imprinted_faces = [
             Face(
@@ -2177,12 +2238,14 @@ class Body(IBody):
         return self._template.set_color(color)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def translate(  # noqa: D102
         self, direction: UnitVector3D, distance: Quantity | Distance | Real
     ) -> None:
         return self._template.translate(direction, distance)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def rotate(  # noqa: D102
         self,
         axis_origin: Point3D,
@@ -2192,14 +2255,17 @@ class Body(IBody):
         return self._template.rotate(axis_origin, axis_direction, angle)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def scale(self, value: Real) -> None:  # noqa: D102
         return self._template.scale(value)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def map(self, frame: Frame) -> None:  # noqa: D102
         return self._template.map(frame)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def mirror(self, plane: Plane) -> None:  # noqa: D102
         return self._template.mirror(plane)
 
@@ -2208,6 +2274,7 @@ class Body(IBody):
         return self._template.get_collision(body)
 
     @ensure_design_is_active
+    @bump_design_revision
     def copy(self, parent: "Component", name: str = None) -> "Body":  # noqa: D102
         from ansys.geometry.core.designer.component import Component
 
@@ -2229,18 +2296,11 @@ class Body(IBody):
             is_surface=self.is_surface,
         )
         parent._master_component.part.bodies.append(tb)
-        parent._clear_cached_bodies()
-        body_id = f"{parent.id}/{tb.id}" if parent.parent_component else tb.id
-        return Body(body_id, response.get("name"), parent, tb)
+        return parent._add_cached_bodies([tb])[0]
 
     @ensure_design_is_active
     def get_named_selections(self) -> list["NamedSelection"]:  # noqa: D102
-        included_ns = []
-        for ns in get_design_from_body(self).named_selections:
-            if any(body.id == self.id for body in ns.bodies):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_body(self)._get_named_selections_containing("bodies", self.id)
 
     @ensure_design_is_active
     def get_raw_tessellation(  # noqa: D102
@@ -2316,10 +2376,12 @@ class Body(IBody):
         )
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def shell_body(self, offset: Distance | Quantity | Real) -> bool:  # noqa: D102
         return self._template.shell_body(offset)
 
     @ensure_design_is_active
+    @reset_tessellation_cache
     def remove_faces(  # noqa: D102
         self,
         selection: Face | Iterable[Face],
@@ -2390,6 +2452,7 @@ class Body(IBody):
         else:  # pragma: no cover
             self.__generic_boolean_command(other, False, "unite", "union operation failed")
 
+    @bump_design_revision
     def combine_merge(self, other: Union["Body", list["Body"]]) -> None:  # noqa: D102
         self._template.combine_merge(other)
 
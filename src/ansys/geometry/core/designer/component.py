@@ -24,10 +24,11 @@
 
 from dataclasses import dataclass
 from enum import Enum, unique
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Union
 import uuid
+import weakref
 
+import numpy as np
 from pint import Quantity
 
 from ansys.geometry.core._grpc._version import GeometryApiProtos
@@ -47,6 +48,7 @@ from ansys.geometry.core.designer.datumpoint import DatumPoint
 from ansys.geometry.core.designer.designcurve import DesignCurve
 from ansys.geometry.core.designer.designpoint import DesignPoint
 from ansys.geometry.core.designer.face import Face
+from ansys.geometry.core.designer.instanced_tessellation import InstancedTessellation
 from ansys.geometry.core.designer.part import MasterComponent, Part
 from ansys.geometry.core.math.constants import IDENTITY_MATRIX44
 from ansys.geometry.core.math.frame import Frame
@@ -56,6 +58,7 @@ from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
 from ansys.geometry.core.misc.auxiliary import get_design_from_component
 from ansys.geometry.core.misc.checks import (
+    bump_design_revision,
     check_input_types,
     check_nurbs_compatibility,
     ensure_design_is_active,
@@ -253,9 +256,14 @@ class Component:
         self._datum_points = []
         self._datum_lines = []
         self._parent_component = parent_component
+        self._design_ref = (
+            parent_component._design_ref if parent_component is not None else weakref.ref(self)
+        )
         self._is_alive = True
         self._shared_topology = None
         self._master_component = master_component
+        self._bodies = None
+        self._body_objects = {}
 
         # Populate client data model
         if template:
@@ -290,10 +298,79 @@ class Component:
 
         self._master_component.occurrences.append(self)
 
+    def _hydrate(self, *sections: str) -> None:
+        """Create the given sections of a design read from the server, if still pending.
+
+        Parameters
+        ----------
+        *sections : str
+            Sections to create, such as ``"beams"`` or ``"coordinate_systems"``.
+
+        Notes
+        -----
+        Sections of an existing design that are not needed to build its tree are only
+        created on first access. See ``Design._pending_sections``.
+        """
+        design = self._design_ref()
+        pending = getattr(design, "_pending_sections", None)
+        if pending:
+            for section in sections:
+                # Skip sections being created, since creation may access them again
+                create = pending.get(section)
+                if create is None or section in design._hydrating_sections:
+                    continue
+
+                design._hydrating_sections.add(section)
+                try:
+                    create()
+                finally:
+                    design._hydrating_sections.discard(section)
+
+                # Only drop the section once created, so that a failure can be retried
+                pending.pop(section, None)
+
     def _clear_cached_bodies(self) -> None:
-        """Clear the cached bodies."""
-        if "bodies" in self.__dict__:
-            del self.__dict__["bodies"]
+        """Clear the cached bodies.
+
+        The bodies are rebuilt from the part on the next access. The ``Body`` objects
+        of master bodies still in the part are reused, so their identity is kept.
+        """
+        self._bodies = None
+
+    def _add_cached_bodies(
+        self, master_bodies: list[MasterBody], ids: list[str] | None = None
+    ) -> list[Body]:
+        """Get the ``Body`` objects of master bodies just added to the part.
+
+        Parameters
+        ----------
+        master_bodies : list[MasterBody]
+            Master bodies added to the part of the component.
+        ids : list[str], default: None
+            IDs of the bodies. By default, they are built from the component and
+            master body IDs.
+
+        Returns
+        -------
+        list[Body]
+            Body objects, which are also appended to the cached bodies.
+        """
+        ids = ids if ids is not None else [None] * len(master_bodies)
+        bodies = [self.__get_body_object(tb, id) for tb, id in zip(master_bodies, ids)]
+        if self._bodies is not None:
+            # Never modify a list that may have been handed out already
+            self._bodies = [*self._bodies, *bodies]
+        return bodies
+
+    def __get_body_object(self, master_body: MasterBody, id: str | None = None) -> Body:
+        """Get the ``Body`` object wrapping a master body, creating it if needed."""
+        body = self._body_objects.get(master_body.id)
+        if body is None or body._template is not master_body:
+            if id is None:
+                id = f"{self.id}/{master_body.id}" if self.parent_component else master_body.id
+            body = Body(id, master_body.name, self, master_body)
+            self._body_objects[master_body.id] = body
+        return body
 
     @property
     def id(self) -> str:
@@ -344,19 +421,22 @@ class Component:
         """List of ``Component`` objects inside of the component."""
         return self._components
 
-    @cached_property
+    @property
     def bodies(self) -> list[Body]:
         """List of ``Body`` objects inside of the component."""
-        bodies = []
-        for body in self._master_component.part.bodies:
-            id = f"{self.id}/{body.id}" if self.parent_component else body.id
-            if body.is_alive:
-                bodies.append(Body(id, body.name, self, body))
-        return bodies
+        if self._bodies is None:
+            self._bodies = [
+                self.__get_body_object(body)
+                for body in self._master_component.part.bodies
+                if body.is_alive
+            ]
+            self._body_objects = {body._template.id: body for body in self._bodies}
+        return self._bodies
 
     @property
     def beams(self) -> list[Beam]:
         """List of ``Beam`` objects inside of the component."""
+        self._hydrate("beams")
         return self._beams
 
     @property
@@ -387,6 +467,7 @@ class Component:
     @property
     def coordinate_systems(self) -> list[CoordinateSystem]:
         """List of ``CoordinateSystem`` objects inside of the component."""
+        self._hydrate("coordinate_systems")
         return self._coordinate_systems
 
     @property
@@ -450,6 +531,7 @@ class Component:
         return self.parent_component.get_world_transform() * self._master_component.transform
 
     @ensure_design_is_active
+    @bump_design_revision
     def modify_placement(
         self,
         translation: Vector3D | None = None,
@@ -495,6 +577,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def add_component(
         self, name: str, template: Optional["Component"] = None, instance_name: str = None
     ) -> "Component":
@@ -538,6 +621,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def set_shared_topology(self, share_type: SharedTopologyType) -> None:
         """Set the shared topology to apply to the component.
 
@@ -583,11 +667,58 @@ class Component:
             is_surface=response["is_surface"],
         )
         self._master_component.part.bodies.append(tb)
-        self._clear_cached_bodies()
-        return Body(response["id"], response["name"], self, tb)
+        return self._add_cached_bodies([tb], [response["id"]])[0]
+
+    def __build_bodies_from_response(self, response: dict) -> list[Body]:
+        """Build several bodies from a response dictionary coming out of the gRPC call.
+
+        Parameters
+        ----------
+        response : dict
+            Response dictionary from the gRPC call, with the created bodies
+            under the ``"bodies"`` key.
+
+        Returns
+        -------
+        list[Body]
+            Body objects, in the same order as in the response.
+
+        Notes
+        -----
+        This is a completely private method and is intended to be
+        used only within the class.
+        """
+        master_bodies = [
+            MasterBody(
+                body["master_id"],
+                body["name"],
+                self._grpc_client,
+                is_surface=body["is_surface"],
+            )
+            for body in response["bodies"]
+        ]
+        self._master_component.part.bodies.extend(master_bodies)
+        return self._add_cached_bodies(master_bodies, [body["id"] for body in response["bodies"]])
+
+    @staticmethod
+    def __broadcast(value: Any, n_bodies: int, argument: str, item_ndim: int = 0) -> list:
+        """Repeat a single value for every body, or check the number of values provided.
+
+        A single value is a string or has ``item_ndim`` dimensions, such as a scalar or,
+        with ``item_ndim=1``, a point.
+        """
+        single = isinstance(value, str) or np.ndim(value) == item_ndim
+        values = [value] * n_bodies if single else value
+        if len(values) != n_bodies:
+            raise ValueError(
+                f"The number of values in '{argument}' ({len(values)}) does not match"
+                f" the number of bodies to create ({n_bodies})."
+            )
+        return list(values)
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def extrude_sketch(
         self,
         name: str,
@@ -664,9 +795,73 @@ class Component:
             # And obviously return None... since no body is created
             return None
 
+    @check_input_types
+    @ensure_design_is_active
+    @bump_design_revision
+    def extrude_sketches(
+        self,
+        name: str | list[str],
+        sketches: list[Sketch],
+        distances: Quantity | Distance | Real | list[Quantity | Distance | Real],
+        direction: ExtrusionDirection | str = ExtrusionDirection.POSITIVE,
+    ) -> list[Body]:
+        """Create several solid bodies by extruding sketch profiles.
+
+        Parameters
+        ----------
+        name : str | list[str]
+            User-defined label for each new solid body. A single name is used
+            for all bodies.
+        sketches : list[Sketch]
+            Two-dimensional sketch sources for the extrusions.
+        distances : ~pint.Quantity | Distance | Real | list[~pint.Quantity | Distance | Real]
+            Distance to extrude each sketch. A single distance is used for all sketches.
+        direction : ExtrusionDirection | str, default: "+"
+            Direction for extruding the solid bodies.
+            The default is to extrude in the positive normal direction of the sketches.
+            Options are "+" and "-" as a string, or the enum values.
+
+        Returns
+        -------
+        list[Body]
+            Extruded bodies, in the same order as the sketches.
+
+        Notes
+        -----
+        The newly created bodies are placed under this component within the design assembly.
+        All sketches are sent to the server in a single request whenever the server
+        supports it. Extruding a NURBS sketch requires a minimum Ansys release version of 26R1.
+        """
+        for sketch in sketches:
+            check_nurbs_compatibility(self._grpc_client.backend_version, sketch=sketch)
+
+        # Sanity checks on inputs
+        names = self.__broadcast(name, len(sketches), "name")
+        distances = [
+            distance if isinstance(distance, Distance) else Distance(distance)
+            for distance in self.__broadcast(distances, len(sketches), "distances")
+        ]
+        if isinstance(direction, str):
+            direction = ExtrusionDirection.from_string(direction, use_default_if_error=True)
+
+        # Perform extrusion request
+        self._grpc_client.log.debug(
+            f"Extruding {len(sketches)} sketches provided on {self.id}. Creating bodies..."
+        )
+        response = self._grpc_client.services.bodies.create_extruded_bodies(
+            names=names,
+            parent_id=self.id,
+            sketches=sketches,
+            distances=distances,
+            directions=[direction.get_multiplier()] * len(sketches),
+            backend_version=self._grpc_client.backend_version,
+        )
+        return self.__build_bodies_from_response(response)
+
     @min_backend_version(24, 2, 0)
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def sweep_sketch(
         self,
         name: str,
@@ -711,6 +906,7 @@ class Component:
     @min_backend_version(24, 2, 0)
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def sweep_chain(
         self,
         name: str,
@@ -754,6 +950,7 @@ class Component:
     @min_backend_version(26, 1, 0)
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def sweep_with_guide(self, sweep_data: list[SweepWithGuideData]) -> list[Body]:
         """Create a body by sweeping a sketch along a path with a guide curve.
 
@@ -779,6 +976,7 @@ class Component:
 
     @min_backend_version(24, 2, 0)
     @check_input_types
+    @bump_design_revision
     def revolve_sketch(
         self,
         name: str,
@@ -839,6 +1037,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def extrude_face(
         self,
         name: str,
@@ -893,6 +1092,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(25, 1, 0)
+    @bump_design_revision
     def create_sphere(self, name: str, center: Point3D, radius: Distance) -> Body:
         """Create a sphere body defined by the center point and the radius.
 
@@ -920,9 +1120,59 @@ class Component:
         )
         return self.__build_body_from_response(response)
 
+    @check_input_types
+    @ensure_design_is_active
+    @min_backend_version(25, 1, 0)
+    @bump_design_revision
+    def create_spheres(
+        self,
+        name: str | list[str],
+        centers: np.ndarray | list[Point3D],
+        radii: Distance | Quantity | Real | np.ndarray | list[Distance | Quantity | Real],
+    ) -> list[Body]:
+        """Create several sphere bodies defined by their center points and radii.
+
+        Parameters
+        ----------
+        name : str | list[str]
+            Name of each body. A single name is used for all bodies.
+        centers : ~numpy.ndarray | list[Point3D]
+            Center points of the spheres. An array of shape ``(n, 3)`` is
+            interpreted in the default length units.
+        radii : Distance | ~pint.Quantity | Real | ~numpy.ndarray | list[Distance | ~pint.Quantity | Real]
+            Radius of each sphere. A single radius is used for all spheres.
+
+        Returns
+        -------
+        list[Body]
+            Sphere body objects, in the same order as the centers.
+
+        Warnings
+        --------
+        This method is only available starting on Ansys release 25R1.
+
+        Notes
+        -----
+        All spheres are sent to the server in a single request whenever
+        the server supports it.
+        """  # noqa: E501
+        centers = [c if isinstance(c, Point3D) else Point3D(c) for c in centers]
+        names = self.__broadcast(name, len(centers), "name")
+        radii = [
+            r if isinstance(r, Distance) else Distance(r)
+            for r in self.__broadcast(radii, len(centers), "radii")
+        ]
+
+        self._grpc_client.log.debug(f"Creating {len(centers)} sphere bodies on {self.id}.")
+        response = self._grpc_client.services.bodies.create_sphere_bodies(
+            names=names, parent=self.id, centers=centers, radii=radii
+        )
+        return self.__build_bodies_from_response(response)
+
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def create_block(self, name: str, start: Point3D, end: Point3D) -> Body:
         """Create a block body defined by the start and end points.
 
@@ -950,9 +1200,56 @@ class Component:
         )
         return self.__build_body_from_response(response)
 
+    @check_input_types
+    @ensure_design_is_active
+    @min_backend_version(27, 1, 0)
+    @bump_design_revision
+    def create_blocks(
+        self,
+        name: str | list[str],
+        starts: np.ndarray | list[Point3D],
+        ends: np.ndarray | list[Point3D] | Point3D,
+    ) -> list[Body]:
+        """Create several block bodies defined by their start and end points.
+
+        Parameters
+        ----------
+        name : str | list[str]
+            Name of each body. A single name is used for all bodies.
+        starts : ~numpy.ndarray | list[Point3D]
+            Start point of each block (one corner). An array of shape ``(n, 3)``
+            is interpreted in the default length units.
+        ends : ~numpy.ndarray | list[Point3D] | Point3D
+            End point of each block (opposite corner). An array of shape ``(n, 3)``
+            is interpreted in the default length units. A single point is used as
+            the end corner of all blocks.
+
+        Returns
+        -------
+        list[Body]
+            Block body objects, in the same order as the start points.
+
+        Warnings
+        --------
+        This method is only available starting on Ansys release 27R1.
+        """
+        starts = [p if isinstance(p, Point3D) else Point3D(p) for p in starts]
+        ends = [
+            p if isinstance(p, Point3D) else Point3D(p)
+            for p in self.__broadcast(ends, len(starts), "ends", item_ndim=1)
+        ]
+        names = self.__broadcast(name, len(starts), "name")
+
+        self._grpc_client.log.debug(f"Creating {len(starts)} block bodies on {self.id}.")
+        response = self._grpc_client.services.bodies.create_block_bodies(
+            names=names, parent_id=self.id, starts=starts, ends=ends
+        )
+        return self.__build_bodies_from_response(response)
+
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(24, 2, 0)
+    @bump_design_revision
     def create_body_from_loft_profile(
         self,
         name: str,
@@ -1022,6 +1319,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(26, 1, 0)
+    @bump_design_revision
     def create_body_from_loft_profiles_with_guides(
         self,
         name: str,
@@ -1060,6 +1358,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def create_surface(self, name: str, sketch: Sketch) -> Body:
         """Create a surface body with a sketch profile.
 
@@ -1097,6 +1396,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def create_surface_from_face(self, name: str, face: Face) -> Body:
         """Create a surface body based on a face.
 
@@ -1129,6 +1429,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(25, 1, 0)
+    @bump_design_revision
     def create_body_from_surface(self, name: str, trimmed_surface: TrimmedSurface) -> Body:
         """Create a surface body from a trimmed surface.
 
@@ -1165,6 +1466,7 @@ class Component:
         return self.__build_body_from_response(response)
 
     @min_backend_version(25, 2, 0)
+    @bump_design_revision
     def create_surface_from_trimmed_curves(
         self, name: str, trimmed_curves: list[TrimmedCurve]
     ) -> Body:
@@ -1201,6 +1503,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def create_coordinate_system(self, name: str, frame: Frame) -> CoordinateSystem:
         """Create a coordinate system.
 
@@ -1218,11 +1521,13 @@ class Component:
         -------
         CoordinateSystem
         """
+        self._hydrate("coordinate_systems")
         self._coordinate_systems.append(CoordinateSystem(name, frame, self, self._grpc_client))
         return self._coordinate_systems[-1]
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def translate_bodies(
         self, bodies: list[Body], direction: UnitVector3D, distance: Quantity | Distance | Real
     ) -> None:
@@ -1242,12 +1547,14 @@ class Component:
         If the body does not belong to this component (or its children), it
         is not translated.
         """
+        # Collect the IDs of the bodies in the component's scope in a single pass,
+        # instead of searching the whole hierarchy once per body
+        body_ids_in_scope = {body.id for body in self.get_all_bodies() if body.is_alive}
         body_ids_found = []
 
         for body in bodies:
-            body_requested = self.search_body(body.id)
-            if body_requested:
-                body_ids_found.append(body_requested.id)
+            if body.id in body_ids_in_scope:
+                body_ids_found.append(body.id)
             else:
                 self._grpc_client.log.warning(
                     f"Body with ID {body.id} and name {body.name} is not found in this "
@@ -1266,6 +1573,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def create_beams(
         self,
         segments: list[tuple[Point3D, Point3D]],
@@ -1333,6 +1641,7 @@ class Component:
                 Beam(beam_ids[index], segments[index][0], segments[index][1], profile, self)
             )
 
+        self._hydrate("beams")
         self._beams.extend(new_beams)
         return self._beams[-n_beams:]
 
@@ -1417,6 +1726,7 @@ class Component:
                 )
             )
 
+        self._hydrate("beams")
         self._beams.extend(beams)
         return beams
 
@@ -1439,6 +1749,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def delete_component(self, component: Union["Component", str]) -> None:
         """Delete a component (itself or its children).
 
@@ -1473,6 +1784,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def delete_body(self, body: Body | str) -> None:
         """Delete a body belonging to this component (or its children).
 
@@ -1499,6 +1811,7 @@ class Component:
             body_requested._is_alive = False
             self._grpc_client.log.debug(f"Body {body_requested.id} has been deleted.")
             self._clear_cached_bodies()
+            body_requested.parent_component._clear_cached_bodies()
         else:
             self._grpc_client.log.warning(
                 f"Body {id} is not found in this component (or subcomponents)."
@@ -1524,6 +1837,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def add_design_points(
         self,
         name: str,
@@ -1571,6 +1885,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def create_datum_plane(self, name: str, plane: Plane) -> DatumPlane:
         """Create a datum plane on this component.
 
@@ -1604,6 +1919,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def delete_datum_plane(self, plane: DatumPlane | str) -> None:
         """Delete a datum plane from this component.
 
@@ -1643,6 +1959,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def delete_coordinate_system(self, coordinate_system: CoordinateSystem | str) -> None:
         """Delete a coordinate system from this component.
 
@@ -1682,6 +1999,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def create_datum_point(self, name: str, point: Point3D) -> DatumPoint:
         """Create a datum point on this component.
 
@@ -1711,6 +2029,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def delete_datum_point(self, datum_point: DatumPoint | str) -> None:
         """Delete a datum point from this component.
 
@@ -1746,6 +2065,7 @@ class Component:
     @min_backend_version(27, 1, 0)
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def create_datum_line(self, name: str, line: Line) -> DatumLine:
         """Create a datum line on this component.
 
@@ -1779,6 +2099,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def delete_datum_line(self, datum_line: DatumLine | str) -> None:
         """Delete a datum line from this component.
 
@@ -1813,6 +2134,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def delete_beam(self, beam: Beam | str) -> None:
         """Delete an existing beam belonging to this component's scope.
 
@@ -1852,6 +2174,7 @@ class Component:
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def delete_design_curve(self, design_curve: DesignCurve | str) -> None:
         """Delete an existing design curve belonging to this component's scope.
 
@@ -2187,6 +2510,7 @@ class Component:
 
     @check_input_types
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def copy_faces(self, name: str, faces: list[Face]) -> Body:
         """Create a surface body from the faces provided.
 
@@ -2217,6 +2541,7 @@ class Component:
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(27, 1, 0)
+    @bump_design_revision
     def move_bodies_to_component(self, bodies: list[Body]) -> None:
         """Move bodies to this component, changing the design hierarchy.
 
@@ -2259,7 +2584,7 @@ class Component:
         :func:`delete_component()` method and itself.
         """
         # Kill all its bodies, beams and coordinate systems
-        for elem in [*self.bodies, *self.beams, *self._coordinate_systems]:
+        for elem in [*self.bodies, *self.beams, *self.coordinate_systems]:
             elem._is_alive = False
 
         # Now, go to the nested components and kill them as well
@@ -2293,6 +2618,12 @@ class Component:
         """
         import pyvista as pv
 
+        # Master bodies shared by several occurrences are tessellated only once
+        if not _recursive_call and self._grpc_client.backend_version >= (26, 1, 0):
+            return InstancedTessellation._from_bodies(
+                self.get_all_bodies(), tess_options
+            ).to_polydata()
+
         # Tessellate the bodies in this component
         datasets: list["MultiBlock"] = [
             body.tessellate(merge=False, tess_options=tess_options) for body in self.bodies
@@ -2625,6 +2956,7 @@ class Component:
         design._update_design_inplace()
 
     @min_backend_version(26, 1, 0)
+    @bump_design_revision
     def make_independent(self, others: list["Component"] = None) -> None:
         """Make a component independent if it is an instance.
 
@@ -2655,9 +2987,6 @@ class Component:
         list[NamedSelection]
             List of named selections belonging to the component.
         """
-        included_ns = []
-        for ns in get_design_from_component(self).named_selections:
-            if any(comp.id == self.id for comp in ns.components):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_component(self)._get_named_selections_containing(
+            "components", self.id
+        )
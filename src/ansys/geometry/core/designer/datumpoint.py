@@ -92,12 +92,9 @@ class DatumPoint:
         list[NamedSelection]
             List of named selections that contain this datum point.
         """
-        included_ns = []
-        for ns in get_design_from_component(self.parent_component).named_selections:
-            if any(dp.id == self.id for dp in ns.datum_points):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_component(self.parent_component)._get_named_selections_containing(
+            "datum_points", self.id
+        )
 
     def __repr__(self) -> str:
         """Represent the datum point as a string."""
@@ -22,13 +22,19 @@
 
 """Provides for managing designs."""
 
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum, unique
+from functools import partial
+from itertools import count
 from pathlib import Path
 from typing import Union
 
 import numpy as np
 from pint import Quantity, UndefinedUnitError
 
+from ansys.geometry.core._grpc._services.base.conversions import check_response_data
 from ansys.geometry.core._grpc._version import GeometryApiProtos
 from ansys.geometry.core.connection.backend import BackendType
 from ansys.geometry.core.designer.beam import (
@@ -39,7 +45,7 @@ from ansys.geometry.core.designer.beam import (
     BeamProperties,
     SectionAnchorType,
 )
-from ansys.geometry.core.designer.body import Body, MasterBody, MidSurfaceOffsetType
+from ansys.geometry.core.designer.body import Body, CollisionType, MasterBody, MidSurfaceOffsetType
 from ansys.geometry.core.designer.component import Component, SharedTopologyType
 from ansys.geometry.core.designer.coordinate_system import CoordinateSystem
 from ansys.geometry.core.designer.datumline import DatumLine
@@ -49,18 +55,30 @@ from ansys.geometry.core.designer.designcurve import DesignCurve
 from ansys.geometry.core.designer.designpoint import DesignPoint
 from ansys.geometry.core.designer.edge import Edge
 from ansys.geometry.core.designer.face import Face
+from ansys.geometry.core.designer.instanced_tessellation import InstancedTessellation
 from ansys.geometry.core.designer.part import MasterComponent, Part
-from ansys.geometry.core.designer.selection import NamedSelection
+from ansys.geometry.core.designer.selection import (
+    NamedSelection,
+    _group_members,
+    _NamedSelectionIndex,
+)
+from ansys.geometry.core.designer.topology_table import TopologyTable
 from ansys.geometry.core.designer.vertex import Vertex
 from ansys.geometry.core.errors import GeometryRuntimeError
 from ansys.geometry.core.materials.material import Material
 from ansys.geometry.core.materials.property import MaterialProperty, MaterialPropertyType
+from ansys.geometry.core.math.bbox import BoundingBoxArray
+from ansys.geometry.core.math.bbox_index import BoundingBoxIndex
 from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Y, ZERO_POINT3D
 from ansys.geometry.core.math.plane import Plane
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D, Vector3D
-from ansys.geometry.core.misc.auxiliary import prepare_file_for_server_upload
+from ansys.geometry.core.misc.auxiliary import (
+    get_bounding_box_corners,
+    prepare_file_for_server_upload,
+)
 from ansys.geometry.core.misc.checks import (
+    bump_design_revision,
     check_input_types,
     deprecated_method,
     ensure_design_is_active,
@@ -101,6 +119,9 @@ class DesignFileFormat(Enum):
         return self.value
 
 
+# Identifiers of the designs in the caches shared by all the designs of a client
+_CACHE_IDS = count()
+
 # Mapping of DesignFileFormat to list of valid file extensions
 DESIGN_FILE_FORMAT_EXTENSIONS = {
     DesignFileFormat.SCDOCX: ["scdocx"],
@@ -147,7 +168,12 @@ class Design(Component):
     # Types of the class instance private attributes
     _materials: list[Material]
     _named_selections: dict[str, NamedSelection]
+    _named_selection_index: _NamedSelectionIndex
     _beam_profiles: dict[str, BeamProfile]
+    _pending_sections: dict[str, Callable[[], None]]
+    _hydrating_sections: set[str]
+    _sync_pending: bool
+    _entity_maps: dict[str, tuple[int, dict[str, tuple]]]
 
     @check_input_types
     def __init__(self, name: str, modeler: Modeler, read_existing_design: bool = False):
@@ -157,11 +183,22 @@ class Design(Component):
         # Initialize needed instance variables
         self._materials = []
         self._named_selections = {}
+        self._named_selection_index = _NamedSelectionIndex()
         self._beam_profiles = {}
         self._design_id = ""
         self._is_active = False
         self._modeler = modeler
         self._design_tess = None
+        self._design_tess_revision = None
+        self._pending_sections = {}
+        self._hydrating_sections = set()
+        self._sync_suspended = 0
+        self._sync_pending = False
+        self._entity_maps = {}
+        # Incremented whenever the design may have changed on the server, so that
+        # cached data tagged with an older revision is not reused
+        self._revision = 0
+        self._cache_id = next(_CACHE_IDS)
 
         # Check whether we want to process an existing design or create a new one.
         if read_existing_design:
@@ -182,11 +219,13 @@ class Design(Component):
     @property
     def materials(self) -> list[Material]:
         """List of materials available for the design."""
+        self._hydrate("materials")
         return self._materials
 
     @property
     def named_selections(self) -> list[NamedSelection]:
         """List of named selections available for the design."""
+        self._hydrate("named_selections")
         return list(self._named_selections.values())
 
     @property
@@ -209,6 +248,26 @@ class Design(Component):
         """Whether the design is closed (i.e. not active)."""
         return not self._is_active
 
+    @property
+    def revision(self) -> int:
+        """Revision of the design.
+
+        The revision increases whenever the geometry of the design may have changed,
+        either through the methods of its objects or on the server, as reported when the
+        design is synchronized. Data cached by the client, such as the shapes of faces and
+        edges or the tessellation of the design, is tagged with the revision it was
+        retrieved at, and it is retrieved again once the revision changes.
+
+        Changes to names, colors, materials, or named selections do not change the
+        revision. Neither do operations on a single body, such as moving it: they only
+        reset the data cached for that body and the tessellation of the design.
+        """
+        return self._revision
+
+    def _bump_revision(self) -> None:
+        """Increase the revision of the design, so that cached data is not reused."""
+        self._revision += 1
+
     def close(self) -> None:
         """Close the design."""
         # Check if the design is already closed
@@ -247,6 +306,7 @@ class Design(Component):
             Material to add.
         """
         self._grpc_client.services.materials.add_material(material=material)
+        self._hydrate("materials")
         self._materials.append(material)
         self._grpc_client.log.debug(f"Material {material.name} is successfully added to design.")
 
@@ -264,6 +324,7 @@ class Design(Component):
         material = material if isinstance(material, list) else [material]
 
         self._grpc_client.services.materials.remove_material(materials=material)
+        self._hydrate("materials")
         for mat in material:
             self._materials.remove(mat)
             self._grpc_client.log.debug(f"Material {mat.name} is successfully removed from design.")
@@ -329,8 +390,6 @@ class Design(Component):
         products. If options are provided but the backend version does not support
         them, the options will be ignored.
         """
-        from ansys.geometry.core.misc.auxiliary import extract_project_from_zip
-
         # Sanity checks on inputs
         if isinstance(file_location, str):
             file_location = Path(file_location)
@@ -349,12 +408,36 @@ class Design(Component):
                 f" {format}. Valid extensions: {', '.join('.' + ext for ext in valid_extensions)}"
             )
 
+        received_bytes = self._export_bytes(
+            file_location=file_location,
+            format=format,
+            write_body_facets=write_body_facets,
+            fmd_options=fmd_options,
+            pmdb_options=pmdb_options,
+        )
+        self._write_download(received_bytes, file_location)
+
+    def _export_bytes(
+        self,
+        file_location: Path,
+        format: DesignFileFormat,
+        write_body_facets: bool = False,
+        fmd_options: FMDExportOptions | None = None,
+        pmdb_options: PMDBExportOptions | None = None,
+    ) -> bytes:
+        """Export the design on the server and get the raw data of the exported file.
+
+        Notes
+        -----
+        This is the server-side part of the ``download()`` method. The data is written
+        to disk by the ``_write_download()`` method.
+        """
         # Process response
         self._grpc_client.log.debug(f"Requesting design download in {format} format.")
         if self._modeler.client.backend_version < (25, 2, 0):
-            received_bytes = self.__export_and_download_legacy(format=format)
+            return self.__export_and_download_legacy(format=format)
         else:
-            received_bytes = self.__export_and_download(
+            return self.__export_and_download(
                 format=format,
                 write_body_facets=write_body_facets,
                 file_location=file_location,
@@ -362,7 +445,10 @@ class Design(Component):
                 pmdb_options=pmdb_options,
             )
 
-        # Write to file
+    def _write_download(self, received_bytes: bytes, file_location: Path) -> None:
+        """Write the raw data returned by the ``_export_bytes()`` method to disk."""
+        from ansys.geometry.core.misc.auxiliary import extract_project_from_zip
+
         if (
             self._grpc_client.services.version == GeometryApiProtos.V0
             or self._grpc_client.backend_version < (27, 1, 0)
@@ -789,6 +875,52 @@ class Design(Component):
         # Return the file location
         return file_location
 
+    @min_backend_version(26, 1, 0)
+    @ensure_design_is_active
+    def export_to_glb(
+        self,
+        location: Path | str | None = None,
+        tess_options: TessellationOptions | None = None,
+        quantize: bool = False,
+    ) -> Path:
+        """Export the tessellation of the design to a binary glTF (GLB) file.
+
+        The file is written from the raw tessellation of the design, without a
+        plotter. Occurrences of the same master body, such as the bodies of the
+        instances of a component, share a single mesh in the file.
+
+        Parameters
+        ----------
+        location : ~pathlib.Path | str, optional
+            Location on disk to save the file to. If None, the file will be saved
+            in the current working directory.
+        tess_options : TessellationOptions, optional
+            Options for the tessellation. If None, default options are used.
+        quantize : bool, default: False
+            Whether to store the vertex positions as 16-bit integers with the
+            ``KHR_mesh_quantization`` glTF extension, which makes the file smaller.
+
+        Returns
+        -------
+        ~pathlib.Path
+            The path to the saved file.
+
+        Notes
+        -----
+        This method requires the ``pygltflib`` library.
+        """
+        # Define the file location
+        file_location = self.__build_export_file_location(location, "glb")
+        file_location.parent.mkdir(parents=True, exist_ok=True)
+
+        # Cached meshes may have been tessellated with other options
+        tessellation = self.get_instanced_tessellation(
+            tess_options=tess_options, reset_cache=tess_options is not None
+        )
+
+        # Return the file location
+        return tessellation.to_glb(file_location, quantize=quantize)
+
     @check_input_types
     @ensure_design_is_active
     def create_named_selection(
@@ -885,13 +1017,211 @@ class Design(Component):
             datum_points=datum_points,
         )
 
+        self._hydrate("named_selections")
+        replaced = self._named_selections.get(named_selection.name)
+        if replaced is not None:
+            self._named_selection_index.remove(replaced)
         self._named_selections[named_selection.name] = named_selection
+        self._named_selection_index.add(named_selection)
         self._grpc_client.log.debug(
             f"Named selection {named_selection.name} is successfully created."
         )
 
         return self._named_selections[named_selection.name]
 
+    @check_input_types
+    @ensure_design_is_active
+    def create_named_selections(self, named_selections: dict[str, list]) -> list[NamedSelection]:
+        """Create several named selections on the active Geometry server instance.
+
+        All the named selections are created in a single request when the server
+        supports it.
+
+        Parameters
+        ----------
+        named_selections : dict[str, list]
+            Members of each named selection, by name. The members can be ``Body``,
+            ``Face``, ``Edge``, ``Beam``, ``DesignPoint``, ``Component``, ``Vertex``,
+            ``DesignCurve``, ``DatumPlane``, ``CoordinateSystem`` or ``DatumPoint``
+            objects, in any order.
+
+        Returns
+        -------
+        list[NamedSelection]
+            Newly created named selections, in the same order as the input.
+
+        Raises
+        ------
+        ValueError
+            If no entities are provided for one of the named selections.
+
+        Examples
+        --------
+        Create a named selection for each face of a body.
+
+        >>> design.create_named_selections(
+        ...     {f"face_{i}": [face] for i, face in enumerate(body.faces)}
+        ... )
+        """
+        groups = {}
+        for name, members in named_selections.items():
+            if not members:
+                raise ValueError(f"No entities are provided for the named selection '{name}'.")
+            groups[name] = _group_members(members)
+
+        response = self.__create_named_selections_on_server(
+            [
+                {
+                    "name": name,
+                    "members": list(
+                        dict.fromkeys(
+                            entity.id for entities in group.values() for entity in entities
+                        )
+                    ),
+                }
+                for name, group in groups.items()
+            ]
+        )
+
+        self._hydrate("named_selections")
+        created = []
+        for (name, group), data in zip(groups.items(), response):
+            named_selection = NamedSelection(
+                name, self, self._grpc_client, **group, preexisting_id=data["id"]
+            )
+            # The members were just sent to the server, there is no need to request them
+            named_selection._members_known = True
+
+            replaced = self._named_selections.get(name)
+            if replaced is not None:
+                self._named_selection_index.remove(replaced)
+            self._named_selections[name] = named_selection
+            self._named_selection_index.add(named_selection)
+            created.append(named_selection)
+
+        self._grpc_client.log.debug(f"{len(created)} named selections are successfully created.")
+
+        return created
+
+    @check_input_types
+    @ensure_design_is_active
+    def update_named_selections(
+        self,
+        add: dict[NamedSelection | str, list] | None = None,
+        remove: dict[NamedSelection | str, list] | None = None,
+    ) -> list[NamedSelection]:
+        """Add and remove members of several named selections.
+
+        This method is the bulk version of the ``NamedSelection.add_members()``
+        and ``NamedSelection.remove_members()`` methods. The named selections are
+        created again and the previous ones are deleted, with a single request
+        each when the server supports it. If some of the previous ones cannot be
+        deleted, their new versions are deleted instead and these named selections
+        are unchanged.
+
+        Parameters
+        ----------
+        add : dict[NamedSelection | str, list], default: None
+            Members to add, by named selection or name of the named selection.
+        remove : dict[NamedSelection | str, list], default: None
+            Members to remove, by named selection or name of the named selection.
+
+        Returns
+        -------
+        list[NamedSelection]
+            Updated named selections. Changes are also reflected on the existing
+            ``NamedSelection`` objects.
+
+        Raises
+        ------
+        ValueError
+            If one of the named selections does not exist in the design.
+        GeometryRuntimeError
+            If one of the named selections would be empty after the update.
+        """
+        self._hydrate("named_selections")
+
+        changes = {}
+        for position, mapping in enumerate((add or {}, remove or {})):
+            for key, members in mapping.items():
+                named_selection = self._named_selections.get(key) if isinstance(key, str) else key
+                if named_selection is None:
+                    raise ValueError(f"Named selection '{key}' does not exist in the design.")
+                changes.setdefault(named_selection, ([], []))[position].extend(members)
+
+        if not changes:
+            return []
+
+        updates = {
+            named_selection: named_selection._changed_members(added, removed)
+            for named_selection, (added, removed) in changes.items()
+        }
+
+        response = self.__create_named_selections_on_server(
+            [
+                {
+                    "name": named_selection.name,
+                    "members": list(
+                        dict.fromkeys(id for member_ids in ids.values() for id in member_ids)
+                    ),
+                }
+                for named_selection, (ids, _) in updates.items()
+            ]
+        )
+
+        service = self._grpc_client.services.named_selection
+        deleted = []
+        try:
+            service.delete_named_selections(
+                ids=[named_selection.id for named_selection in updates], completed=deleted
+            )
+        except Exception:
+            # Named selections already deleted use their new versions, and the new
+            # versions of the others are removed so that these are left unchanged
+            deleted = set(deleted)
+            unused = []
+            for (named_selection, (ids, faces_meta)), data in zip(updates.items(), response):
+                if named_selection.id in deleted:
+                    named_selection._replace(data["id"], ids, faces_meta)
+                else:
+                    unused.append(data["id"])
+            if unused:
+                service.delete_named_selections(ids=unused)
+            raise
+
+        for (named_selection, (ids, faces_meta)), data in zip(updates.items(), response):
+            named_selection._replace(data["id"], ids, faces_meta)
+
+        self._grpc_client.log.debug(f"{len(updates)} named selections are successfully updated.")
+
+        return list(updates)
+
+    def __create_named_selections_on_server(self, selections: list[dict]) -> list[dict]:
+        """Create named selections on the server, or none of them if any fails.
+
+        Parameters
+        ----------
+        selections : list[dict]
+            Name and member IDs of each named selection.
+
+        Returns
+        -------
+        list[dict]
+            ID and name of each created named selection, in the same order.
+        """
+        service = self._grpc_client.services.named_selection
+        completed = []
+        try:
+            response = service.create_named_selections(selections=selections, completed=completed)
+            return check_response_data(
+                response["named_selections"], selections, "create_named_selections"
+            )
+        except Exception:
+            # Remove the named selections created before the failure
+            if completed:
+                service.delete_named_selections(ids=[data["id"] for data in completed])
+            raise
+
     @check_input_types
     @ensure_design_is_active
     def delete_named_selection(self, named_selection: NamedSelection | str) -> None:
@@ -902,6 +1232,7 @@ class Design(Component):
         named_selection : NamedSelection | str
             Name of the named selection or instance.
         """
+        self._hydrate("named_selections")
         if isinstance(named_selection, str):
             removal_name = named_selection
             removal = self._named_selections.get(named_selection, None)
@@ -914,7 +1245,7 @@ class Design(Component):
         self._grpc_client.services.named_selection.delete_named_selection(id=removal_id)
 
         try:
-            self._named_selections.pop(removal_name)
+            self._named_selection_index.remove(self._named_selections.pop(removal_name))
             self._grpc_client.log.debug(f"Named selection {removal_name} is successfully deleted.")
         except KeyError:
             self._grpc_client.log.warning(
@@ -925,6 +1256,7 @@ class Design(Component):
 
     @check_input_types
     @ensure_design_is_active
+    @bump_design_revision
     def delete_component(self, component: Union["Component", str]) -> None:
         """Delete a component (itself or its children).
 
@@ -949,6 +1281,7 @@ class Design(Component):
         else:
             return super().delete_component(component)
 
+    @bump_design_revision
     def set_shared_topology(self, share_type: SharedTopologyType) -> None:
         """Set the shared topology to apply to the component.
 
@@ -1058,10 +1391,85 @@ class Design(Component):
 
         # Update the design in place. This method is computationally expensive,
         # consider finding a more efficient approach.
-        self._update_design_inplace()
+        self._sync_parameters()
 
         return response.get("status")
 
+    @check_input_types
+    @min_backend_version(25, 1, 0)
+    def set_parameters(self, dimensions: list[Parameter]) -> list[ParameterUpdateStatus]:
+        """Set or update several parameters of the design at once.
+
+        All parameters are sent in a single request and the design is synchronized
+        with the server once afterwards, instead of once per parameter.
+
+        Parameters
+        ----------
+        dimensions : list[Parameter]
+            Parameters to set.
+
+        Returns
+        -------
+        list[ParameterUpdateStatus]
+            Status of the update operation of each parameter, in the same order
+            as ``dimensions``.
+
+        Warnings
+        --------
+        This method is only available starting on Ansys release 25R1.
+        """
+        if not dimensions:
+            return []
+
+        response = self._grpc_client._services.driving_dimensions.set_parameters(
+            driving_dimensions=dimensions
+        )
+
+        # Update the design in place once for all the parameters
+        self._sync_parameters()
+
+        return response.get("statuses")
+
+    @contextmanager
+    def suspend_sync(self) -> Generator["Design", None, None]:
+        """Suspend the synchronization of the design with the server.
+
+        ``set_parameter()`` and ``set_parameters()`` normally reread the design after
+        each call. Within this context, these updates are deferred and the design is
+        read again once on exit.
+
+        Other operations that modify the design on the server, such as the repair and
+        prepare tools, still update the design immediately, because they return the
+        entities they created. Such an update also applies the pending parameter
+        changes.
+
+        Yields
+        ------
+        Design
+            This design.
+
+        Warnings
+        --------
+        The bodies, components and named selections of the design are not updated
+        after setting parameters within the context, so they may be out of date until
+        it exits.
+
+        Examples
+        --------
+        Apply a design-of-experiments variant and synchronize the design once.
+
+        >>> with design.suspend_sync():
+        ...     design.set_parameters(parameters)
+        ...     design.set_parameter(other_parameter)
+        """
+        self._sync_suspended += 1
+        try:
+            yield self
+        finally:
+            self._sync_suspended -= 1
+            if not self._sync_suspended and self._sync_pending:
+                self._update_design_inplace()
+
     @check_input_types
     @ensure_design_is_active
     def add_midsurface_thickness(
@@ -1164,6 +1572,7 @@ class Design(Component):
     @check_input_types
     @ensure_design_is_active
     @min_backend_version(24, 2, 0)
+    @bump_design_revision
     def insert_file(
         self,
         file_location: Path | str,
@@ -1247,7 +1656,9 @@ class Design(Component):
         tess_options : TessellationOptions, optional
             Options for the tessellation. If None, default options are used.
         reset_cache : bool, default: False
-            Whether to reset the cache before performing the tessellation.
+            Whether to reset the cache before performing the tessellation. The cache
+            is always reset when the revision of the design has changed since the
+            tessellation was cached.
         include_faces : bool, default: True
             Whether to include faces in the tessellation.
         include_edges : bool, default: False
@@ -1265,16 +1676,185 @@ class Design(Component):
 
         self._grpc_client.log.debug(f"Requesting tessellation for design {self.id}.")
 
-        # cache tessellation
-        if not self._design_tess or reset_cache:
+        # cache tessellation, until the design changes
+        if not self._design_tess or reset_cache or self._design_tess_revision != self._revision:
             response = self._grpc_client.services.designs.stream_design_tessellation(
                 options=tess_options, include_faces=include_faces, include_edges=include_edges
             )
 
             self._design_tess = response.get("tessellation")
+            self._design_tess_revision = self._revision
 
         return self._design_tess
 
+    @min_backend_version(26, 1, 0)
+    @check_input_types
+    @ensure_design_is_active
+    def get_instanced_tessellation(
+        self,
+        tess_options: TessellationOptions | None = None,
+        reset_cache: bool = False,
+        include_faces: bool = True,
+        include_edges: bool = False,
+    ) -> InstancedTessellation:
+        """Tessellate the design once per master body.
+
+        Body occurrences that share a ``MasterBody``, such as the bodies of the
+        instances of a component, are represented by the mesh of the master body
+        and their transformation to world space. The mesh of each master body is
+        requested once, whatever the number of its occurrences.
+
+        Parameters
+        ----------
+        tess_options : TessellationOptions, optional
+            Options for the tessellation. If None, default options are used.
+        reset_cache : bool, default: False
+            Whether to reset the tessellation cache of the master bodies before
+            performing the tessellation.
+        include_faces : bool, default: True
+            Whether to include faces in the tessellation.
+        include_edges : bool, default: False
+            Whether to include edges in the tessellation.
+
+        Returns
+        -------
+        InstancedTessellation
+            Meshes of the master bodies and placements of the body occurrences.
+        """
+        tessellation = InstancedTessellation._from_bodies(
+            self.get_all_bodies(), tess_options, reset_cache, include_faces, include_edges
+        )
+
+        self._grpc_client.log.debug(
+            f"Tessellated {len(tessellation.instances)} bodies from "
+            f"{len(tessellation.meshes)} master bodies."
+        )
+
+        return tessellation
+
+    @ensure_design_is_active
+    def topology_table(self) -> TopologyTable:
+        """Get the faces, edges and vertices of all bodies in the design as arrays.
+
+        The ids, owning bodies, types, areas, lengths and bounding boxes of the
+        entities are retrieved in a few bulk requests, without creating a ``Face``,
+        ``Edge`` or ``Vertex`` object for each of them.
+
+        Returns
+        -------
+        TopologyTable
+            Columnar snapshot of the topology of the design.
+
+        Notes
+        -----
+        The table is a snapshot: it is not updated when the design is modified.
+        Use the ``TopologyTable.save()`` method to keep it for later sessions.
+        """
+        body_ids = [body.id for body in self.get_all_bodies()]
+        services = self._grpc_client.services
+        self._grpc_client.log.debug(f"Requesting topology of {len(body_ids)} bodies.")
+
+        bodies = services.bodies.get_topology(ids=body_ids).get("bodies") if body_ids else []
+        face_ids = [face["id"] for body in bodies for face in body["faces"]]
+        edge_ids = [edge["id"] for body in bodies for edge in body["edges"]]
+        faces = services.faces.get_properties(ids=face_ids).get("faces") if face_ids else []
+        edges = services.edges.get_properties(ids=edge_ids).get("edges") if edge_ids else []
+
+        return TopologyTable._from_service_data(bodies, faces, edges)
+
+    @ensure_design_is_active
+    def get_bounding_boxes(
+        self, objects: list[Body | Face | Edge] | None = None
+    ) -> BoundingBoxArray:
+        """Get the bounding boxes of bodies, faces or edges as a single array.
+
+        The bounding boxes are retrieved in bulk, with one request per kind of
+        object, and without creating a ``BoundingBox`` object per box.
+
+        Parameters
+        ----------
+        objects : list[Body | Face | Edge], default: None
+            Objects to get the bounding boxes of. If ``None``, the bounding boxes of
+            all the bodies of the design are retrieved.
+
+        Returns
+        -------
+        BoundingBoxArray
+            Bounding boxes of the objects, in the same order as the objects.
+        """
+        objects = self.get_all_bodies() if objects is None else objects
+        self._grpc_client.log.debug(f"Requesting bounding boxes of {len(objects)} objects.")
+        return BoundingBoxArray.from_corners(*get_bounding_box_corners(objects))
+
+    @ensure_design_is_active
+    def get_bounding_box_index(
+        self, objects: list[Body | Face | Edge] | None = None
+    ) -> BoundingBoxIndex:
+        """Get a spatial index over the bounding boxes of bodies, faces or edges.
+
+        The bounding boxes are retrieved in bulk, with one request per kind of
+        object. The index finds the objects near a point, along a ray or
+        overlapping a box on the client, so that only those objects need to be
+        queried on the server.
+
+        Parameters
+        ----------
+        objects : list[Body | Face | Edge], default: None
+            Objects to index. If ``None``, all the bodies of the design are indexed.
+
+        Returns
+        -------
+        BoundingBoxIndex
+            Index over the bounding boxes, whose items are the objects.
+
+        Notes
+        -----
+        The index is a snapshot: it is not updated when the design is modified.
+        """
+        objects = self.get_all_bodies() if objects is None else list(objects)
+        return self.get_bounding_boxes(objects).to_index(items=objects)
+
+    @min_backend_version(24, 2, 0)
+    @ensure_design_is_active
+    def get_collisions(
+        self, bodies: list[Body] | None = None
+    ) -> list[tuple[Body, Body, CollisionType]]:
+        """Get the collision state of every pair of bodies that collide.
+
+        The bounding boxes of the bodies are retrieved in bulk first, and only the
+        pairs of bodies whose bounding boxes overlap are checked on the server, with
+        the ``Body.get_collision()`` method.
+
+        Parameters
+        ----------
+        bodies : list[Body], default: None
+            Bodies to check. If ``None``, all the bodies of the design are checked.
+
+        Returns
+        -------
+        list[tuple[Body, Body, CollisionType]]
+            Pairs of bodies whose collision state is not ``CollisionType.NONE``,
+            with their collision state.
+
+        Warnings
+        --------
+        This method is only available starting on Ansys release 24R2.
+        """
+        index = self.get_bounding_box_index(self.get_all_bodies() if bodies is None else bodies)
+        firsts, seconds = index.overlapping_pairs()
+        self._grpc_client.log.debug(
+            f"Checking collisions of {len(firsts)} of the "
+            f"{len(index) * (len(index) - 1) // 2} pairs of bodies."
+        )
+
+        collisions = []
+        for first, second in zip(firsts, seconds):
+            body, other = index.items[first], index.items[second]
+            collision = body.get_collision(other)
+            if collision is not CollisionType.NONE:
+                collisions.append((body, other, collision))
+        return collisions
+
     def __repr__(self) -> str:
         """Represent the ``Design`` as a string."""
         alive_bodies = [1 if body.is_alive else 0 for body in self.bodies]
@@ -1339,7 +1919,25 @@ class Design(Component):
             self._name = design_response.get("name")
             self._activate(called_after_design_creation=True)
 
-        response = self._grpc_client.services.designs.get_assembly(active_design=design_response)
+        # Older backends provide datum planes and design curves through separate requests.
+        # They do not depend on the assembly, so they are retrieved while it is read.
+        backend_version = self._grpc_client.backend_version
+        retrieve_separately = backend_version >= (25, 2, 0) and (
+            backend_version < (27, 1, 0)
+            or self._grpc_client.services.version == GeometryApiProtos.V0
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if retrieve_separately:
+                planes_request = executor.submit(
+                    self._grpc_client.services.planes.get_all, parent_id=self.id
+                )
+                curves_request = executor.submit(
+                    self._grpc_client.services.curves.get_all, parent_id="parts/" + self.id
+                )
+
+            response = self._grpc_client.services.designs.get_assembly(
+                active_design=design_response
+            )
 
         # Store created objects
         created_parts = {
@@ -1390,8 +1988,146 @@ class Design(Component):
             part.bodies.append(tb)
             created_bodies[body.get("id")] = tb
 
-        # Create Materials
-        for material in response.get("materials"):
+        # Materials, beams, named selections and coordinate systems are not needed to
+        # build the design tree. They are created the first time they are accessed.
+        # Their data is turned into lists, since some services return one-shot generators
+        # that also keep the whole response alive, and a failed section is retried from
+        # its first item.
+        self._pending_sections = {
+            "materials": partial(self.__read_materials, list(response.get("materials"))),
+            "beams": partial(self.__read_beams, list(response.get("beams"))),
+            "named_selections": partial(
+                self.__read_named_selections, list(response.get("named_selections"))
+            ),
+            "coordinate_systems": partial(
+                self.__read_coordinate_systems, list(response.get("component_coordinate_systems"))
+            ),
+        }
+
+        # Create DesignPoints
+        for dp in response.get("design_points"):
+            created_dp = DesignPoint(
+                dp.get("id"),
+                dp.get("name"),
+                dp.get("point"),
+                created_components.get(dp.get("parent_id"), self),
+            )
+
+            # Append the design point to the component to which it belongs
+            created_dp.parent_component._design_points.append(created_dp)
+
+        # Create DatumPlanes - different retrieval methods based on backends for best compatibility
+        planes = []
+        if backend_version < (25, 2, 0):
+            self._grpc_client.log.debug(
+                "Backend version does not support datum planes. Skipping datum plane creation."
+            )
+        elif retrieve_separately:
+            planes = planes_request.result().get("planes", [])
+        else:
+            planes = response.get("datum_planes", [])
+
+        for dp in planes:
+            created_dp = DatumPlane(
+                dp.get("id"),
+                dp.get("name"),
+                dp.get("plane"),
+                created_components.get(dp.get("parent_id"), self),
+            )
+
+            # Append the datum plane to the component to which it belongs
+            created_dp.parent_component._datum_planes.append(created_dp)
+
+        # Create DesignCurves - different retrieval methods based on backends for best compatibility
+        curves = []
+        if backend_version < (25, 2, 0):
+            self._grpc_client.log.debug(
+                "Backend version does not support design curves. Skipping design curve creation."
+            )
+        elif retrieve_separately:
+            curves = curves_request.result().get("curves", [])
+        else:
+            curves = response.get("design_curves", [])
+
+        for dc in curves:
+            created_dc = DesignCurve(
+                dc.get("id"),
+                dc.get("name"),
+                dc.get("length"),
+                dc.get("start"),
+                dc.get("end"),
+                self._grpc_client,
+                created_components.get(dc.get("parent_id"), self),
+            )
+
+            # Append the design curve to the component to which it belongs
+            created_dc.parent_component._design_curves.append(created_dc)
+
+        # Create Datum Points
+        for dp in response.get("datum_points"):
+            created_dp = DatumPoint(
+                dp.get("id"),
+                dp.get("name"),
+                dp.get("point"),
+                created_components.get(dp.get("parent_id"), self),
+            )
+
+            # Append the datum point to the component to which it belongs
+            created_dp.parent_component._datum_points.append(created_dp)
+
+        # Create Datum Lines - only available for 27r1 and later
+        if self._grpc_client.backend_version >= (27, 1, 0):
+            for dl in response.get("datum_lines", []):
+                created_dl = DatumLine(
+                    dl.get("id"),
+                    dl.get("name"),
+                    dl.get("line"),
+                    created_components.get(dl.get("parent_id"), self),
+                )
+
+                # Append the datum line to the component to which it belongs
+                created_dl.parent_component._datum_lines.append(created_dl)
+
+        end = time.time()
+
+        # Set SharedTopology
+        # TODO: Maybe just add it to Component or Part message
+        # we're starting to iterate through all the Components too much.
+        # Make sure design doesn't need edge case attention
+        # https://github.com/ansys/pyansys-geometry/issues/1319
+        num_created_shared_topologies = 0
+        for cst in response.get("component_shared_topologies"):
+            component_id = cst.get("component_id")
+            shared_topology_type = cst.get("shared_topology_type")
+            component = created_components.get(component_id)
+            component._shared_topology = SharedTopologyType(shared_topology_type)
+            num_created_shared_topologies += 1
+
+        self._grpc_client.log.debug(f"Parts created: {len(created_parts)}")
+        self._grpc_client.log.debug(f"MasterComponents created: {len(created_tps) + 1}")
+        self._grpc_client.log.debug(f"Components created: {len(created_components)}")
+        self._grpc_client.log.debug(f"Bodies created: {len(created_bodies)}")
+        self._grpc_client.log.debug(f"SharedTopologyTypes set: {num_created_shared_topologies}")
+        self._grpc_client.log.debug(f"Design points created: {len(self.design_points)}")
+        self._grpc_client.log.debug(f"Datum planes created: {len(self.datum_planes)}")
+        self._grpc_client.log.debug(f"Design curves created: {len(self.design_curves)}")
+        self._grpc_client.log.debug(
+            f"Sections created on first access: {', '.join(self._pending_sections)}"
+        )
+
+        self._grpc_client.log.debug(f"\nSuccessfully read design in: {end - start} s")
+
+    def __read_materials(self, materials: list[dict]) -> None:
+        """Create the materials of an existing design read from the server.
+
+        Parameters
+        ----------
+        materials : list[dict]
+            Materials section of the assembly response.
+        """
+        # Nothing is attached to the design until the whole section is created
+        created_materials = []
+        for material in materials:
             properties = []
             density = Quantity(0)
             for property in material.get("material_properties"):
@@ -1433,11 +2169,23 @@ class Design(Component):
                         mp.quantity if isinstance(mp.quantity, Quantity) else Quantity(mp.quantity)
                     )
 
-            m = Material(material.get("name"), density, properties)
-            self.materials.append(m)
+            created_materials.append(Material(material.get("name"), density, properties))
+
+        self._materials.extend(created_materials)
+        self._grpc_client.log.debug(f"Materials created: {len(self._materials)}")
 
-        # Create Beams
-        for beam in response.get("beams"):
+    def __read_beams(self, beams: list[dict]) -> None:
+        """Create the beams of an existing design read from the server.
+
+        Parameters
+        ----------
+        beams : list[dict]
+            Beams section of the assembly response.
+        """
+        created_components = {comp.id: comp for comp in self._get_all_components()}
+        # Nothing is attached to the design until the whole section is created
+        created_beams = []
+        for beam in beams:
             cross_section = BeamCrossSectionInfo(
                 section_anchor=SectionAnchorType(beam.get("cross_section").get("section_anchor")),
                 section_angle=beam.get("cross_section").get("section_angle"),
@@ -1495,21 +2243,49 @@ class Design(Component):
 
             # Find the component to which the beam belongs
             parent = created_components.get(beam.get("parent.id"), self)
+            created_beams.append((parent, new_beam))
+
+        for parent, new_beam in created_beams:
             parent._beams.append(new_beam)
 
-        # Create NamedSelections
-        for ns in response.get("named_selections"):
-            new_ns = NamedSelection(
+        self._grpc_client.log.debug(f"Beams created: {len(created_beams)}")
+
+    def __read_named_selections(self, named_selections: list[dict]) -> None:
+        """Create the named selections of an existing design read from the server.
+
+        Parameters
+        ----------
+        named_selections : list[dict]
+            Named selections section of the assembly response.
+        """
+        # Nothing is attached to the design until the whole section is created
+        created_named_selections = [
+            NamedSelection(
                 ns.get("name"),
                 self,
                 self._grpc_client,
                 preexisting_id=ns.get("id"),
             )
+            for ns in named_selections
+        ]
+        for new_ns in created_named_selections:
             self._named_selections[new_ns.name] = new_ns
+            self._named_selection_index.add(new_ns)
 
-        # Create CoordinateSystems
-        num_created_coord_systems = 0
-        for ccs in response.get("component_coordinate_systems"):
+        self._grpc_client.log.debug(f"NamedSelections created: {len(self._named_selections)}")
+
+    def __read_coordinate_systems(self, component_coordinate_systems: list[dict]) -> None:
+        """Create the coordinate systems of an existing design read from the server.
+
+        Parameters
+        ----------
+        component_coordinate_systems : list[dict]
+            Coordinate systems section of the assembly response, grouped by component.
+        """
+        created_components = {comp.id: comp for comp in self._get_all_components()}
+        # Nothing is attached to the design until the whole section is created
+        created_coord_systems = []
+        for ccs in component_coordinate_systems:
             component_id = ccs.get("component_id")
             component = created_components.get(component_id)
             coordinate_systems = ccs.get("coordinate_systems")
@@ -1518,130 +2294,92 @@ class Design(Component):
                 new_cs = CoordinateSystem(
                     cs.get("name"), frame, component, self._grpc_client, cs.get("id")
                 )
-                component.coordinate_systems.append(new_cs)
-                num_created_coord_systems += 1
-
-        # Create DesignPoints
-        for dp in response.get("design_points"):
-            created_dp = DesignPoint(
-                dp.get("id"),
-                dp.get("name"),
-                dp.get("point"),
-                created_components.get(dp.get("parent_id"), self),
-            )
-
-            # Append the design point to the component to which it belongs
-            created_dp.parent_component._design_points.append(created_dp)
-
-        # Create DatumPlanes - different retrieval methods based on backends for best compatibility
-        planes = []
-        if self._grpc_client.backend_version < (25, 2, 0):
-            self._grpc_client.log.debug(
-                "Backend version does not support datum planes. Skipping datum plane creation."
-            )
-        elif (
-            self._grpc_client.backend_version < (27, 1, 0)
-            or self._grpc_client.services.version == GeometryApiProtos.V0
-        ):
-            planes = self._grpc_client.services.planes.get_all(parent_id=self.id).get("planes", [])
-        else:
-            planes = response.get("datum_planes", [])
+                created_coord_systems.append((component, new_cs))
 
-        for dp in planes:
-            created_dp = DatumPlane(
-                dp.get("id"),
-                dp.get("name"),
-                dp.get("plane"),
-                created_components.get(dp.get("parent_id"), self),
-            )
+        for component, new_cs in created_coord_systems:
+            component._coordinate_systems.append(new_cs)
 
-            # Append the datum plane to the component to which it belongs
-            created_dp.parent_component._datum_planes.append(created_dp)
+        self._grpc_client.log.debug(f"CoordinateSystems created: {len(created_coord_systems)}")
 
-        # Create DesignCurves - different retrieval methods based on backends for best compatibility
-        curves = []
-        if self._grpc_client.backend_version < (25, 2, 0):
-            self._grpc_client.log.debug(
-                "Backend version does not support design curves. Skipping design curve creation."
-            )
-        elif (
-            self._grpc_client.backend_version < (27, 1, 0)
-            or self._grpc_client.services.version == GeometryApiProtos.V0
-        ):
-            curves = self._grpc_client.services.curves.get_all(parent_id="parts/" + self.id).get(
-                "curves", []
-            )
-        else:
-            curves = response.get("design_curves", [])
+    def _get_named_selections_containing(self, kind: str, entity_id: str) -> list[NamedSelection]:
+        """Get the named selections that contain an entity of the design.
 
-        for dc in curves:
-            created_dc = DesignCurve(
-                dc.get("id"),
-                dc.get("name"),
-                dc.get("length"),
-                dc.get("start"),
-                dc.get("end"),
-                self._grpc_client,
-                created_components.get(dc.get("parent_id"), self),
-            )
-
-            # Append the design curve to the component to which it belongs
-            created_dc.parent_component._design_curves.append(created_dc)
-
-        # Create Datum Points
-        for dp in response.get("datum_points"):
-            created_dp = DatumPoint(
-                dp.get("id"),
-                dp.get("name"),
-                dp.get("point"),
-                created_components.get(dp.get("parent_id"), self),
-            )
+        Parameters
+        ----------
+        kind : str
+            Kind of the entity, such as ``"bodies"`` or ``"faces"``.
+        entity_id : str
+            ID of the entity.
 
-            # Append the datum point to the component to which it belongs
-            created_dp.parent_component._datum_points.append(created_dp)
+        Returns
+        -------
+        list[NamedSelection]
+            Named selections that contain the entity.
 
-        # Create Datum Lines - only available for 27r1 and later
-        if self._grpc_client.backend_version >= (27, 1, 0):
-            for dl in response.get("datum_lines", []):
-                created_dl = DatumLine(
-                    dl.get("id"),
-                    dl.get("name"),
-                    dl.get("line"),
-                    created_components.get(dl.get("parent_id"), self),
-                )
+        Notes
+        -----
+        The lookup uses a reverse index that is kept up to date when named selections
+        are created, modified or deleted, instead of reading the members of every
+        named selection.
+        """
+        self._hydrate("named_selections")
+        return self._named_selection_index.get(kind, entity_id)
 
-                # Append the datum line to the component to which it belongs
-                created_dl.parent_component._datum_lines.append(created_dl)
+    def _get_entities_from_ids(
+        self, kind: str, ids: list[str]
+    ) -> list[Union["Body", "Face", "Edge"]]:
+        """Get the bodies, faces or edges of the design from their ids.
 
-        end = time.time()
+        Parameters
+        ----------
+        kind : str
+            Kind of the entities, that is ``"bodies"``, ``"faces"`` or ``"edges"``.
+        ids : list[str]
+            IDs of the entities.
 
-        # Set SharedTopology
-        # TODO: Maybe just add it to Component or Part message
-        # we're starting to iterate through all the Components too much.
-        # Make sure design doesn't need edge case attention
-        # https://github.com/ansys/pyansys-geometry/issues/1319
-        num_created_shared_topologies = 0
-        for cst in response.get("component_shared_topologies"):
-            component_id = cst.get("component_id")
-            shared_topology_type = cst.get("shared_topology_type")
-            component = created_components.get(component_id)
-            component._shared_topology = SharedTopologyType(shared_topology_type)
-            num_created_shared_topologies += 1
+        Returns
+        -------
+        list[Body] | list[Face] | list[Edge]
+            Entities found, in the order of the ids. Missing ids are skipped.
 
-        self._grpc_client.log.debug(f"Parts created: {len(created_parts)}")
-        self._grpc_client.log.debug(f"MasterComponents created: {len(created_tps) + 1}")
-        self._grpc_client.log.debug(f"Components created: {len(created_components)}")
-        self._grpc_client.log.debug(f"Bodies created: {len(created_bodies)}")
-        self._grpc_client.log.debug(f"Materials created: {len(self.materials)}")
-        self._grpc_client.log.debug(f"NamedSelections created: {len(self.named_selections)}")
-        self._grpc_client.log.debug(f"CoordinateSystems created: {num_created_coord_systems}")
-        self._grpc_client.log.debug(f"SharedTopologyTypes set: {num_created_shared_topologies}")
-        self._grpc_client.log.debug(f"Beams created: {len(self.beams)}")
-        self._grpc_client.log.debug(f"Design points created: {len(self.design_points)}")
-        self._grpc_client.log.debug(f"Datum planes created: {len(self.datum_planes)}")
-        self._grpc_client.log.debug(f"Design curves created: {len(self.design_curves)}")
+        Notes
+        -----
+        The entities are looked up in a map of the whole design, which is kept for
+        the current revision. The map is built again if one of the ids is missing or
+        if the body of one of the entities was deleted or modified since then.
+        """
+        if not ids:
+            return []
 
-        self._grpc_client.log.debug(f"\nSuccessfully read design in: {end - start} s")
+        revision, entity_map = self._entity_maps.get(kind, (None, {}))
+        if revision != self._revision or not all(
+            self.__is_mapped(entity_map.get(entity_id)) for entity_id in ids
+        ):
+            entity_map = {}
+            for body in self.get_all_bodies():
+                body_revision = body._template._geometry_revision
+                for entity in [body] if kind == "bodies" else getattr(body, kind):
+                    entity_map[entity.id] = (entity, body, body_revision)
+            self._entity_maps[kind] = (self._revision, entity_map)
+
+        return [entity_map[entity_id][0] for entity_id in ids if entity_id in entity_map]
+
+    @staticmethod
+    def __is_mapped(entry: tuple | None) -> bool:
+        """Check whether an entry of an entity map is still up to date."""
+        if entry is None:
+            return False
+        _, body, body_revision = entry
+        return body.is_alive and body._template._geometry_revision == body_revision
+
+    def _sync_parameters(self) -> None:
+        """Update the design after setting parameters, unless the synchronization is suspended."""
+        if self._sync_suspended:
+            # The cached data is no longer valid, even though the design is read later
+            self._bump_revision()
+            self._sync_pending = True
+        else:
+            self._update_design_inplace()
 
     def _update_design_inplace(self) -> None:
         """Update the design to align with the server side.
@@ -1651,6 +2389,9 @@ class Design(Component):
         This method is used to update the design inside repair tools.
         Its usage is not recommended for other purposes.
         """
+        self._bump_revision()
+        self._sync_pending = False
+
         # Clear all the existing information
         #
         # TODO: This might go out of sync with the __read_existing_design method
@@ -1662,6 +2403,7 @@ class Design(Component):
         self._clear_cached_bodies()
         self._materials = []
         self._named_selections = {}
+        self._named_selection_index = _NamedSelectionIndex()
         self._coordinate_systems = []
         self._datum_planes = []
         self._datum_points = []
@@ -1685,10 +2427,21 @@ class Design(Component):
             including parts, components, bodies, faces, edges, and other geometry entities.
             Processing order: parts → components → bodies → deletions (reverse dependency order).
         """
+        # The pending parameter updates may have changed any entity, so read the
+        # whole design, which also covers the tracked changes
+        if self._sync_pending:
+            self._update_design_inplace()
+            return
+
+        self._bump_revision()
+
         self._grpc_client.log.debug(
             f"Starting _update_from_tracker with response: {tracker_response}"
         )
 
+        # The server may have changed the members of the named selections
+        self._named_selection_index.invalidate()
+
         # Track created entities for use in subsequent steps
         created_parts_dict = {}
         created_master_components_dict = {}
@@ -1897,6 +2650,59 @@ class Design(Component):
                     if self._find_and_remove_body(body_info, component):
                         break
 
+        # ================== HANDLE FACES AND EDGES ==================
+
+        self._reset_changed_bodies(tracker_response)
+
+    def _reset_changed_bodies(self, tracker_response: dict) -> bool:
+        """Reset the cached data of the bodies touched by a tracker response.
+
+        Only the bodies whose tessellation or topology references a modified or
+        deleted face or edge, or that are reported as modified themselves, are
+        reset. Bodies with nothing cached are skipped without any server call.
+
+        Parameters
+        ----------
+        tracker_response : dict
+            Dictionary containing lists of created, modified, and deleted entities,
+            as returned by the tracked responses of the server.
+
+        Returns
+        -------
+        bool
+            ``True`` if the response reports any modified body, face or edge.
+        """
+        body_ids = {body["id"] for body in tracker_response.get("modified_bodies", [])}
+        entity_ids = {
+            entity["id"]
+            for key in ("modified_faces", "deleted_faces", "modified_edges", "deleted_edges")
+            for entity in tracker_response.get(key, [])
+        }
+        if not body_ids and not entity_ids:
+            return False
+
+        self._bump_revision()
+        for body in self.get_all_bodies():
+            master = body._template
+            if (
+                master._tessellation is None
+                and master._raw_tessellation is None
+                and not master._topology
+            ):
+                continue
+
+            if body.id in body_ids or master.id in body_ids:
+                body._reset_tessellation_cache()
+                continue
+
+            cached_ids = set(master._tessellation or ()) | set(master._raw_tessellation or ())
+            for _, entities in master._topology.values():
+                cached_ids.update(entity.id for entity in entities)
+            if not entity_ids.isdisjoint(cached_ids):
+                body._reset_tessellation_cache()
+
+        return True
+
     # ================== HELPER METHODS ==================
     #
     # Processing order for tracker updates:
@@ -2112,6 +2918,7 @@ class Design(Component):
         existing_body.name = body_info["name"]
         existing_body._template._is_surface = body_info.get("is_surface", False)
         existing_body._template._is_lightweight = body_info.get("is_lightweight", False)
+        existing_body._reset_tessellation_cache()
 
     def _find_and_add_body(
         self,
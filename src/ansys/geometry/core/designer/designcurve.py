@@ -78,6 +78,7 @@ class DesignCurve:
         self._end = end
         self._grpc_client = grpc_client
         self._parent_component = parent_component
+        self._design_ref = parent_component._design_ref
         self._is_alive = True
         self._shape = None
 
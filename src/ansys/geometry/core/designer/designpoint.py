@@ -86,12 +86,9 @@ class DesignPoint:
         list[NamedSelection]
             List of named selections that contain this design point.
         """
-        included_ns = []
-        for ns in get_design_from_component(self.parent_component).named_selections:
-            if any(dp.id == self.id for dp in ns.design_points):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_component(self.parent_component)._get_named_selections_containing(
+            "design_points", self.id
+        )
 
     def __repr__(self) -> str:
         """Represent the design points as a string."""
@@ -32,6 +32,7 @@ from ansys.geometry.core.errors import GeometryRuntimeError
 from ansys.geometry.core.math.bbox import BoundingBox
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.misc.auxiliary import get_design_from_body
+from ansys.geometry.core.misc.cache import _CachedShapeMixin
 from ansys.geometry.core.misc.checks import ensure_design_is_active, min_backend_version
 from ansys.geometry.core.shapes.curves.trimmed_curve import ReversedTrimmedCurve, TrimmedCurve
 from ansys.geometry.core.shapes.parameterization import Interval
@@ -57,7 +58,7 @@ class CurveType(Enum):
     CURVETYPE_SPLINECURVE = 7
 
 
-class Edge:
+class Edge(_CachedShapeMixin):
     """Represents a single edge of a body within the design assembly.
 
     This class synchronizes to a design within a supporting Geometry service instance.
@@ -76,6 +77,16 @@ class Edge:
         Direction of the edge.
     """
 
+    _shape_kind = "edge"
+
+    __slots__ = (
+        "_id",
+        "_curve_type",
+        "_body",
+        "_grpc_client",
+        "_is_reversed",
+    )
+
     def __init__(
         self,
         id: str,
@@ -90,7 +101,9 @@ class Edge:
         self._body = body
         self._grpc_client = grpc_client
         self._is_reversed = is_reversed
+        # Cached data is tagged with the revision of the design it was retrieved at
         self._shape = None
+        self._shape_revision = None
 
     def __eq__(self, other: "Edge") -> bool:
         """Return ``True`` when both edges share the same ID."""
@@ -131,26 +144,23 @@ class Edge:
         --------
         This method is only available starting on Ansys release 24R2.
         """
-        if self._shape is None:
+        if self._get_cached_shape() is None:
             self._grpc_client.log.debug("Requesting edge properties from server.")
-            geometry = self._grpc_client.services.edges.get_curve(id=self._id).get("curve")
-
-            response = self._grpc_client.services.edges.get_start_and_end_points(id=self._id)
-            start = response.get("start")
-            end = response.get("end")
-
-            length = self._grpc_client.services.edges.get_length(id=self._id).get("length")
-
-            response = self._grpc_client.services.edges.get_interval(id=self._id)
-            interval = Interval(response.get("start"), response.get("end"))
-
-            self._shape = (
-                ReversedTrimmedCurve(geometry, start, end, interval, length.value)
-                if self.is_reversed
-                else TrimmedCurve(geometry, start, end, interval, length.value)
-            )
+            response = self._grpc_client.services.edges.get_geometry(ids=[self._id])
+            self._cache_shape(self._build_shape(response.get("edges")[0]))
         return self._shape
 
+    def _build_shape(self, geometry: dict) -> TrimmedCurve:
+        """Build the trimmed curve of the edge from its geometry, as sent by the server."""
+        shape_class = ReversedTrimmedCurve if self.is_reversed else TrimmedCurve
+        return shape_class(
+            geometry.get("curve"),
+            geometry.get("start"),
+            geometry.get("end"),
+            Interval(*geometry.get("interval")),
+            geometry.get("length").value,
+        )
+
     @property
     @ensure_design_is_active
     def length(self) -> Quantity:
@@ -281,9 +291,4 @@ class Edge:
         list[NamedSelection]
             List of named selections that include the edge.
         """
-        included_ns = []
-        for ns in get_design_from_body(self.body).named_selections:
-            if any(edge.id == self.id for edge in ns.edges):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_body(self.body)._get_named_selections_containing("edges", self.id)
@@ -44,6 +44,7 @@ from ansys.geometry.core.misc.auxiliary import (
     get_design_from_body,
     get_design_from_face,
 )
+from ansys.geometry.core.misc.cache import _CachedShapeMixin
 from ansys.geometry.core.misc.checks import (
     check_input_types,
     ensure_design_is_active,
@@ -111,6 +112,8 @@ class FaceLoop:
     intended to be instantiated by a user.
     """
 
+    __slots__ = ("_type", "_length", "_min_bbox", "_max_bbox", "_edges")
+
     def __init__(
         self,
         type: FaceLoopType,
@@ -152,7 +155,7 @@ class FaceLoop:
         return self._edges
 
 
-class Face:
+class Face(_CachedShapeMixin):
     """Represents a single face of a body within the design assembly.
 
     This class synchronizes to a design within a supporting Geometry service instance.
@@ -169,6 +172,18 @@ class Face:
         Active supporting Geometry service instance for design modeling.
     """
 
+    _shape_kind = "face"
+
+    __slots__ = (
+        "_id",
+        "_surface_type",
+        "_body",
+        "_grpc_client",
+        "_is_reversed",
+        "_color",
+        "_color_revision",
+    )
+
     def __init__(
         self,
         id: str,
@@ -183,8 +198,11 @@ class Face:
         self._body = body
         self._grpc_client = grpc_client
         self._is_reversed = is_reversed
+        # Cached data is tagged with the revision of the design it was retrieved at
         self._shape = None
+        self._shape_revision = None
         self._color = None
+        self._color_revision = None
 
     def __eq__(self, other: "Face") -> bool:
         """Return ``True`` when both faces share the same ID."""
@@ -224,23 +242,24 @@ class Face:
         --------
         This method is only available starting on Ansys release 24R2.
         """
-        if self._shape is None:
+        if self._get_cached_shape() is None:
             self._grpc_client.log.debug("Requesting face properties from server.")
-
-            geometry = self._grpc_client.services.faces.get_surface(
-                id=self.id, surface_type=self.surface_type
-            ).get("surface")
-            response = self._grpc_client.services.faces.get_box_uv(id=self.id).get("uv_box")
-            u_comp, v_comp = response.get("u"), response.get("v")
-            box_uv = BoxUV(Interval(*u_comp), Interval(*v_comp))
-
-            self._shape = (
-                ReversedTrimmedSurface(geometry, box_uv)
-                if self.is_reversed
-                else TrimmedSurface(geometry, box_uv)
+            response = self._grpc_client.services.faces.get_geometry(
+                ids=[self.id], surface_types=[self.surface_type]
             )
+            self._cache_shape(self._build_shape(response.get("faces")[0]))
         return self._shape
 
+    def _build_shape(self, geometry: dict) -> TrimmedSurface:
+        """Build the trimmed surface of the face from its geometry, as sent by the server."""
+        uv_box = geometry.get("uv_box")
+        box_uv = BoxUV(Interval(*uv_box.get("u")), Interval(*uv_box.get("v")))
+        return (
+            ReversedTrimmedSurface(geometry.get("surface"), box_uv)
+            if self.is_reversed
+            else TrimmedSurface(geometry.get("surface"), box_uv)
+        )
+
     @property
     def surface_type(self) -> SurfaceType:
         """Surface type of the face."""
@@ -330,9 +349,11 @@ class Face:
         --------
         This method is only available starting on Ansys release 25R2.
         """
-        if self._color is None and self.body.is_alive:
+        revision = self._design_revision()
+        if (self._color is None or self._color_revision != revision) and self.body.is_alive:
             # Assigning default value first
             self._color = DEFAULT_COLOR
+            self._color_revision = revision
 
             # If color is not cached, retrieve from the server
             response = self._grpc_client.services.faces.get_color(id=self.id)
@@ -420,6 +441,7 @@ class Face:
         response = self._grpc_client.services.faces.set_color(id=self.id, color=color)
         if response.get("success"):
             self._color = color
+            self._color_revision = self._design_revision()
         else:  # pragma: no cover
             raise GeometryRuntimeError(f"Failed to set color {color} for face {self.id}. ")
 
@@ -588,12 +610,7 @@ class Face:
         list[NamedSelection]
             List of named selections that include the edge.
         """
-        included_ns = []
-        for ns in get_design_from_body(self.body).named_selections:
-            if any(face.id == self.id for face in ns.faces):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_body(self.body)._get_named_selections_containing("faces", self.id)
 
     @graphics_required
     def tessellate(self, tess_options: TessellationOptions | None = None) -> "pv.PolyData":
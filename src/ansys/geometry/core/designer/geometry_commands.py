@@ -178,6 +178,53 @@ class GeometryCommands:
             )
         self._grpc_client = grpc_client
 
+    def _reset_changed_bodies(self, selection: list, result: dict | None) -> None:
+        """Reset the cached data of the bodies affected by a command.
+
+        The bodies owning the selected entities are always reset. Any other body
+        reported by the tracked changes of the command, such as one sharing a
+        modified face or edge, is reset as well. Named selections and components
+        only invalidate the whole design when no tracked changes are available.
+
+        This method is also called when the command fails, since the server may
+        have partially changed the selected entities.
+
+        Parameters
+        ----------
+        selection : list
+            Entities the command acted on.
+        result : dict | None
+            Response of the command, optionally holding its tracked changes, or
+            ``None`` if the command failed.
+        """
+        from ansys.geometry.core.designer.body import Body
+
+        design = None
+        reset_all = False
+        for entity in selection:
+            if isinstance(entity, NamedSelection):
+                design = entity._design
+                reset_all = True
+            elif isinstance(entity, Component):
+                design = get_design_from_component(entity)
+                reset_all = True
+            else:
+                body = entity if isinstance(entity, Body) else entity.body
+                body._reset_tessellation_cache()
+                design = design or get_design_from_body(body)
+
+        if design is None:
+            return
+
+        tracked_response = result.get("tracked_response") if result else None
+        if tracked_response and design._reset_changed_bodies(tracked_response):
+            return
+
+        if reset_all:
+            design._bump_revision()
+            for body in design.get_all_bodies():
+                body._reset_tessellation_cache()
+
     @min_backend_version(25, 2, 0)
     def chamfer(
         self,
@@ -212,13 +259,14 @@ class GeometryCommands:
         # Convert the distance object
         distance = distance if isinstance(distance, Distance) else Distance(distance)
 
-        for ef in selection:
-            ef.body._reset_tessellation_cache()
-
-        result = self._grpc_client.services.model_tools.chamfer(
-            selection_ids=[ef.id for ef in selection],
-            distance=distance,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.model_tools.chamfer(
+                selection_ids=[ef.id for ef in selection],
+                distance=distance,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -256,13 +304,14 @@ class GeometryCommands:
         # Convert the radius object
         radius = radius if isinstance(radius, Distance) else Distance(radius)
 
-        for ef in selection:
-            ef.body._reset_tessellation_cache()
-
-        result = self._grpc_client.services.model_tools.fillet(
-            selection_ids=[ef.id for ef in selection],
-            radius=radius,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.model_tools.fillet(
+                selection_ids=[ef.id for ef in selection],
+                radius=radius,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -288,12 +337,13 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(faces, Face)
 
-        for face in faces:
-            face.body._reset_tessellation_cache()
-
-        result = self._grpc_client.services.model_tools.full_fillet(
-            selection_ids=[face.id for face in faces],
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.model_tools.full_fillet(
+                selection_ids=[face.id for face in faces],
+            )
+        finally:
+            self._reset_changed_bodies(faces, result)
 
         return result.get("success")
 
@@ -721,9 +771,6 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for face in selection:
-            face.body._reset_tessellation_cache()
-
         if two_dimensional and None in (count_y, pitch_y):
             raise ValueError(
                 "If the pattern is two dimensional, count_y and pitch_y must be provided."
@@ -743,15 +790,19 @@ class GeometryCommands:
         else:
             pitch_y = Distance(0)
 
-        result = self._grpc_client.services.patterns.create_linear_pattern(
-            selection_ids=[face.id for face in selection],
-            linear_direction_id=linear_direction.id,
-            count_x=count_x,
-            pitch_x=pitch_x,
-            two_dimensional=two_dimensional,
-            count_y=count_y,
-            pitch_y=pitch_y,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.create_linear_pattern(
+                selection_ids=[face.id for face in selection],
+                linear_direction_id=linear_direction.id,
+                count_x=count_x,
+                pitch_x=pitch_x,
+                two_dimensional=two_dimensional,
+                count_y=count_y,
+                pitch_y=pitch_y,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -800,22 +851,23 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for object in selection:
-            object.body._reset_tessellation_cache()
-
         # Convert pitches to distance objects
         pitch_x = pitch_x if isinstance(pitch_x, Distance) else Distance(pitch_x)
         pitch_y = pitch_y if isinstance(pitch_y, Distance) else Distance(pitch_y)
 
-        result = self._grpc_client.services.patterns.modify_linear_pattern(
-            selection_ids=[object.id for object in selection],
-            count_x=count_x,
-            pitch_x=pitch_x,
-            count_y=count_y,
-            pitch_y=pitch_y,
-            new_seed_index=new_seed_index,
-            old_seed_index=old_seed_index,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.modify_linear_pattern(
+                selection_ids=[object.id for object in selection],
+                count_x=count_x,
+                pitch_x=pitch_x,
+                count_y=count_y,
+                pitch_y=pitch_y,
+                new_seed_index=new_seed_index,
+                old_seed_index=old_seed_index,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -869,9 +921,6 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for object in selection:
-            object.body._reset_tessellation_cache()
-
         if two_dimensional and None in (linear_count, linear_pitch):
             raise ValueError(
                 "If the pattern is two-dimensional, linear_count and linear_pitch must be provided."
@@ -906,16 +955,20 @@ class GeometryCommands:
         if isinstance(circular_axis, Edge):
             circular_axis = circular_axis.id
 
-        result = self._grpc_client.services.patterns.create_circular_pattern(
-            selection_ids=[object.id for object in selection],
-            circular_axis=circular_axis,
-            circular_count=circular_count,
-            circular_angle=circular_angle,
-            two_dimensional=two_dimensional,
-            linear_count=linear_count,
-            linear_pitch=linear_pitch,
-            radial_direction=radial_direction,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.create_circular_pattern(
+                selection_ids=[object.id for object in selection],
+                circular_axis=circular_axis,
+                circular_count=circular_count,
+                circular_angle=circular_angle,
+                two_dimensional=two_dimensional,
+                linear_count=linear_count,
+                linear_pitch=linear_pitch,
+                radial_direction=radial_direction,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -959,20 +1012,21 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for object in selection:
-            object.body._reset_tessellation_cache()
-
         # Convert angle and pitch to appropriate objects
         step_angle = step_angle if isinstance(step_angle, Angle) else Angle(step_angle)
         step_linear = step_linear if isinstance(step_linear, Distance) else Distance(step_linear)
 
-        result = self._grpc_client.services.patterns.modify_circular_pattern(
-            selection_ids=[object.id for object in selection],
-            circular_count=circular_count,
-            linear_count=linear_count,
-            step_angle=step_angle,
-            step_linear=step_linear,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.modify_circular_pattern(
+                selection_ids=[object.id for object in selection],
+                circular_count=circular_count,
+                linear_count=linear_count,
+                step_angle=step_angle,
+                step_linear=step_linear,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -1030,9 +1084,6 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for object in selection:
-            object.body._reset_tessellation_cache()
-
         # Convert measurements to distance objects
         margin = margin if isinstance(margin, Distance) else Distance(margin)
         x_spacing = x_spacing if isinstance(x_spacing, Distance) else Distance(x_spacing)
@@ -1050,18 +1101,22 @@ class GeometryCommands:
             column_y_offset if isinstance(column_y_offset, Distance) else Distance(column_y_offset)
         )
 
-        result = self._grpc_client.services.patterns.create_fill_pattern(
-            selection_ids=[object.id for object in selection],
-            linear_direction_id=linear_direction.id,
-            fill_pattern_type=fill_pattern_type,
-            margin=margin,
-            x_spacing=x_spacing,
-            y_spacing=y_spacing,
-            row_x_offset=row_x_offset,
-            row_y_offset=row_y_offset,
-            column_x_offset=column_x_offset,
-            column_y_offset=column_y_offset,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.create_fill_pattern(
+                selection_ids=[object.id for object in selection],
+                linear_direction_id=linear_direction.id,
+                fill_pattern_type=fill_pattern_type,
+                margin=margin,
+                x_spacing=x_spacing,
+                y_spacing=y_spacing,
+                row_x_offset=row_x_offset,
+                row_y_offset=row_y_offset,
+                column_x_offset=column_x_offset,
+                column_y_offset=column_y_offset,
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -1095,12 +1150,13 @@ class GeometryCommands:
 
         check_type_all_elements_in_iterable(selection, Face)
 
-        for object in selection:
-            object.body._reset_tessellation_cache()
-
-        result = self._grpc_client.services.patterns.update_fill_pattern(
-            selection_ids=[object.id for object in selection],
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.patterns.update_fill_pattern(
+                selection_ids=[object.id for object in selection],
+            )
+        finally:
+            self._reset_changed_bodies(selection, result)
 
         return result.get("success")
 
@@ -1344,10 +1400,14 @@ class GeometryCommands:
             else [replacement_selection]
         )
 
-        result = self._grpc_client._services.faces.replace_faces(
-            target_ids=[selection.id for selection in target_selection],
-            replacement_ids=[selection.id for selection in replacement_selection],
-        )
+        result = None
+        try:
+            result = self._grpc_client._services.faces.replace_faces(
+                target_ids=[selection.id for selection in target_selection],
+                replacement_ids=[selection.id for selection in replacement_selection],
+            )
+        finally:
+            self._reset_changed_bodies(target_selection + replacement_selection, result)
 
         return result.get("success")
 
@@ -1507,11 +1567,17 @@ class GeometryCommands:
             entities = selection if isinstance(selection, list) else [selection]
             selection_ids = [entity.id for entity in entities]
 
-        result = self._grpc_client.services.model_tools.move_translate(
-            selection_ids=selection_ids,
-            direction=direction,
-            distance=distance,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.model_tools.move_translate(
+                selection_ids=selection_ids,
+                direction=direction,
+                distance=distance,
+            )
+        finally:
+            self._reset_changed_bodies(
+                selection if isinstance(selection, list) else [selection], result
+            )
 
         return result.get("success")
 
@@ -1546,11 +1612,15 @@ class GeometryCommands:
         """
         angle = angle if isinstance(angle, Angle) else Angle(angle)
 
-        result = self._grpc_client.services.model_tools.move_rotate(
-            selection_id=selection.id,
-            axis=axis,
-            angle=angle,
-        )
+        result = None
+        try:
+            result = self._grpc_client.services.model_tools.move_rotate(
+                selection_id=selection.id,
+                axis=axis,
+                angle=angle,
+            )
+        finally:
+            self._reset_changed_bodies([selection], result)
 
         return result
 
@@ -1593,18 +1663,19 @@ class GeometryCommands:
         faces: list[Face] = faces if isinstance(faces, list) else [faces]
         check_type_all_elements_in_iterable(faces, Face)
 
-        for face in faces:
-            face.body._reset_tessellation_cache()
-
         radius = radius if isinstance(radius, Distance) else Distance(radius)
 
-        result = self._grpc_client._services.faces.offset_faces_set_radius(
-            face_ids=[face.id for face in faces],
-            radius=radius,
-            copy=copy,
-            offset_mode=offset_mode,
-            extrude_type=extrude_type,
-        )
+        result = None
+        try:
+            result = self._grpc_client._services.faces.offset_faces_set_radius(
+                face_ids=[face.id for face in faces],
+                radius=radius,
+                copy=copy,
+                offset_mode=offset_mode,
+                extrude_type=extrude_type,
+            )
+        finally:
+            self._reset_changed_bodies(faces, result)
 
         return result.get("success")
 
@@ -1801,11 +1872,15 @@ class GeometryCommands:
         """
         distance = distance if isinstance(distance, Distance) else Distance(distance)
 
-        response = self._grpc_client._services.edges.move_imprint_edges(
-            edge_ids=[edge.id for edge in edges],
-            direction=direction,
-            distance=distance,
-        )
+        response = None
+        try:
+            response = self._grpc_client._services.edges.move_imprint_edges(
+                edge_ids=[edge.id for edge in edges],
+                direction=direction,
+                distance=distance,
+            )
+        finally:
+            self._reset_changed_bodies(edges, response)
 
         return response.get("success")
 
@@ -1827,10 +1902,14 @@ class GeometryCommands:
         """
         offset = offset if isinstance(offset, Distance) else Distance(offset)
 
-        response = self._grpc_client._services.edges.offset_edges(
-            edge_ids=[edge.id for edge in edges],
-            offset=offset,
-        )
+        response = None
+        try:
+            response = self._grpc_client._services.edges.offset_edges(
+                edge_ids=[edge.id for edge in edges],
+                offset=offset,
+            )
+        finally:
+            self._reset_changed_bodies(edges, response)
 
         return response.get("success")
 
@@ -1986,13 +2065,17 @@ class GeometryCommands:
         """
         angle = angle if isinstance(angle, Angle) else Angle(angle)
 
-        response = self._grpc_client._services.faces.draft_faces(
-            face_ids=[face.id for face in faces],
-            reference_face_ids=[face.id for face in reference_faces],
-            draft_side=draft_side,
-            angle=angle,
-            extrude_type=extrude_type,
-        )
+        response = None
+        try:
+            response = self._grpc_client._services.faces.draft_faces(
+                face_ids=[face.id for face in faces],
+                reference_face_ids=[face.id for face in reference_faces],
+                draft_side=draft_side,
+                angle=angle,
+                extrude_type=extrude_type,
+            )
+        finally:
+            self._reset_changed_bodies(faces + reference_faces, response)
 
         # Return the drafted faces
         design = get_design_from_face(faces[0])
@@ -2079,12 +2162,16 @@ class GeometryCommands:
         """
         distance = distance if isinstance(distance, Distance) else Distance(distance)
 
-        _ = self._grpc_client._services.faces.offset_faces(
-            face_ids=[face.id for face in faces],
-            distance=distance,
-            direction=direction,
-            extrude_type=extrude_type,
-        )
+        result = None
+        try:
+            result = self._grpc_client._services.faces.offset_faces(
+                face_ids=[face.id for face in faces],
+                distance=distance,
+                direction=direction,
+                extrude_type=extrude_type,
+            )
+        finally:
+            self._reset_changed_bodies(faces, result)
 
     @min_backend_version(25, 2, 0)
     def revolve_edges(
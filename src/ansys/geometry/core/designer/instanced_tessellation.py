@@ -0,0 +1,395 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides the tessellation of a design as shared meshes and their placements."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ansys.geometry.core.math.constants import IDENTITY_MATRIX44
+from ansys.geometry.core.math.matrix import Matrix44
+from ansys.geometry.core.misc.checks import graphics_required
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyvista import PolyData
+
+    from ansys.geometry.core.designer.body import Body
+    from ansys.geometry.core.misc.options import TessellationOptions
+
+
+class InstancedTessellation:
+    """Provides the tessellation of a design as shared meshes and their placements.
+
+    Body occurrences that share a ``MasterBody``, such as the bodies of the instances
+    of a component, share its mesh. Each mesh is stored once, in the coordinates of
+    the master body, and each occurrence is stored as the ID of its mesh and its
+    transformation to world space.
+
+    Parameters
+    ----------
+    meshes : dict[str, dict]
+        Raw tessellation of each master body, by master body ID. Each raw tessellation
+        has the format of the ``MasterBody.get_raw_tessellation()`` method.
+    instances : list[tuple[str, str, Matrix44]]
+        Body ID, mesh ID and world transformation of each body occurrence.
+    """
+
+    def __init__(self, meshes: dict[str, dict], instances: list[tuple[str, str, Matrix44]]):
+        """Initialize the ``InstancedTessellation`` class."""
+        unknown = {mesh_id for _, mesh_id, _ in instances}.difference(meshes)
+        if unknown:
+            raise ValueError(f"Instances refer to unknown meshes {sorted(unknown)}.")
+
+        self._meshes = meshes
+        self._instances = instances
+
+    @property
+    def meshes(self) -> dict[str, dict]:
+        """Raw tessellation of each master body, by master body ID."""
+        return self._meshes
+
+    @property
+    def instances(self) -> list[tuple[str, str, Matrix44]]:
+        """Body ID, mesh ID and world transformation of each body occurrence."""
+        return self._instances
+
+    def expand(self) -> dict[str, dict]:
+        """Get the raw tessellation of each body occurrence in world space.
+
+        Returns
+        -------
+        dict[str, dict]
+            Raw tessellation by body ID. The inner dictionaries have face and edge IDs
+            as keys, like the ``Body.get_raw_tessellation()`` method, and hold the
+            vertices as flat NumPy arrays.
+
+        Notes
+        -----
+        The mesh of a master body is copied for each of its occurrences. Use the
+        ``meshes`` and ``instances`` attributes when the consumer supports instancing.
+        """
+        flat = {}
+        for body_id, mesh_id, transform in self._instances:
+            body_tess = {}
+            for entity_id, tess in self._meshes[mesh_id].items():
+                points = _transform_points(_points(tess), transform)
+                body_tess[entity_id] = {**tess, "vertices": points.ravel()}
+            flat[body_id] = body_tess
+        return flat
+
+    @graphics_required
+    def to_polydata(self) -> "PolyData":
+        """Get a single mesh of all the body occurrences in world space.
+
+        Returns
+        -------
+        ~pyvista.PolyData
+            Faces of the bodies as polygons and edges as polylines.
+        """
+        import pyvista as pv
+
+        # Occurrences of the same mesh are transformed together
+        transforms = {}
+        for _, mesh_id, transform in self._instances:
+            transforms.setdefault(mesh_id, []).append(transform)
+
+        points, faces, lines = [], [], []
+        n_points = 0
+        for mesh_id, mesh_transforms in transforms.items():
+            mesh_points, mesh_faces, faces_mask, mesh_lines, lines_mask = _merge(
+                self._meshes[mesh_id]
+            )
+            matrices = np.asarray(mesh_transforms, dtype=np.float64)
+            points.append(
+                (
+                    np.einsum("kij,nj->kni", matrices[:, :3, :3], mesh_points)
+                    + matrices[:, None, :3, 3]
+                ).reshape(-1, 3)
+            )
+            offsets = n_points + len(mesh_points) * np.arange(len(matrices))[:, None]
+            faces.append((mesh_faces + offsets * faces_mask).ravel())
+            lines.append((mesh_lines + offsets * lines_mask).ravel())
+            n_points += len(matrices) * len(mesh_points)
+
+        if not n_points:
+            return pv.PolyData()
+
+        faces = np.concatenate(faces)
+        lines = np.concatenate(lines)
+        return pv.PolyData(
+            np.concatenate(points),
+            faces=faces if len(faces) else None,
+            lines=lines if len(lines) else None,
+        )
+
+    def to_glb(self, file_location: Path | str, quantize: bool = False) -> Path:
+        """Write the faces of the body occurrences to a binary glTF file.
+
+        Each mesh is written once, and each body occurrence is written as a node
+        that places its mesh in world space. Repeated occurrences do not make the
+        file bigger, and no render window is needed.
+
+        Parameters
+        ----------
+        file_location : ~pathlib.Path | str
+            Location of the file to write.
+        quantize : bool, default: False
+            Whether to store the vertex positions as 16-bit integers with the
+            ``KHR_mesh_quantization`` extension. Positions take half the space, with
+            a precision of 1/65535 of the size of each mesh.
+
+        Returns
+        -------
+        ~pathlib.Path
+            Location of the written file.
+
+        Notes
+        -----
+        This method requires the ``pygltflib`` library. Edges are not written.
+        """
+        try:
+            import pygltflib as gltf
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "The `pygltflib` library is required to export to GLB. "
+                "Please install it using `pip install pygltflib`."
+            ) from e
+
+        blob = bytearray()
+        buffer_views, accessors, meshes = [], [], []
+
+        def _add_accessor(data: np.ndarray, target: int, **kwargs) -> int:
+            # Buffer views start on 4-byte boundaries
+            blob.extend(bytes(-len(blob) % 4))
+            buffer_views.append(
+                gltf.BufferView(
+                    buffer=0,
+                    byteOffset=len(blob),
+                    byteLength=data.nbytes,
+                    byteStride=data.strides[0] if target == gltf.ARRAY_BUFFER else None,
+                    target=target,
+                )
+            )
+            blob.extend(data.tobytes())
+            accessors.append(
+                gltf.Accessor(bufferView=len(buffer_views) - 1, count=len(data), **kwargs)
+            )
+            return len(accessors) - 1
+
+        # Meshes, with the matrix mapping their stored positions to body coordinates
+        gltf_meshes = {}
+        for mesh_id, mesh in self._meshes.items():
+            faces = {entity_id: tess for entity_id, tess in mesh.items() if not tess.get("is_edge")}
+            points, cells, *_ = _merge(faces)
+            triangles = _triangulate(cells)
+            if not len(triangles):
+                continue
+
+            if quantize:
+                low = points.min(axis=0)
+                scale = (points.max(axis=0) - low) / 65535
+                scale[scale == 0] = 1
+                positions = np.zeros((len(points), 4), dtype=np.int16)
+                positions[:, :3] = np.round((points - low) / scale) - 32768
+                dequantize = np.diag([*scale, 1])
+                dequantize[:3, 3] = low + 32768 * scale
+                position = _add_accessor(
+                    positions,
+                    gltf.ARRAY_BUFFER,
+                    componentType=gltf.SHORT,
+                    type=gltf.VEC3,
+                    min=positions[:, :3].min(axis=0).tolist(),
+                    max=positions[:, :3].max(axis=0).tolist(),
+                )
+            else:
+                positions = points.astype(np.float32)
+                dequantize = None
+                position = _add_accessor(
+                    positions,
+                    gltf.ARRAY_BUFFER,
+                    componentType=gltf.FLOAT,
+                    type=gltf.VEC3,
+                    min=positions.min(axis=0).tolist(),
+                    max=positions.max(axis=0).tolist(),
+                )
+
+            small = len(points) <= np.iinfo(np.uint16).max
+            indices = _add_accessor(
+                triangles.astype(np.uint16 if small else np.uint32).ravel(),
+                gltf.ELEMENT_ARRAY_BUFFER,
+                componentType=gltf.UNSIGNED_SHORT if small else gltf.UNSIGNED_INT,
+                type=gltf.SCALAR,
+            )
+            meshes.append(
+                gltf.Mesh(
+                    name=mesh_id,
+                    primitives=[
+                        gltf.Primitive(
+                            attributes=gltf.Attributes(POSITION=position),
+                            indices=indices,
+                            mode=gltf.TRIANGLES,
+                        )
+                    ],
+                )
+            )
+            gltf_meshes[mesh_id] = (len(meshes) - 1, dequantize)
+
+        nodes = []
+        for body_id, mesh_id, transform in self._instances:
+            if mesh_id not in gltf_meshes:
+                continue
+            mesh_index, dequantize = gltf_meshes[mesh_id]
+            matrix = np.asarray(transform, dtype=np.float64)
+            if dequantize is not None:
+                matrix = matrix @ dequantize
+            nodes.append(
+                gltf.Node(
+                    name=body_id,
+                    mesh=mesh_index,
+                    # glTF matrices are stored in column-major order
+                    matrix=None if np.array_equal(matrix, np.eye(4)) else matrix.T.ravel().tolist(),
+                )
+            )
+
+        extensions = ["KHR_mesh_quantization"] if quantize else []
+        document = gltf.GLTF2(
+            scene=0,
+            scenes=[gltf.Scene(nodes=list(range(len(nodes))))],
+            nodes=nodes,
+            meshes=meshes,
+            accessors=accessors,
+            bufferViews=buffer_views,
+            buffers=[gltf.Buffer(byteLength=len(blob))],
+            extensionsUsed=extensions,
+            extensionsRequired=extensions,
+        )
+        document.set_binary_blob(bytes(blob))
+
+        file_location = Path(file_location)
+        document.save_binary(str(file_location))
+        return file_location
+
+    @classmethod
+    def _from_bodies(
+        cls,
+        bodies: list["Body"],
+        tess_options: "TessellationOptions | None" = None,
+        reset_cache: bool = False,
+        include_faces: bool = True,
+        include_edges: bool = False,
+    ) -> "InstancedTessellation":
+        """Tessellate the master bodies of some body occurrences, once each."""
+        meshes = {}
+        instances = []
+        transforms = {}
+        for body in bodies:
+            master = body._template
+            if master.id not in meshes:
+                meshes[master.id] = master.get_raw_tessellation(
+                    tess_options, reset_cache, include_faces, include_edges
+                )
+
+            component = body.parent_component
+            transform = transforms.get(component.id)
+            if transform is None:
+                transform = transforms[component.id] = component.get_world_transform()
+            instances.append((body.id, master.id, transform))
+
+        return cls(meshes, instances)
+
+    def __repr__(self) -> str:
+        """Represent the ``InstancedTessellation`` as a string."""
+        return (
+            f"InstancedTessellation(meshes={len(self._meshes)}, instances={len(self._instances)})"
+        )
+
+
+def _points(tess: dict) -> np.ndarray:
+    return np.asarray(tess["vertices"], dtype=np.float64).reshape(-1, 3)
+
+
+def _transform_points(points: np.ndarray, transform: Matrix44) -> np.ndarray:
+    if np.array_equal(transform, IDENTITY_MATRIX44):
+        return points
+    matrix = np.asarray(transform)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _triangulate(cells: np.ndarray) -> np.ndarray:
+    """Split the polygons of a VTK cell array into triangles, as a ``(n, 3)`` array."""
+    if not len(cells):
+        return np.empty((0, 3), dtype=np.int64)
+
+    # Meshes from the server are made of triangles only
+    if len(cells) % 4 == 0 and (cells[::4] == 3).all():
+        return cells.reshape(-1, 4)[:, 1:]
+
+    triangles = []
+    position = 0
+    while position < len(cells):
+        polygon = cells[position + 1 : position + 1 + cells[position]]
+        triangles.extend(
+            (polygon[0], polygon[i], polygon[i + 1]) for i in range(1, len(polygon) - 1)
+        )
+        position += cells[position] + 1
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def _merge(mesh: dict) -> tuple[np.ndarray, ...]:
+    """Merge the faces and edges of a mesh.
+
+    The masks are ``1`` at the point indices of the cell arrays and ``0`` at the cell
+    sizes, so that the cells of an occurrence are ``cells + offset * mask``.
+    """
+    points, faces, faces_mask, lines, lines_mask = [], [], [], [], []
+    n_points = 0
+    for tess in mesh.values():
+        tess_points = _points(tess)
+        if tess.get("is_edge"):
+            lines.append(np.arange(-1, len(tess_points)) + n_points)
+            lines[-1][0] = len(tess_points)
+            lines_mask.append(np.ones(len(tess_points) + 1, dtype=np.int64))
+            lines_mask[-1][0] = 0
+        else:
+            tess_faces = np.asarray(tess["faces"], dtype=np.int64)
+            mask = np.ones(len(tess_faces), dtype=np.int64)
+            position = 0
+            while position < len(tess_faces):
+                mask[position] = 0
+                position += tess_faces[position] + 1
+            faces.append(tess_faces + n_points * mask)
+            faces_mask.append(mask)
+        points.append(tess_points)
+        n_points += len(tess_points)
+
+    def _concatenate(arrays: list[np.ndarray]) -> np.ndarray:
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+
+    return (
+        np.concatenate(points) if points else np.empty((0, 3)),
+        _concatenate(faces),
+        _concatenate(faces_mask),
+        _concatenate(lines),
+        _concatenate(lines_mask),
+    )
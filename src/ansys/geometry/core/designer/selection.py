@@ -40,15 +40,12 @@ from ansys.geometry.core.errors import GeometryRuntimeError
 from ansys.geometry.core.misc.auxiliary import (
     get_all_bodies_from_design,
     get_beams_from_ids,
-    get_bodies_from_ids,
     get_components_from_ids,
     get_coordinate_systems_from_ids,
     get_datum_planes_from_ids,
     get_datum_points_from_ids,
     get_design_curves_from_ids,
     get_design_points_from_ids,
-    get_edges_from_ids,
-    get_faces_from_ids,
     get_vertices_from_ids,
 )
 from ansys.geometry.core.misc.checks import min_backend_version
@@ -161,15 +158,10 @@ class NamedSelection:
             "coordinate_systems": [cs.id for cs in coordinate_systems],
             "datum_points": [dp.id for dp in datum_points],
         }
-        self._faces_meta_cached = [
-            {
-                "id": face.id,
-                "surface_type": face.surface_type.value,
-                "is_reversed": face.is_reversed,
-                "body_id": face.body.id,
-            }
-            for face in faces
-        ]
+        self._faces_meta_cached = _faces_meta(faces)
+
+        # The members of a named selection read from the server are not known yet
+        self._members_known = preexisting_id is None
 
         if preexisting_id:
             self._id = preexisting_id
@@ -215,7 +207,7 @@ class NamedSelection:
 
         if self._bodies is None:
             # Get all bodies from the named selection
-            self._bodies = get_bodies_from_ids(self._design, self._ids_cached["bodies"])
+            self._bodies = self._design._get_entities_from_ids("bodies", self._ids_cached["bodies"])
 
         return self._bodies
 
@@ -229,7 +221,9 @@ class NamedSelection:
             self._faces = self.__build_faces_from_metadata()
             if self._faces is None:
                 # Get all faces from the named selection
-                self._faces = get_faces_from_ids(self._design, self._ids_cached["faces"])
+                self._faces = self._design._get_entities_from_ids(
+                    "faces", self._ids_cached["faces"]
+                )
 
         return self._faces
 
@@ -241,7 +235,7 @@ class NamedSelection:
 
         if self._edges is None:
             # Get all edges from the named selection
-            self._edges = get_edges_from_ids(self._design, self._ids_cached["edges"])
+            self._edges = self._design._get_entities_from_ids("edges", self._ids_cached["edges"])
 
         return self._edges
 
@@ -472,6 +466,7 @@ class NamedSelection:
 
             # Reassign the named selection to self so that changes are reflected
             self.__dict__.update(new_ns.__dict__)
+            self._design._named_selection_index.update(self)
 
         finally:
             self._verified = False
@@ -556,6 +551,7 @@ class NamedSelection:
 
             # Reassign the named selection to self so that changes are reflected
             self.__dict__.update(new_ns.__dict__)
+            self._design._named_selection_index.update(self)
 
         finally:
             self._verified = False
@@ -601,6 +597,78 @@ class NamedSelection:
                 # Update the cache
                 self._ids_cached[key] = ids[key]
 
+        self._members_known = True
+
+    def _member_ids(self) -> dict[str, list[str]]:
+        """Get the ids of the members of the named selection, grouped by kind.
+
+        The members of a named selection read from the server are requested
+        the first time only.
+        """
+        if not self._members_known:
+            self.__verify_ns()
+        return self._ids_cached
+
+    def _changed_members(
+        self, add: list | None = None, remove: list | None = None
+    ) -> tuple[dict[str, list[str]], list[dict]]:
+        """Get the member ids and face metadata after adding and removing members.
+
+        Nothing is sent to the server. The ``_replace()`` method applies the result
+        once the named selection is created again.
+
+        Parameters
+        ----------
+        add : list, default: None
+            Members to add to the named selection.
+        remove : list, default: None
+            Members to remove from the named selection.
+
+        Returns
+        -------
+        tuple[dict[str, list[str]], list[dict]]
+            Ids of the members grouped by kind and metadata of the faces.
+        """
+        ids = {kind: list(member_ids) for kind, member_ids in self._member_ids().items()}
+        faces_meta = list(self._faces_meta_cached)
+
+        for kind, entities in _group_members(add or []).items():
+            known = set(ids[kind])
+            new = [entity for entity in entities if entity.id not in known]
+            ids[kind].extend(entity.id for entity in new)
+            if kind == "faces":
+                faces_meta.extend(_faces_meta(new))
+
+        removed = {entity.id for entity in remove or []}
+        if removed:
+            ids = {
+                kind: [id for id in member_ids if id not in removed]
+                for kind, member_ids in ids.items()
+            }
+            faces_meta = [face_meta for face_meta in faces_meta if face_meta["id"] not in removed]
+
+        if not any(ids.values()):
+            raise GeometryRuntimeError("NamedSelection cannot be empty after removal.")
+
+        return ids, faces_meta
+
+    def _replace(self, new_id: str, ids: dict[str, list[str]], faces_meta: list[dict]) -> None:
+        """Point the named selection to a new server-side named selection.
+
+        Only the members of the kinds that changed are resolved again.
+        """
+        for kind, member_ids in ids.items():
+            if member_ids != self._ids_cached[kind]:
+                setattr(self, f"_{kind}", None)
+        if faces_meta != self._faces_meta_cached:
+            self._faces = None
+
+        self._id = new_id
+        self._ids_cached = ids
+        self._faces_meta_cached = faces_meta
+        self._members_known = True
+        self._design._named_selection_index.update(self)
+
     def __build_faces_from_metadata(self) -> list[Face] | None:
         """Build faces directly from named selection metadata when available."""
         if not self._faces_meta_cached:
@@ -662,3 +730,120 @@ class NamedSelection:
             self._verified = False
 
         return "\n".join(lines)
+
+
+_MEMBER_TYPES = {
+    "bodies": Body,
+    "faces": Face,
+    "edges": Edge,
+    "beams": Beam,
+    "design_points": DesignPoint,
+    "components": Component,
+    "vertices": Vertex,
+    "design_curves": DesignCurve,
+    "datum_planes": DatumPlane,
+    "coordinate_systems": CoordinateSystem,
+    "datum_points": DatumPoint,
+}
+
+
+def _group_members(members: list) -> dict[str, list]:
+    """Group the members of a named selection by kind.
+
+    The keys are the names of the ``NamedSelection`` parameters, such as
+    ``"bodies"`` or ``"faces"``.
+    """
+    groups = {kind: [] for kind in _MEMBER_TYPES}
+    for member in members:
+        for kind, member_type in _MEMBER_TYPES.items():
+            if isinstance(member, member_type):
+                groups[kind].append(member)
+                break
+        else:
+            raise TypeError(
+                f"{type(member).__name__} objects cannot be members of a named selection."
+            )
+    return groups
+
+
+def _faces_meta(faces: list[Face]) -> list[dict]:
+    """Get the metadata used to rebuild the faces of a named selection."""
+    # Read the attributes directly, the faces already hold everything needed
+    return [
+        {
+            "id": face._id,
+            "surface_type": face._surface_type.value,
+            "is_reversed": face._is_reversed,
+            "body_id": face._body.id,
+        }
+        for face in faces
+    ]
+
+
+class _NamedSelectionIndex:
+    """Reverse index from design entities to the named selections that contain them.
+
+    Entities are indexed by kind (``"bodies"``, ``"faces"``, ...) and id, as in the
+    ``_member_ids()`` method of the named selections. Named selections are indexed
+    on the first lookup after they are added, so that reading a design does not
+    request the members of all its named selections.
+    """
+
+    def __init__(self):
+        """Initialize the ``_NamedSelectionIndex`` class."""
+        self._pending: dict[NamedSelection, None] = {}
+        self._keys: dict[NamedSelection, list[tuple[str, str]]] = {}
+        self._index: dict[tuple[str, str], dict[NamedSelection, None]] = {}
+
+    def add(self, named_selection: NamedSelection) -> None:
+        """Add a named selection to the index."""
+        self._pending[named_selection] = None
+
+    def remove(self, named_selection: NamedSelection) -> None:
+        """Remove a named selection from the index."""
+        self._pending.pop(named_selection, None)
+        for key in self._keys.pop(named_selection, ()):
+            named_selections = self._index[key]
+            named_selections.pop(named_selection, None)
+            if not named_selections:
+                del self._index[key]
+
+    def update(self, named_selection: NamedSelection) -> None:
+        """Index the current members of a named selection that was modified."""
+        self.remove(named_selection)
+        self.add(named_selection)
+
+    def invalidate(self) -> None:
+        """Request the members of all the named selections again on the next lookup."""
+        for named_selection in list(self._keys):
+            named_selection._members_known = False
+            self.update(named_selection)
+
+    def get(self, kind: str, entity_id: str) -> list[NamedSelection]:
+        """Get the named selections that contain an entity.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the entity, such as ``"bodies"`` or ``"faces"``.
+        entity_id : str
+            ID of the entity.
+
+        Returns
+        -------
+        list[NamedSelection]
+            Named selections that contain the entity.
+        """
+        while self._pending:
+            named_selection = next(iter(self._pending))
+            del self._pending[named_selection]
+            keys = [
+                (member_kind, member_id)
+                for member_kind, member_ids in named_selection._member_ids().items()
+                for member_id in member_ids
+            ]
+            for key in keys:
+                self._index.setdefault(key, {})[named_selection] = None
+            self._keys[named_selection] = keys
+
+        return list(self._index.get((kind, entity_id), ()))
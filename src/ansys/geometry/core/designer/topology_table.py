@@ -0,0 +1,273 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a columnar snapshot of the topology of a design."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
+FACE_COLUMNS = ("id", "body", "surface_type", "is_reversed", "area", "bbox_min", "bbox_max")
+"""Columns of the faces table."""
+
+EDGE_COLUMNS = ("id", "body", "curve_type", "is_reversed", "length", "bbox_min", "bbox_max")
+"""Columns of the edges table."""
+
+VERTEX_COLUMNS = ("id", "body", "position")
+"""Columns of the vertices table."""
+
+_COLUMNS = {"faces": FACE_COLUMNS, "edges": EDGE_COLUMNS, "vertices": VERTEX_COLUMNS}
+
+
+class TopologyTable:
+    """Provides a columnar snapshot of the faces, edges and vertices of a design.
+
+    Each table is a dictionary of NumPy arrays with one entry per column and one
+    row per entity, so it can be handed to NumPy, pandas or Arrow without building
+    a ``Face``, ``Edge`` or ``Vertex`` object for every entity.
+
+    Parameters
+    ----------
+    faces : dict[str, ~numpy.ndarray]
+        Faces table, with the columns in ``FACE_COLUMNS``.
+    edges : dict[str, ~numpy.ndarray]
+        Edges table, with the columns in ``EDGE_COLUMNS``.
+    vertices : dict[str, ~numpy.ndarray]
+        Vertices table, with the columns in ``VERTEX_COLUMNS``.
+
+    Notes
+    -----
+    The ``id`` and ``body`` columns hold the ids of the entity and of its owning
+    body. The ``surface_type`` and ``curve_type`` columns hold the values of the
+    ``SurfaceType`` and ``CurveType`` enums. Lengths, areas and coordinates are
+    given in server units, that is meters and square meters. The ``bbox_min``,
+    ``bbox_max`` and ``position`` columns are ``(n, 3)`` arrays.
+    """
+
+    def __init__(
+        self,
+        faces: dict[str, np.ndarray],
+        edges: dict[str, np.ndarray],
+        vertices: dict[str, np.ndarray],
+    ):
+        """Initialize the ``TopologyTable`` class."""
+        self._tables = {}
+        for kind, table in (("faces", faces), ("edges", edges), ("vertices", vertices)):
+            missing = set(_COLUMNS[kind]).difference(table)
+            if missing:
+                raise ValueError(f"The {kind} table is missing the columns {sorted(missing)}.")
+
+            columns = {}
+            for name in _COLUMNS[kind]:
+                column = np.asarray(table[name])
+                column.flags.writeable = False
+                columns[name] = column
+
+            lengths = {name: len(column) for name, column in columns.items()}
+            if len(set(lengths.values())) > 1:
+                raise ValueError(f"The columns of the {kind} table differ in length: {lengths}.")
+            self._tables[kind] = columns
+
+    @property
+    def faces(self) -> dict[str, np.ndarray]:
+        """Faces table."""
+        return self._tables["faces"]
+
+    @property
+    def edges(self) -> dict[str, np.ndarray]:
+        """Edges table."""
+        return self._tables["edges"]
+
+    @property
+    def vertices(self) -> dict[str, np.ndarray]:
+        """Vertices table."""
+        return self._tables["vertices"]
+
+    def save(self, file_location: Path | str) -> None:
+        """Save the tables to a compressed NumPy ``.npz`` file.
+
+        Parameters
+        ----------
+        file_location : ~pathlib.Path | str
+            Location of the file to write.
+        """
+        np.savez_compressed(
+            file_location,
+            **{
+                f"{kind}.{name}": column
+                for kind, table in self._tables.items()
+                for name, column in table.items()
+            },
+        )
+
+    @classmethod
+    def load(cls, file_location: Path | str) -> "TopologyTable":
+        """Load tables previously written by the ``save()`` method.
+
+        Parameters
+        ----------
+        file_location : ~pathlib.Path | str
+            Location of the ``.npz`` file to read.
+
+        Returns
+        -------
+        TopologyTable
+            Tables read from the file.
+        """
+        tables = {kind: {} for kind in _COLUMNS}
+        with np.load(file_location, allow_pickle=False) as data:
+            for key in data.files:
+                kind, name = key.split(".", 1)
+                tables[kind][name] = data[key]
+        return cls(**tables)
+
+    def to_arrow(self, kind: str) -> "pa.Table":
+        """Get one of the tables as an Arrow table.
+
+        The ``(n, 3)`` columns are split into three columns suffixed with ``_x``,
+        ``_y`` and ``_z``.
+
+        Parameters
+        ----------
+        kind : str
+            Table to convert, which is ``"faces"``, ``"edges"`` or ``"vertices"``.
+
+        Returns
+        -------
+        ~pyarrow.Table
+            Arrow table with the same rows.
+
+        Notes
+        -----
+        This method requires the ``pyarrow`` library.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "The `pyarrow` library is required to export a TopologyTable to Arrow. "
+                "Please install it using `pip install pyarrow`."
+            ) from e
+
+        if kind not in self._tables:
+            raise ValueError(f"Unknown table '{kind}'. Options are {list(self._tables)}.")
+
+        columns = {}
+        for name, column in self._tables[kind].items():
+            if column.ndim == 2:
+                for axis, suffix in enumerate("xyz"):
+                    columns[f"{name}_{suffix}"] = column[:, axis]
+            else:
+                columns[name] = column
+        return pa.table(columns)
+
+    def to_parquet(self, directory: Path | str) -> None:
+        """Write each table to a Parquet file.
+
+        The files are named ``faces.parquet``, ``edges.parquet`` and
+        ``vertices.parquet``.
+
+        Parameters
+        ----------
+        directory : ~pathlib.Path | str
+            Directory to write the files to. It is created if it does not exist.
+
+        Notes
+        -----
+        This method requires the ``pyarrow`` library.
+        """
+        tables = {kind: self.to_arrow(kind) for kind in self._tables}
+
+        import pyarrow.parquet as pq
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for kind, table in tables.items():
+            pq.write_table(table, directory / f"{kind}.parquet")
+
+    @classmethod
+    def _from_service_data(
+        cls, bodies: list[dict], faces: list[dict], edges: list[dict]
+    ) -> "TopologyTable":
+        """Build the tables from the bulk topology and properties service responses."""
+        face_bodies, face_types, face_reversed = [], [], []
+        edge_bodies, edge_types, edge_reversed = [], [], []
+        vertex_ids, vertex_bodies, positions = [], [], []
+        for body in bodies:
+            for face in body["faces"]:
+                face_bodies.append(body["id"])
+                face_types.append(face["surface_type"])
+                face_reversed.append(face["is_reversed"])
+            for edge in body["edges"]:
+                edge_bodies.append(body["id"])
+                edge_types.append(edge["curve_type"])
+                edge_reversed.append(edge["is_reversed"])
+            for vertex in body["vertices"]:
+                vertex_ids.append(vertex["id"])
+                vertex_bodies.append(body["id"])
+                positions.append(vertex["position"])
+
+        return cls(
+            faces={
+                "id": _strings([face["id"] for face in faces]),
+                "body": _strings(face_bodies),
+                "surface_type": np.array(face_types, dtype=np.int32),
+                "is_reversed": np.array(face_reversed, dtype=bool),
+                "area": np.array([face["area"] for face in faces], dtype=np.float64),
+                "bbox_min": _points([face["min_corner"] for face in faces]),
+                "bbox_max": _points([face["max_corner"] for face in faces]),
+            },
+            edges={
+                "id": _strings([edge["id"] for edge in edges]),
+                "body": _strings(edge_bodies),
+                "curve_type": np.array(edge_types, dtype=np.int32),
+                "is_reversed": np.array(edge_reversed, dtype=bool),
+                "length": np.array([edge["length"] for edge in edges], dtype=np.float64),
+                "bbox_min": _points([edge["min_corner"] for edge in edges]),
+                "bbox_max": _points([edge["max_corner"] for edge in edges]),
+            },
+            vertices={
+                "id": _strings(vertex_ids),
+                "body": _strings(vertex_bodies),
+                "position": _points(positions),
+            },
+        )
+
+    def __repr__(self) -> str:
+        """Represent the ``TopologyTable`` as a string."""
+        return (
+            f"TopologyTable(faces={len(self.faces['id'])}, edges={len(self.edges['id'])}, "
+            f"vertices={len(self.vertices['id'])})"
+        )
+
+
+def _strings(values: list[str]) -> np.ndarray:
+    # Fixed-width unicode arrays can be saved without pickling, unlike object arrays
+    return np.array(values, dtype=str)
+
+
+def _points(values: list[tuple[float, float, float]]) -> np.ndarray:
+    return np.array(values, dtype=np.float64).reshape(-1, 3)
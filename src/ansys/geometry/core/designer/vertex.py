@@ -91,12 +91,7 @@ class Vertex(Point3D):
         list["NamedSelection"]
             List of named selections that include this vertex.
         """
-        included_ns = []
-        for ns in get_design_from_body(self.body).named_selections:
-            if any(vertex.id == self.id for vertex in ns.vertices):
-                included_ns.append(ns)
-
-        return included_ns
+        return get_design_from_body(self.body)._get_named_selections_containing("vertices", self.id)
 
     def __repr__(self) -> str:
         """Return a string representation of the vertex."""
@@ -22,7 +22,8 @@
 
 """PyAnsys Geometry math subpackage."""
 
-from ansys.geometry.core.math.bbox import BoundingBox
+from ansys.geometry.core.math.bbox import BoundingBox, BoundingBoxArray
+from ansys.geometry.core.math.bbox_index import BoundingBoxIndex
 from ansys.geometry.core.math.constants import (
     DEFAULT_POINT2D,
     DEFAULT_POINT3D,
@@ -22,7 +22,9 @@
 
 """Provides for managing a bounding box."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
+
+import numpy as np
 
 from ansys.geometry.core.math.misc import intersect_interval
 from ansys.geometry.core.math.point import Point3D
@@ -31,6 +33,9 @@ from ansys.geometry.core.misc.checks import check_input_types
 from ansys.geometry.core.misc.measurements import DEFAULT_UNITS
 from ansys.geometry.core.typing import Real
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.geometry.core.math.bbox_index import BoundingBoxIndex
+
 
 class BoundingBox:
     """Maintains the box structure for Bounding Boxes.
@@ -184,3 +189,277 @@ class BoundingBox:
         min_point = Point3D([min_x, min_y, min_z])
         max_point = Point3D([max_x, max_y, max_z])
         return BoundingBox(min_point, max_point)
+
+
+class BoundingBoxArray:
+    """Holds many axis-aligned bounding boxes in a single array.
+
+    Operations apply to all the boxes at once, without creating a ``BoundingBox``
+    or ``Point3D`` object per box.
+
+    Parameters
+    ----------
+    corners : ~numpy.ndarray
+        ``(n, 2, 3)`` array with the minimum and maximum corners of each box.
+
+    Notes
+    -----
+    Coordinates are plain floats in server units, that is meters, which are the
+    units of the bounding boxes retrieved from the server. Empty boxes, such as the
+    intersection of two boxes that do not overlap, have NaN corners.
+    """
+
+    def __init__(self, corners: np.ndarray):
+        """Initialize the ``BoundingBoxArray`` class."""
+        corners = np.array(corners, dtype=np.float64)
+        if corners.ndim != 3 or corners.shape[1:] != (2, 3):
+            raise ValueError("The corners must be an array of shape (n, 2, 3).")
+        if np.any(corners[:, 0] > corners[:, 1]):
+            raise ValueError("The minimum corners must not exceed the maximum corners.")
+
+        corners.flags.writeable = False
+        self._corners = corners
+
+    @classmethod
+    def from_corners(cls, min_corners: np.ndarray, max_corners: np.ndarray) -> "BoundingBoxArray":
+        """Create an array of boxes from their minimum and maximum corners.
+
+        Parameters
+        ----------
+        min_corners : ~numpy.ndarray
+            ``(n, 3)`` array with the minimum corner of each box.
+        max_corners : ~numpy.ndarray
+            ``(n, 3)`` array with the maximum corner of each box.
+
+        Returns
+        -------
+        BoundingBoxArray
+            Array of the boxes.
+        """
+        min_corners = np.asarray(min_corners, dtype=np.float64).reshape(-1, 3)
+        max_corners = np.asarray(max_corners, dtype=np.float64).reshape(-1, 3)
+        if min_corners.shape != max_corners.shape:
+            raise ValueError("The minimum and maximum corners must have the same shape.")
+        return cls(np.stack((min_corners, max_corners), axis=1))
+
+    @classmethod
+    def from_bounding_boxes(cls, boxes: list[BoundingBox]) -> "BoundingBoxArray":
+        """Create an array of boxes from ``BoundingBox`` objects.
+
+        Parameters
+        ----------
+        boxes : list[BoundingBox]
+            Boxes to hold.
+
+        Returns
+        -------
+        BoundingBoxArray
+            Array of the boxes, in meters.
+        """
+        return cls(
+            np.array(
+                [(np.asarray(box.min_corner), np.asarray(box.max_corner)) for box in boxes]
+            ).reshape(-1, 2, 3)
+        )
+
+    @property
+    def corners(self) -> np.ndarray:
+        """``(n, 2, 3)`` array with the minimum and maximum corners of the boxes."""
+        return self._corners
+
+    @property
+    def min_corners(self) -> np.ndarray:
+        """``(n, 3)`` array with the minimum corners of the boxes."""
+        return self._corners[:, 0]
+
+    @property
+    def max_corners(self) -> np.ndarray:
+        """``(n, 3)`` array with the maximum corners of the boxes."""
+        return self._corners[:, 1]
+
+    @property
+    def centers(self) -> np.ndarray:
+        """``(n, 3)`` array with the centers of the boxes."""
+        return self._corners.mean(axis=1)
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """``(n, 3)`` array with the extents of the boxes along each axis."""
+        return np.nan_to_num(self._corners[:, 1] - self._corners[:, 0])
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """Volumes of the boxes. Empty boxes have no volume."""
+        return self.sizes.prod(axis=1)
+
+    @property
+    def is_empty(self) -> np.ndarray:
+        """Whether each box is empty."""
+        return np.isnan(self._corners).any(axis=(1, 2))
+
+    def __len__(self) -> int:
+        """Return the number of boxes."""
+        return len(self._corners)
+
+    def __getitem__(self, key: Any) -> Union[BoundingBox, "BoundingBoxArray"]:
+        """Get a box as a ``BoundingBox`` object, or a selection of boxes as an array."""
+        if isinstance(key, (int, np.integer)):
+            low, high = self._corners[key]
+            unit = DEFAULT_UNITS.SERVER_LENGTH
+            # Plain floats keep the comparisons of the points returning plain booleans
+            return BoundingBox(
+                Point3D(low.tolist(), unit),
+                Point3D(high.tolist(), unit),
+                Point3D(((low + high) / 2).tolist(), unit),
+            )
+        return BoundingBoxArray(self._corners[key].reshape(-1, 2, 3))
+
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate whether points lie within the boxes.
+
+        A point on the boundary of a box, up to ``LENGTH_ACCURACY``, lies within it,
+        as in the ``BoundingBox.contains_point()`` method.
+
+        Parameters
+        ----------
+        points : ~numpy.ndarray
+            ``(m, 3)`` array of points, in meters.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            ``(n, m)`` array that is ``True`` where the point of the column lies
+            within the box of the row.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        tolerance = Accuracy.length_accuracy()
+        return np.all(
+            (points[None, :, :] >= self._corners[:, None, 0] - tolerance)
+            & (points[None, :, :] <= self._corners[:, None, 1] + tolerance),
+            axis=2,
+        )
+
+    def overlaps(self, other: Union[BoundingBox, "BoundingBoxArray"]) -> np.ndarray:
+        """Evaluate whether the boxes overlap other boxes.
+
+        Boxes that touch overlap. To find the overlapping pairs among many boxes,
+        use the ``to_index()`` method instead.
+
+        Parameters
+        ----------
+        other : BoundingBox | BoundingBoxArray
+            Boxes to compare with.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            ``(n, m)`` array that is ``True`` where the box of the row overlaps the
+            box of the column.
+        """
+        other = _as_array(other)
+        return np.all(
+            (self._corners[:, None, 0] <= other._corners[None, :, 1])
+            & (self._corners[:, None, 1] >= other._corners[None, :, 0]),
+            axis=2,
+        )
+
+    def union(self, other: Union[BoundingBox, "BoundingBoxArray"]) -> "BoundingBoxArray":
+        """Get the boxes enclosing each box and the box at the same position in another array.
+
+        Parameters
+        ----------
+        other : BoundingBox | BoundingBoxArray
+            Boxes to combine with. A single box is combined with every box.
+
+        Returns
+        -------
+        BoundingBoxArray
+            Boxes enclosing each pair of boxes. Empty boxes are ignored.
+        """
+        other = self._pairwise(other)
+        low = np.fmin(self._corners[:, 0], other._corners[:, 0])
+        high = np.fmax(self._corners[:, 1], other._corners[:, 1])
+        return BoundingBoxArray(np.stack((low, high), axis=1))
+
+    def intersection(self, other: Union[BoundingBox, "BoundingBoxArray"]) -> "BoundingBoxArray":
+        """Get the intersection of each box with the box at the same position in another array.
+
+        Parameters
+        ----------
+        other : BoundingBox | BoundingBoxArray
+            Boxes to intersect with. A single box is intersected with every box.
+
+        Returns
+        -------
+        BoundingBoxArray
+            Intersections of each pair of boxes. Pairs that do not overlap give
+            empty boxes.
+        """
+        other = self._pairwise(other)
+        low = np.maximum(self._corners[:, 0], other._corners[:, 0])
+        high = np.minimum(self._corners[:, 1], other._corners[:, 1])
+        empty = np.any(low > high, axis=1)
+        low[empty] = np.nan
+        high[empty] = np.nan
+        return BoundingBoxArray(np.stack((low, high), axis=1))
+
+    def bounds(self) -> BoundingBox:
+        """Get the box enclosing all the boxes.
+
+        Returns
+        -------
+        BoundingBox
+            Box enclosing all the boxes that are not empty.
+
+        Raises
+        ------
+        ValueError
+            If the array holds no boxes or only empty boxes.
+        """
+        corners = self._corners[~self.is_empty]
+        if len(corners) == 0:
+            raise ValueError("Cannot bound an array with no boxes or only empty boxes.")
+        bounds = np.stack((corners[:, 0].min(axis=0), corners[:, 1].max(axis=0)))
+        return BoundingBoxArray(bounds[None])[0]
+
+    def to_index(self, items: list[Any] | None = None, leaf_size: int = 8) -> "BoundingBoxIndex":
+        """Build a spatial index over the boxes.
+
+        Parameters
+        ----------
+        items : list[Any], default: None
+            Objects the boxes belong to.
+        leaf_size : int, default: 8
+            Maximum number of boxes in a leaf of the hierarchy.
+
+        Returns
+        -------
+        BoundingBoxIndex
+            Index over the boxes.
+        """
+        from ansys.geometry.core.math.bbox_index import BoundingBoxIndex
+
+        if np.any(self.is_empty):
+            raise ValueError("Empty boxes cannot be indexed.")
+        return BoundingBoxIndex(self.min_corners, self.max_corners, items, leaf_size)
+
+    def _pairwise(self, other: Union[BoundingBox, "BoundingBoxArray"]) -> "BoundingBoxArray":
+        """Get boxes to combine one by one with these boxes."""
+        other = _as_array(other)
+        if len(other) not in (1, len(self)):
+            raise ValueError(
+                f"Cannot combine {len(self)} boxes with {len(other)} boxes. "
+                "Provide a single box or as many boxes."
+            )
+        return other
+
+    def __repr__(self) -> str:
+        """Represent the ``BoundingBoxArray`` as a string."""
+        return f"BoundingBoxArray(boxes={len(self)})"
+
+
+def _as_array(boxes: BoundingBox | BoundingBoxArray) -> BoundingBoxArray:
+    """Get boxes as a ``BoundingBoxArray``."""
+    return (
+        BoundingBoxArray.from_bounding_boxes([boxes]) if isinstance(boxes, BoundingBox) else boxes
+    )
@@ -0,0 +1,436 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a spatial index over axis-aligned bounding boxes."""
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ansys.geometry.core.misc.accuracy import Accuracy
+from ansys.geometry.core.typing import RealSequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.geometry.core.math.bbox import BoundingBox
+    from ansys.geometry.core.math.point import Point3D
+    from ansys.geometry.core.math.vector import Vector3D
+
+
+class BoundingBoxIndex:
+    """Provides a bounding volume hierarchy over axis-aligned bounding boxes.
+
+    The index answers overlap, point, ray and nearest-box queries without
+    comparing the query with every box, and finds all the pairs of overlapping
+    boxes at once. It is meant as a broad phase: the boxes it returns are
+    candidates that still need an exact check, such as ``Body.get_collision()``.
+
+    Parameters
+    ----------
+    min_corners : ~numpy.ndarray
+        ``(n, 3)`` array with the minimum corner of each box.
+    max_corners : ~numpy.ndarray
+        ``(n, 3)`` array with the maximum corner of each box.
+    items : list[Any], default: None
+        Objects the boxes belong to, such as bodies or faces. They are not used by
+        the index, which returns the positions of the boxes.
+    leaf_size : int, default: 8
+        Maximum number of boxes in a leaf of the hierarchy.
+
+    Notes
+    -----
+    Coordinates are given in the units of the corners. ``Point3D`` and ``Vector3D``
+    arguments are taken in base units, that is meters, which are the units of the
+    bounding boxes retrieved from the server. Boxes that touch are considered to
+    overlap.
+    """
+
+    def __init__(
+        self,
+        min_corners: np.ndarray,
+        max_corners: np.ndarray,
+        items: list[Any] | None = None,
+        leaf_size: int = 8,
+    ):
+        """Initialize the ``BoundingBoxIndex`` class."""
+        min_corners = np.asarray(min_corners, dtype=np.float64).reshape(-1, 3)
+        max_corners = np.asarray(max_corners, dtype=np.float64).reshape(-1, 3)
+        if min_corners.shape != max_corners.shape:
+            raise ValueError("The minimum and maximum corners must have the same shape.")
+        if np.any(min_corners > max_corners):
+            raise ValueError("The minimum corners must not exceed the maximum corners.")
+        if items is not None and len(items) != len(min_corners):
+            raise ValueError("There must be one item per bounding box.")
+        if leaf_size < 1:
+            raise ValueError("The leaf size must be at least 1.")
+
+        self._min = min_corners
+        self._max = max_corners
+        self._items = items
+        self._leaf_size = leaf_size
+        self._build()
+
+    @classmethod
+    def from_bounding_boxes(
+        cls, boxes: list["BoundingBox"], items: list[Any] | None = None, leaf_size: int = 8
+    ) -> "BoundingBoxIndex":
+        """Create an index from ``BoundingBox`` objects.
+
+        Parameters
+        ----------
+        boxes : list[BoundingBox]
+            Boxes to index.
+        items : list[Any], default: None
+            Objects the boxes belong to.
+        leaf_size : int, default: 8
+            Maximum number of boxes in a leaf of the hierarchy.
+
+        Returns
+        -------
+        BoundingBoxIndex
+            Index over the boxes, with coordinates in meters.
+        """
+        min_corners = np.array([np.asarray(box.min_corner) for box in boxes]).reshape(-1, 3)
+        max_corners = np.array([np.asarray(box.max_corner) for box in boxes]).reshape(-1, 3)
+        return cls(min_corners, max_corners, items, leaf_size)
+
+    @property
+    def min_corners(self) -> np.ndarray:
+        """Minimum corners of the boxes."""
+        return self._min
+
+    @property
+    def max_corners(self) -> np.ndarray:
+        """Maximum corners of the boxes."""
+        return self._max
+
+    @property
+    def items(self) -> list[Any] | None:
+        """Objects the boxes belong to."""
+        return self._items
+
+    def __len__(self) -> int:
+        """Return the number of boxes in the index."""
+        return len(self._min)
+
+    def query_box(
+        self, min_corner: "Point3D | RealSequence", max_corner: "Point3D | RealSequence"
+    ) -> np.ndarray:
+        """Find the boxes that overlap a box.
+
+        Parameters
+        ----------
+        min_corner : Point3D | RealSequence
+            Minimum corner of the box to query.
+        max_corner : Point3D | RealSequence
+            Maximum corner of the box to query.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Sorted positions of the overlapping boxes.
+        """
+        low = np.asarray(min_corner, dtype=np.float64).reshape(3)
+        high = np.asarray(max_corner, dtype=np.float64).reshape(3)
+
+        def hits(lows: np.ndarray, highs: np.ndarray) -> np.ndarray:
+            return np.all((lows <= high) & (highs >= low), axis=1)
+
+        return np.sort(self._traverse(hits))
+
+    def query_point(self, point: "Point3D | RealSequence") -> np.ndarray:
+        """Find the boxes that contain a point.
+
+        The point is considered to be in a box if it lies within ``LENGTH_ACCURACY``
+        of it, as in the ``BoundingBox.contains_point()`` method.
+
+        Parameters
+        ----------
+        point : Point3D | RealSequence
+            Point to query.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Sorted positions of the boxes containing the point.
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(3)
+        tolerance = Accuracy.length_accuracy()
+        return self.query_box(point - tolerance, point + tolerance)
+
+    def query_ray(
+        self,
+        origin: "Point3D | RealSequence",
+        direction: "Vector3D | RealSequence",
+        max_distance: float = np.inf,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the boxes that a ray goes through.
+
+        Parameters
+        ----------
+        origin : Point3D | RealSequence
+            Origin of the ray.
+        direction : Vector3D | RealSequence
+            Direction of the ray. It does not need to be normalized.
+        max_distance : float, default: inf
+            Length of the ray, in multiples of the length of ``direction``.
+
+        Returns
+        -------
+        tuple[~numpy.ndarray, ~numpy.ndarray]
+            Positions of the boxes hit by the ray and distances along the ray at
+            which the ray enters them, sorted by distance. The distance is zero for
+            the boxes that contain the origin.
+        """
+        origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        direction = np.asarray(direction, dtype=np.float64).reshape(3)
+        if not np.any(direction):
+            raise ValueError("The direction of the ray must not be a zero vector.")
+        parallel = direction == 0
+
+        def entries(lows: np.ndarray, highs: np.ndarray) -> np.ndarray:
+            # Slab test: intersect the intervals where the ray is within each pair of planes
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_low = (lows - origin) / direction
+                t_high = (highs - origin) / direction
+            t_near = np.minimum(t_low, t_high)
+            t_far = np.maximum(t_low, t_high)
+            # A ray parallel to a slab is within it everywhere, or nowhere
+            t_near[:, parallel] = -np.inf
+            t_far[:, parallel] = np.inf
+            outside = np.any(parallel & ((origin < lows) | (origin > highs)), axis=1)
+            enter = np.maximum(t_near.max(axis=1), 0.0)
+            leave = np.minimum(t_far.min(axis=1), max_distance)
+            return np.where((enter <= leave) & ~outside, enter, np.nan)
+
+        indices = self._traverse(lambda lows, highs: ~np.isnan(entries(lows, highs)))
+        distances = entries(self._min[indices], self._max[indices])
+        order = np.argsort(distances, kind="stable")
+        return indices[order], distances[order]
+
+    def nearest(
+        self, point: "Point3D | RealSequence", count: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the boxes closest to a point.
+
+        The distance to a box is a lower bound of the distance to the object it
+        belongs to, so the objects of the returned boxes are the candidates for the
+        objects closest to the point.
+
+        Parameters
+        ----------
+        point : Point3D | RealSequence
+            Point to query.
+        count : int, default: 1
+            Number of boxes to return.
+
+        Returns
+        -------
+        tuple[~numpy.ndarray, ~numpy.ndarray]
+            Positions of the closest boxes and their distances to the point, sorted
+            by distance. The distance is zero for the boxes containing the point.
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(3)
+        # A single vectorized pass over all the boxes is faster in NumPy than a
+        # best-first traversal of the hierarchy, which visits the nodes one at a time
+        gaps = np.maximum(np.maximum(self._min - point, point - self._max), 0.0)
+        distances = np.linalg.norm(gaps, axis=1)
+
+        count = min(count, len(distances))
+        if count <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        closest = np.argpartition(distances, count - 1)[:count]
+        closest = closest[np.argsort(distances[closest], kind="stable")]
+        return closest, distances[closest]
+
+    def overlapping_pairs(
+        self, other: "BoundingBoxIndex | None" = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the pairs of overlapping boxes.
+
+        Parameters
+        ----------
+        other : BoundingBoxIndex, default: None
+            Index whose boxes are compared with the boxes of this index. If
+            ``None``, the boxes of this index are compared with each other.
+
+        Returns
+        -------
+        tuple[~numpy.ndarray, ~numpy.ndarray]
+            Positions of the boxes of each pair, in this index and in the other
+            one. When ``other`` is ``None``, each pair appears once, with the lower
+            position first, and boxes are not paired with themselves.
+        """
+        symmetric = other is None
+        other = self if symmetric else other
+        if len(self) == 0 or len(other) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        # Descend both hierarchies at once, keeping the pairs of nodes that overlap
+        leaf_pairs = []
+        pairs = np.zeros((1, 2), dtype=np.intp)
+        while len(pairs):
+            a, b = pairs[:, 0], pairs[:, 1]
+            overlap = np.all(
+                (self._node_min[a] <= other._node_max[b])
+                & (self._node_max[a] >= other._node_min[b]),
+                axis=1,
+            )
+            a, b = a[overlap], b[overlap]
+
+            leaf_a = self._left[a] < 0
+            leaf_b = other._left[b] < 0
+            leaves = leaf_a & leaf_b
+            leaf_pairs.append(np.column_stack((a[leaves], b[leaves])))
+            a, b, leaf_a, leaf_b = a[~leaves], b[~leaves], leaf_a[~leaves], leaf_b[~leaves]
+
+            children = []
+            if symmetric:
+                # A node paired with itself yields its two children paired with
+                # themselves and with each other, so each pair of nodes is seen once
+                same = a == b
+                left, right = self._left[a[same]], self._right[a[same]]
+                children += [(left, left), (left, right), (right, right)]
+                a, b, leaf_a, leaf_b = a[~same], b[~same], leaf_a[~same], leaf_b[~same]
+
+            # Split the larger node, unless it is a leaf
+            split_a = ~leaf_a & (leaf_b | (self._size[a] >= other._size[b]))
+            children += [
+                (self._left[a[split_a]], b[split_a]),
+                (self._right[a[split_a]], b[split_a]),
+                (a[~split_a], other._left[b[~split_a]]),
+                (a[~split_a], other._right[b[~split_a]]),
+            ]
+            pairs = np.concatenate([np.column_stack(child) for child in children])
+
+        leaf_pairs = np.concatenate(leaf_pairs)
+        # Compare the boxes of each pair of leaves, padded to the leaf size
+        first = self._leaf_boxes[self._leaf_slot[leaf_pairs[:, 0]]][:, :, None]
+        second = other._leaf_boxes[other._leaf_slot[leaf_pairs[:, 1]]][:, None, :]
+        first, second = np.broadcast_arrays(first, second)
+        valid = (first >= 0) & (second >= 0)
+        if symmetric:
+            valid &= (leaf_pairs[:, 0] != leaf_pairs[:, 1])[:, None, None] | (first < second)
+        first, second = first[valid], second[valid]
+
+        overlap = np.all(
+            (self._min[first] <= other._max[second]) & (self._max[first] >= other._min[second]),
+            axis=1,
+        )
+        first, second = first[overlap], second[overlap]
+        if symmetric:
+            first, second = np.minimum(first, second), np.maximum(first, second)
+
+        order = np.lexsort((second, first))
+        return first[order], second[order]
+
+    def _build(self) -> None:
+        """Build the hierarchy by splitting the boxes at the median of their centers."""
+        count = len(self._min)
+        centers = (self._min + self._max) / 2
+        order = np.arange(count)
+
+        starts, sizes, lefts, rights = [], [], [], []
+        stack = [(0, count, -1, False)]
+        while stack:
+            start, stop, parent, is_right = stack.pop()
+            node = len(starts)
+            starts.append(start)
+            sizes.append(stop - start)
+            lefts.append(-1)
+            rights.append(-1)
+            if parent >= 0:
+                (rights if is_right else lefts)[parent] = node
+
+            if stop - start <= self._leaf_size:
+                continue
+
+            # Split along the axis over which the centers are the most spread
+            members = order[start:stop]
+            spread = np.ptp(centers[members], axis=0)
+            axis = int(np.argmax(spread))
+            middle = (stop - start) // 2
+            partition = np.argpartition(centers[members, axis], middle)
+            order[start:stop] = members[partition]
+            stack.append((start + middle, stop, node, True))
+            stack.append((start, start + middle, node, False))
+
+        self._order = order
+        self._start = np.array(starts, dtype=np.intp)
+        self._size = np.array(sizes, dtype=np.intp)
+        self._left = np.array(lefts, dtype=np.intp)
+        self._right = np.array(rights, dtype=np.intp)
+
+        # Compute the bounds of the nodes from the leaves up. Children are always
+        # created after their parent, so a reverse pass visits them first.
+        nodes = len(starts)
+        # The root of an empty index has no boxes, and bounds that overlap nothing
+        self._node_min = np.full((nodes, 3), np.inf)
+        self._node_max = np.full((nodes, 3), -np.inf)
+        leaves = np.flatnonzero(self._left < 0)
+        if count:
+            # The leaves cover consecutive ranges of the boxes, in the order of the index
+            leaves = leaves[np.argsort(self._start[leaves])]
+            self._node_min[leaves] = np.minimum.reduceat(self._min[order], self._start[leaves])
+            self._node_max[leaves] = np.maximum.reduceat(self._max[order], self._start[leaves])
+        for node in range(nodes - 1, -1, -1):
+            if self._left[node] >= 0:
+                left, right = self._left[node], self._right[node]
+                self._node_min[node] = np.minimum(self._node_min[left], self._node_min[right])
+                self._node_max[node] = np.maximum(self._node_max[left], self._node_max[right])
+
+        # Boxes of each leaf, padded with -1, for the vectorized queries
+        self._leaf_slot = np.full(nodes, -1, dtype=np.intp)
+        self._leaf_slot[leaves] = np.arange(len(leaves))
+        self._leaf_boxes = np.full((len(leaves), self._leaf_size), -1, dtype=np.intp)
+        for slot, leaf in enumerate(leaves):
+            start = self._start[leaf]
+            self._leaf_boxes[slot, : self._size[leaf]] = order[start : start + self._size[leaf]]
+
+    def _traverse(self, hits) -> np.ndarray:
+        """Find the boxes for which ``hits(min_corners, max_corners)`` holds.
+
+        The test is applied to the bounds of the nodes, and then to the boxes of the
+        leaves that are reached, so it must hold for a node whenever it holds for
+        one of its boxes.
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        found = []
+        nodes = np.zeros(1, dtype=np.intp)
+        while len(nodes):
+            nodes = nodes[hits(self._node_min[nodes], self._node_max[nodes])]
+            leaves = nodes[self._left[nodes] < 0]
+            if len(leaves):
+                boxes = self._leaf_boxes[self._leaf_slot[leaves]].ravel()
+                found.append(boxes[boxes >= 0])
+            nodes = nodes[self._left[nodes] >= 0]
+            nodes = np.concatenate((self._left[nodes], self._right[nodes]))
+
+        if not found:
+            return np.empty(0, dtype=np.intp)
+        candidates = np.concatenate(found)
+        return candidates[hits(self._min[candidates], self._max[candidates])]
+
+    def __repr__(self) -> str:
+        """Represent the ``BoundingBoxIndex`` as a string."""
+        return f"BoundingBoxIndex(boxes={len(self)}, nodes={len(self._start)})"
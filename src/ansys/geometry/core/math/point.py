@@ -22,6 +22,7 @@
 
 """Provides geometry primitive representation for 2D and 3D points."""
 
+from functools import cache
 from typing import TYPE_CHECKING, Union
 
 import numpy as np
@@ -46,8 +47,18 @@ DEFAULT_POINT3D_VALUES = [np.nan, np.nan, np.nan]
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.math.vector import Vector2D, Vector3D
 
-BASE_UNIT_LENGTH = UNITS.get_base_units(DEFAULT_UNITS.LENGTH)[1]
-"""Default value for the length of the base unit."""
+
+@cache
+def _base_unit_length() -> Unit:
+    """Get the base unit of the lengths, building the units registry if needed."""
+    return UNITS.get_base_units(DEFAULT_UNITS.LENGTH)[1]
+
+
+def __getattr__(name: str):
+    """Resolve ``BASE_UNIT_LENGTH``, the base unit of the lengths, on first access."""
+    if name == "BASE_UNIT_LENGTH":
+        return _base_unit_length()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Point2D(np.ndarray, PhysicalQuantity):
@@ -173,7 +184,7 @@ class Point2D(np.ndarray, PhysicalQuantity):
         if hasattr(self, "_base_unit"):
             return self._base_unit
         else:
-            self._base_unit = BASE_UNIT_LENGTH
+            self._base_unit = _base_unit_length()
             return self._base_unit
 
 
@@ -317,7 +328,7 @@ class Point3D(np.ndarray, PhysicalQuantity):
         if hasattr(self, "_base_unit"):
             return self._base_unit
         else:
-            self._base_unit = BASE_UNIT_LENGTH
+            self._base_unit = _base_unit_length()
             return self._base_unit
 
     def transform(self, matrix: "Matrix44") -> "Point3D":
@@ -32,7 +32,10 @@ from ansys.geometry.core.misc.auxiliary import (
     get_design_from_face,
     get_edges_from_ids,
     get_faces_from_ids,
+    get_shapes_from_edges,
+    get_shapes_from_faces,
 )
+from ansys.geometry.core.misc.cache import CacheInfo, LRUCache
 from ansys.geometry.core.misc.checks import (
     check_is_float_int,
     check_ndarray_is_all_nan,
@@ -25,6 +25,8 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
+import numpy as np
+
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.beam import Beam
     from ansys.geometry.core.designer.body import Body
@@ -38,6 +40,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.edge import Edge
     from ansys.geometry.core.designer.face import Face
     from ansys.geometry.core.designer.vertex import Vertex
+    from ansys.geometry.core.shapes.curves.trimmed_curve import TrimmedCurve
+    from ansys.geometry.core.shapes.surfaces.trimmed_surface import TrimmedSurface
 
 try:
     from ansys.tools.visualization_interface.utils.color import Color
@@ -60,12 +64,8 @@ def get_design_from_component(component: "Component") -> "Design":
     Design
         The ``Design`` of the provided component object.
     """
-    # Get the design of the component
-    while component.parent_component is not None:
-        component = component.parent_component
-
-    # Return the design
-    return component
+    # Components hold a weak reference to the design they belong to
+    return component._design_ref()
 
 
 def get_design_from_body(body: "Body") -> "Design":
@@ -81,11 +81,8 @@ def get_design_from_body(body: "Body") -> "Design":
     Design
         The ``Design`` of the provided body object.
     """
-    # Get the parent component of the body
-    component = body.parent_component
-
-    # Get the design of the component
-    return get_design_from_component(component)
+    # Bodies hold a weak reference to the design they belong to
+    return body._design_ref()
 
 
 def get_design_from_face(face: "Face") -> "Design":
@@ -121,8 +118,8 @@ def get_design_from_edge(edge: "Edge") -> "Design":
     Design
         The ``Design`` of the provided edge object.
     """
-    # Get the one of the bodies of the edge
-    body = edge.faces[0].body
+    # Get the parent body of the edge
+    body = edge.body
 
     # Get the design of the body
     return get_design_from_body(body)
@@ -226,9 +223,8 @@ def get_components_from_ids(design: "Design", component_ids: list[str]) -> list[
     -----
     This method takes a design and component ids, and gets their corresponding ``Component`` object.
     """
-    return [
-        comp for comp in __traverse_component_elem("components", design) if comp.id in component_ids
-    ]  # noqa: E501
+    ids = set(component_ids)
+    return [comp for comp in __traverse_component_elem("components", design) if comp.id in ids]
 
 
 def get_faces_from_ids(design: "Design", face_ids: list[str]) -> list["Face"]:
@@ -250,9 +246,12 @@ def get_faces_from_ids(design: "Design", face_ids: list[str]) -> list["Face"]:
     -----
     This method takes a design and face ids, and gets their corresponding ``Face`` object.
     """
-    return [
-        face for body in __traverse_all_bodies(design) for face in body.faces if face.id in face_ids
-    ]  # noqa: E501
+    if not face_ids:
+        # Avoid requesting the faces of every body when there is nothing to find
+        return []
+
+    ids = set(face_ids)
+    return [face for body in __traverse_all_bodies(design) for face in body.faces if face.id in ids]
 
 
 def get_edges_from_ids(design: "Design", edge_ids: list[str]) -> list["Edge"]:
@@ -274,6 +273,10 @@ def get_edges_from_ids(design: "Design", edge_ids: list[str]) -> list["Edge"]:
     -----
     This method takes a design and edge ids, and gets their corresponding ``Edge`` objects.
     """
+    if not edge_ids:
+        # Avoid requesting the edges of every body when there is nothing to find
+        return []
+
     edge_map = {edge.id: edge for body in __traverse_all_bodies(design) for edge in body.edges}
     return [edge_map[eid] for eid in edge_ids if eid in edge_map]
 
@@ -301,6 +304,109 @@ def build_edge_id_map(design: "Design") -> "dict[str, Edge]":
     return {edge.id: edge for body in __traverse_all_bodies(design) for edge in body.edges}
 
 
+def get_shapes_from_edges(edges: list["Edge"]) -> list["TrimmedCurve"]:
+    """Get the underlying trimmed curves of several ``Edge`` objects at once.
+
+    Parameters
+    ----------
+    edges : list[Edge]
+        Edges to get the shapes of. All of them must belong to the same design.
+
+    Returns
+    -------
+    list[TrimmedCurve]
+        Shapes of the edges, in the same order as the edges.
+
+    Notes
+    -----
+    The geometry of all the edges without a shape cached for the current revision of
+    the design, either in the edge or in the shape cache of the client, is requested
+    in a single batch, instead of issuing several requests per edge. The shapes are
+    cached as if the ``Edge.shape`` property had been accessed.
+    """
+    pending = [edge for edge in edges if edge._get_cached_shape() is None]
+    if pending:
+        response = pending[0]._grpc_client.services.edges.get_geometry(
+            ids=[edge.id for edge in pending]
+        )
+        for edge, geometry in zip(pending, response.get("edges")):
+            edge._cache_shape(edge._build_shape(geometry))
+
+    return [edge.shape for edge in edges]
+
+
+def get_shapes_from_faces(faces: list["Face"]) -> list["TrimmedSurface"]:
+    """Get the underlying trimmed surfaces of several ``Face`` objects at once.
+
+    Parameters
+    ----------
+    faces : list[Face]
+        Faces to get the shapes of. All of them must belong to the same design.
+
+    Returns
+    -------
+    list[TrimmedSurface]
+        Shapes of the faces, in the same order as the faces.
+
+    Notes
+    -----
+    The geometry of all the faces without a shape cached for the current revision of
+    the design, either in the face or in the shape cache of the client, is requested
+    in a single batch, instead of issuing several requests per face. The shapes are
+    cached as if the ``Face.shape`` property had been accessed.
+    """
+    pending = [face for face in faces if face._get_cached_shape() is None]
+    if pending:
+        response = pending[0]._grpc_client.services.faces.get_geometry(
+            ids=[face.id for face in pending], surface_types=[face.surface_type for face in pending]
+        )
+        for face, geometry in zip(pending, response.get("faces")):
+            face._cache_shape(face._build_shape(geometry))
+
+    return [face.shape for face in faces]
+
+
+def get_bounding_box_corners(
+    objects: list[Union["Body", "Face", "Edge"]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the corners of the bounding boxes of several objects at once.
+
+    Parameters
+    ----------
+    objects : list[Union[Body, Face, Edge]]
+        Objects to get the bounding boxes of. All of them must belong to the same design.
+
+    Returns
+    -------
+    tuple[~numpy.ndarray, ~numpy.ndarray]
+        ``(n, 3)`` arrays with the minimum and maximum corners of the boxes, in the
+        same order as the objects, in server units, that is meters.
+
+    Notes
+    -----
+    The boxes are requested in a single batch per kind of object, instead of
+    issuing a request per object.
+    """
+    from ansys.geometry.core.designer.edge import Edge
+    from ansys.geometry.core.designer.face import Face
+
+    kinds = {"bodies": [], "faces": [], "edges": []}
+    for index, obj in enumerate(objects):
+        kind = "faces" if isinstance(obj, Face) else "edges" if isinstance(obj, Edge) else "bodies"
+        kinds[kind].append(index)
+
+    corners = np.empty((2, len(objects), 3))
+    for kind, indices in kinds.items():
+        if not indices:
+            continue
+        services = objects[indices[0]]._grpc_client.services
+        ids = [objects[index].id for index in indices]
+        boxes = getattr(services, kind).get_bounding_boxes(ids=ids).get("boxes")
+        corners[0, indices] = [box["min_corner"] for box in boxes]
+        corners[1, indices] = [box["max_corner"] for box in boxes]
+    return corners[0], corners[1]
+
+
 def get_vertices_from_ids(design: "Design", vertex_ids: list[str]) -> list["Vertex"]:
     """Find the ``Vertex`` objects inside a ``Design`` from its ids.
 
@@ -320,12 +426,17 @@ def get_vertices_from_ids(design: "Design", vertex_ids: list[str]) -> list["Vert
     -----
     This method takes a design and vertex ids, and gets their corresponding ``Vertex`` objects.
     """
+    if not vertex_ids:
+        # Avoid requesting the vertices of every body when there is nothing to find
+        return []
+
+    ids = set(vertex_ids)
     return [
         vertex
         for body in __traverse_all_bodies(design)
         for vertex in body.vertices
-        if vertex.id in vertex_ids
-    ]  # noqa: E501
+        if vertex.id in ids
+    ]
 
 
 def get_beams_from_ids(design: "Design", beam_ids: list[str]) -> list["Beam"]:
@@ -347,7 +458,8 @@ def get_beams_from_ids(design: "Design", beam_ids: list[str]) -> list["Beam"]:
     -----
     This method takes a design and beam ids, and gets their corresponding ``Beam`` objects.
     """
-    return [beam for beam in __traverse_all_beams(design) if beam.id in beam_ids]  # noqa: E501
+    ids = set(beam_ids)
+    return [beam for beam in __traverse_all_beams(design) if beam.id in ids]
 
 
 def get_design_points_from_ids(
@@ -372,7 +484,8 @@ def get_design_points_from_ids(
     This method takes a design and design point ids, and gets their corresponding ``DesignPoint``
     objects.
     """
-    return [dp for dp in __traverse_all_design_points(design) if dp.id in design_point_ids]
+    ids = set(design_point_ids)
+    return [dp for dp in __traverse_all_design_points(design) if dp.id in ids]
 
 
 def get_design_curves_from_ids(
@@ -397,7 +510,8 @@ def get_design_curves_from_ids(
     This method takes a design and design curve ids, and gets their corresponding ``DesignCurve``
     objects.
     """
-    return [dc for dc in __traverse_all_design_curves(design) if dc.id in design_curve_ids]
+    ids = set(design_curve_ids)
+    return [dc for dc in __traverse_all_design_curves(design) if dc.id in ids]
 
 
 def get_datum_planes_from_ids(design: "Design", datum_plane_ids: list[str]) -> list["DatumPlane"]:
@@ -420,7 +534,8 @@ def get_datum_planes_from_ids(design: "Design", datum_plane_ids: list[str]) -> l
     This method takes a design and datum plane ids, and gets their corresponding ``DatumPlane``
     objects.
     """
-    return [dp for dp in design.datum_planes if dp.id in datum_plane_ids]
+    ids = set(datum_plane_ids)
+    return [dp for dp in design.datum_planes if dp.id in ids]
 
 
 def get_coordinate_systems_from_ids(
@@ -445,7 +560,8 @@ def get_coordinate_systems_from_ids(
     This method takes a design and coordinate system ids, and gets their corresponding
     ``CoordinateSystem`` objects.
     """
-    return [cs for cs in design.coordinate_systems if cs.id in coordinate_system_ids]
+    ids = set(coordinate_system_ids)
+    return [cs for cs in design.coordinate_systems if cs.id in ids]
 
 
 def get_datum_points_from_ids(design: "Design", datum_point_ids: list[str]) -> list["DatumPoint"]:
@@ -468,7 +584,8 @@ def get_datum_points_from_ids(design: "Design", datum_point_ids: list[str]) -> l
     This method takes a design and datum point ids, and gets their corresponding ``DatumPoint``
     objects.
     """
-    return [dp for dp in __traverse_all_datum_points(design) if dp.id in datum_point_ids]
+    ids = set(datum_point_ids)
+    return [dp for dp in __traverse_all_datum_points(design) if dp.id in ids]
 
 
 def convert_color_to_hex(
@@ -0,0 +1,236 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a bounded cache for objects retrieved from the server."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of an ``LRUCache``.
+
+    Parameters
+    ----------
+    hits : int
+        Number of lookups that found an entry.
+    misses : int
+        Number of lookups that found no entry.
+    max_size : int
+        Maximum number of entries.
+    size : int
+        Current number of entries.
+    """
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the lookups that found an entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Provides a thread-safe cache that drops the least recently used entries.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of entries. When it is reached, adding an entry drops the
+        entry that was used the longest time ago. A size of zero disables the cache.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize the ``LRUCache`` class."""
+        if max_size < 0:
+            raise ValueError("The maximum size of a cache must not be negative.")
+
+        self._entries = OrderedDict()
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of entries."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError("The maximum size of a cache must not be negative.")
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the entry of a key, and mark it as the most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the entry.
+        default : Any, default: None
+            Value to return if there is no entry for the key.
+
+        Returns
+        -------
+        Any
+            Entry of the key, or ``default`` if there is none.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add or replace the entry of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the entry.
+        value : Any
+            Entry to store.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            Hits, misses and size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._max_size, len(self._entries))
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether there is an entry for a key, without marking it as used."""
+        return key in self._entries
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond the maximum size."""
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def __repr__(self) -> str:
+        """Represent the ``LRUCache`` as a string."""
+        info = self.info()
+        return (
+            f"LRUCache(size={info.size}, max_size={info.max_size}, hits={info.hits}, "
+            f"misses={info.misses})"
+        )
+
+
+class _CachedShapeMixin:
+    """Provides the caching of the shape of a face or an edge.
+
+    The shape is tagged with the revisions of the design and of the body it was
+    retrieved at, and it is shared with the other objects of the same face or edge
+    through the shape cache of the client. Classes using it provide the ``_id``,
+    ``_is_reversed``, ``_body`` and ``_grpc_client`` attributes, and the kind of their
+    shape as ``_shape_kind``.
+    """
+
+    __slots__ = ("_shape", "_shape_revision")
+
+    _shape_kind: str
+
+    def _design(self) -> Any:
+        """Design of the object, or ``None`` if the object has no design."""
+        design_ref = getattr(self._body, "_design_ref", None)
+        return design_ref() if design_ref is not None else None
+
+    def _design_revision(self) -> int | None:
+        """Revision of the design of the object, or ``None`` if the object has no design."""
+        design = self._design()
+        return None if design is None else design.revision
+
+    def _geometry_revision(self, design: Any) -> tuple[int, int]:
+        """Revisions of the design and of the master body of the object.
+
+        The revision of the master body changes when only this body is modified.
+        """
+        body = getattr(self._body, "_template", self._body)
+        return (design.revision, body._geometry_revision)
+
+    def _shape_cache_key(self, design: Any, revision: tuple[int, int]) -> tuple:
+        """Key of the shape of the object in the shape cache of the client.
+
+        The key holds the design, since the objects of different designs may share IDs.
+        """
+        return (self._shape_kind, design._cache_id, self._id, self._is_reversed, revision)
+
+    def _get_cached_shape(self) -> Any:
+        """Get the shape of the object for the current revision of its geometry, if it is cached.
+
+        The shape is looked up in the object first, and then in the shape cache of the client.
+        """
+        design = self._design()
+        revision = None if design is None else self._geometry_revision(design)
+        if self._shape is None or self._shape_revision != revision:
+            self._shape = (
+                None
+                if design is None
+                else self._grpc_client.shape_cache.get(self._shape_cache_key(design, revision))
+            )
+            self._shape_revision = revision
+        return self._shape
+
+    def _cache_shape(self, shape: Any) -> None:
+        """Set the shape of the object, and share it through the shape cache of the client."""
+        design = self._design()
+        revision = None if design is None else self._geometry_revision(design)
+        self._shape = shape
+        self._shape_revision = revision
+        if design is not None:
+            self._grpc_client.shape_cache.put(self._shape_cache_key(design, revision), shape)
@@ -42,6 +42,23 @@ if TYPE_CHECKING:  # pragma: no cover
 _F = TypeVar("_F", bound=Callable[..., Any])
 
 
+def _get_design_ref(obj) -> "Design":
+    """Get the design an object belongs to.
+
+    Components, bodies and design curves hold a weak reference to their design,
+    which is set at construction. Any other object reaches it through its parent.
+    """
+    design_ref = getattr(obj, "_design_ref", None)
+    if design_ref is not None:  # In case of a Design, Component, Body, DesignCurve
+        return design_ref()
+    elif hasattr(obj, "_parent_component"):  # In case of a DesignPoint, Beam
+        return _get_design_ref(obj._parent_component)
+    elif hasattr(obj, "_body"):  # In case of a Face, Edge
+        return _get_design_ref(obj._body)
+    else:
+        raise ValueError("Unable to find the design reference.")
+
+
 def ensure_design_is_active(method: _F) -> _F:
     """Make sure that the design is active before executing a method.
 
@@ -60,23 +77,8 @@ def ensure_design_is_active(method: _F) -> _F:
             # If the user has disabled the check, then we can skip it
             return method(*args, **kwargs)
 
-        # Check if the current design is active... otherwise activate it
-        def get_design_ref(obj) -> "Design":
-            if hasattr(obj, "_modeler"):  # In case of a Design object
-                return obj
-            elif hasattr(
-                obj, "_parent_component"
-            ):  # In case of a Body, Component, DesignPoint, Beam
-                # Recursive call
-                return get_design_ref(obj._parent_component)
-            elif hasattr(obj, "_body"):  # In case of a Face, Edge
-                # Recursive call
-                return get_design_ref(obj._body._parent_component)
-            else:
-                raise ValueError("Unable to find the design reference.")
-
         # Get the design reference
-        design = get_design_ref(self)
+        design = _get_design_ref(self)
 
         # Verify whether the Design has been closed on the backend
         if design.is_closed:
@@ -90,6 +92,28 @@ def ensure_design_is_active(method: _F) -> _F:
     return wrapper  # type: ignore[return-value]
 
 
+def bump_design_revision(method: _F) -> _F:
+    """Increase the revision of the design after executing a method.
+
+    This function is necessary to be called whenever an operation may change
+    the geometry of the design on the server. Data cached by the client for an
+    older revision of the design, such as shapes and tessellations, is then
+    retrieved again. The revision is increased even if the method fails, since
+    the design may have been partially changed.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            design = _get_design_ref(args[0])
+            if design is not None:
+                design._bump_revision()
+
+    return wrapper  # type: ignore[return-value]
+
+
 def check_input_types(func: _F) -> _F:
     """Conditionally apply runtime type checking based on a global flag.
 
@@ -75,42 +75,47 @@ class DefaultUnitsClass(metaclass=SingletonMeta):
 
     def __init__(self) -> None:
         """Initialize the ``DefaultUnitsClass`` class."""
-        self._length: Unit = UNITS.meter
-        self._angle: Unit = UNITS.radian
-        self._server_length: Unit = UNITS.meter
-        self._server_angle: Unit = UNITS.radian
+        # Units are resolved on first access to avoid building the units registry on import
+        self._length: Unit | None = None
+        self._angle: Unit | None = None
+        self._server_length: Unit | None = None
+        self._server_angle: Unit | None = None
 
     @property
     def LENGTH(self) -> Unit:  # noqa: N802
         """Default length unit for PyAnsys Geometry."""
+        if self._length is None:
+            self._length = UNITS.meter
         return self._length
 
     @LENGTH.setter
     @check_input_types
     def LENGTH(self, value: Unit) -> None:  # noqa: N802
-        check_pint_unit_compatibility(value, self._length)
+        check_pint_unit_compatibility(value, self.LENGTH)
         self._length = value
 
     @property
     def ANGLE(self) -> Unit:  # noqa: N802
         """Default angle unit for PyAnsys Geometry."""
+        if self._angle is None:
+            self._angle = UNITS.radian
         return self._angle
 
     @ANGLE.setter
     @check_input_types
     def ANGLE(self, value: Unit) -> None:  # noqa: N802
-        check_pint_unit_compatibility(value, self._angle)
+        check_pint_unit_compatibility(value, self.ANGLE)
         self._angle = value
 
     @property
     def AREA(self) -> Unit:  # noqa: N802
         """Default area unit for PyAnsys Geometry."""
-        return self._length * self._length
+        return self.LENGTH * self.LENGTH
 
     @property
     def VOLUME(self) -> Unit:  # noqa: N802
         """Default volume unit for PyAnsys Geometry."""
-        return self._length * self._length * self._length
+        return self.LENGTH * self.LENGTH * self.LENGTH
 
     @property
     def SERVER_LENGTH(self) -> Unit:  # noqa: N802
@@ -120,6 +125,8 @@ class DefaultUnitsClass(metaclass=SingletonMeta):
         -----
         The default units on the server side are not modifiable yet.
         """
+        if self._server_length is None:
+            self._server_length = UNITS.meter
         return self._server_length
 
     @property
@@ -130,7 +137,7 @@ class DefaultUnitsClass(metaclass=SingletonMeta):
         -----
         The default units on the server side are not modifiable yet.
         """
-        return self._server_length * self._server_length
+        return self.SERVER_LENGTH * self.SERVER_LENGTH
 
     @property
     def SERVER_VOLUME(self) -> Unit:  # noqa: N802
@@ -140,7 +147,7 @@ class DefaultUnitsClass(metaclass=SingletonMeta):
         -----
         The default units on the server side are not modifiable yet.
         """
-        return self._server_length * self._server_length * self._server_length
+        return self.SERVER_LENGTH * self.SERVER_LENGTH * self.SERVER_LENGTH
 
     @property
     def SERVER_ANGLE(self) -> Unit:  # noqa: N802
@@ -150,6 +157,8 @@ class DefaultUnitsClass(metaclass=SingletonMeta):
         -----
         The default units on the server side are not modifiable yet.
         """
+        if self._server_angle is None:
+            self._server_angle = UNITS.radian
         return self._server_angle
 
 
@@ -25,14 +25,17 @@
 from dataclasses import asdict, dataclass
 from enum import Enum, unique
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pint import Quantity
 
 from ansys.geometry.core.misc.checks import check_input_types
 from ansys.geometry.core.misc.measurements import Angle, Distance
-from ansys.geometry.core.shapes.surfaces.surface_evaluation import SurfaceEvaluation
 from ansys.geometry.core.typing import Real
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.geometry.core.shapes.surfaces.surface_evaluation import SurfaceEvaluation
+
 
 @dataclass
 class ImportOptions:
@@ -481,7 +484,7 @@ class VolumeExtractOptions:
         create_shared_topology: bool | None = None,
         imprint_capping_edges: bool | None = None,
         merge_created_volume: bool | None = None,
-        seed_point: SurfaceEvaluation | None = None,
+        seed_point: "SurfaceEvaluation | None" = None,
         tolerance: Distance | Quantity | Real | None = None,
         create_capping_surfaces: bool | None = None,
         detect_leaks: bool | None = None,
@@ -524,7 +527,7 @@ class VolumeExtractOptions:
         return self._merge_created_volume
 
     @property
-    def seed_point(self) -> SurfaceEvaluation | None:
+    def seed_point(self) -> "SurfaceEvaluation | None":
         """Seed point.
 
         Seed point on the surface from which to extract the volume.
@@ -22,13 +22,17 @@
 
 """Provides for handling units homogeneously throughout PyAnsys Geometry."""
 
-from pint import Quantity, Unit, UnitRegistry, set_application_registry
+from pint import LazyRegistry, Quantity, Unit, set_application_registry
 
 from ansys.geometry.core.misc.checks import check_input_types, check_pint_unit_compatibility
 from ansys.geometry.core.typing import Real
 
-UNITS = UnitRegistry()
-"""Units manager."""
+UNITS = LazyRegistry()
+"""Units manager.
+
+The registry is built on first use. It then turns into a regular
+:class:`pint.UnitRegistry`, so this object can be shared safely.
+"""
 
 # This forces pint to set the previous UnitRegistry as the one to use
 set_application_registry(UNITS)
@@ -227,6 +227,12 @@ class Modeler:
         -------
         Design
             Design object already existing on the server.
+
+        Notes
+        -----
+        The components and bodies of the design are created right away. Its materials,
+        beams, named selections and coordinate systems are created the first time
+        they are accessed.
         """
         from ansys.geometry.core.designer.design import Design
 
@@ -23,3 +23,4 @@
 """PyAnsys Geometry parameters subpackage."""
 
 from ansys.geometry.core.parameters.parameter import Parameter, ParameterType
+from ansys.geometry.core.parameters.sweep import ParameterSweep, VariantResult
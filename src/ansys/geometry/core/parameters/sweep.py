@@ -0,0 +1,362 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a design-of-experiments runner for the parameters of a design."""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from pint import Quantity
+
+from ansys.geometry.core.errors import GeometryExitedError, GeometryRuntimeError
+from ansys.geometry.core.parameters.parameter import Parameter, ParameterUpdateStatus
+from ansys.geometry.core.typing import Real
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.geometry.core.designer.design import Design, DesignFileFormat
+
+
+@dataclass
+class VariantResult:
+    """Outcome of a variant of a parameter sweep.
+
+    Parameters
+    ----------
+    index : int
+        Index of the variant in the table of variants.
+    values : dict[str, ~pint.Quantity | Real]
+        Parameter values of the variant, keyed by parameter name.
+    result : Any, default: None
+        Value returned by the evaluation of the variant.
+    file : ~pathlib.Path, default: None
+        Location of the downloaded design of the variant.
+    error : str, default: None
+        Description of the failure of the variant, if any.
+    """
+
+    index: int
+    values: dict[str, Quantity | Real]
+    result: Any = None
+    file: Path | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the variant was evaluated successfully."""
+        return self.error is None
+
+
+class ParameterSweep:
+    """Runs a design-of-experiments sweep over the parameters of a design.
+
+    Each variant sets the parameters of the design in a single request, synchronizes
+    the design once, and then evaluates and downloads it. Variants are distributed
+    over the given designs, which run in parallel. Downloaded files are written to
+    disk in the background while the next variant regenerates.
+
+    Parameters
+    ----------
+    designs : Design | list[Design]
+        Designs to run the variants on. Each design must belong to a different
+        modeler, and all of them must hold the same model, typically opened from
+        the same file.
+    variants : list[dict[str, ~pint.Quantity | Real]]
+        Parameter values of each variant, keyed by parameter name. Parameters
+        missing from a variant keep the value they had when the sweep first ran.
+    evaluate : Callable[[Design, dict], Any], default: None
+        Evaluation of a variant, such as its volume or mass properties. It is called
+        with the design, once its parameters are set, and with the values of the
+        variant. When a checkpoint is used, its result should be serializable to JSON.
+    export_format : DesignFileFormat, default: None
+        Format to download the design of each variant in. Files are named
+        ``variant_<index>`` after the index of the variant.
+    output_directory : ~pathlib.Path | str, default: None
+        Directory to download the designs to. It is required when
+        ``export_format`` is given.
+    checkpoint : ~pathlib.Path | str, default: None
+        JSON Lines file the outcome of each variant is appended to as soon as it
+        finishes. When the file already exists, the variants that succeeded are not
+        run again, so an interrupted sweep can be resumed. Outcomes recorded for
+        different parameter values are ignored.
+
+    Examples
+    --------
+    Evaluate the volume of three variants over two modelers.
+
+    >>> from ansys.geometry.core.parameters import ParameterSweep
+    >>> designs = [modeler.open_file("part.scdocx") for modeler in modelers]
+    >>> sweep = ParameterSweep(
+    ...     designs,
+    ...     [{"length": 0.01}, {"length": 0.02}, {"length": 0.03}],
+    ...     evaluate=lambda design, values: sum(body.volume.m for body in design.get_all_bodies()),
+    ...     checkpoint="sweep.jsonl",
+    ... )
+    >>> results = sweep.run()
+    """
+
+    def __init__(
+        self,
+        designs: "Design | list[Design]",
+        variants: list[dict[str, Quantity | Real]],
+        evaluate: Callable[["Design", dict], Any] | None = None,
+        export_format: "DesignFileFormat | None" = None,
+        output_directory: Path | str | None = None,
+        checkpoint: Path | str | None = None,
+    ):
+        """Initialize the ``ParameterSweep`` class."""
+        from ansys.geometry.core.designer.design import Design
+
+        designs = [designs] if isinstance(designs, Design) else list(designs)
+        if not designs:
+            raise ValueError("At least one design is required to run a parameter sweep.")
+        if len({id(design._modeler) for design in designs}) != len(designs):
+            raise ValueError("Each design of a parameter sweep must belong to a different modeler.")
+        if export_format is not None and output_directory is None:
+            raise ValueError("An output directory is required to download the variants.")
+
+        self._designs = designs
+        self._variants = list(variants)
+        self._evaluate = evaluate
+        self._export_format = export_format
+        self._output_directory = None if output_directory is None else Path(output_directory)
+        self._checkpoint = None if checkpoint is None else Path(checkpoint)
+        self._baseline = None
+        self._lock = Lock()
+
+    @property
+    def variants(self) -> list[dict[str, Quantity | Real]]:
+        """Parameter values of each variant."""
+        return self._variants
+
+    def run(self) -> list[VariantResult]:
+        """Run the variants of the sweep.
+
+        A variant that fails, because its parameters cannot be updated or because
+        its evaluation or download raises an error, is recorded as failed and the
+        sweep goes on. A design whose modeler exits stops taking variants, which
+        are run on the other designs.
+
+        The parameter values of the designs are read the first time the sweep runs.
+        Parameters missing from a variant are set back to these values.
+
+        Returns
+        -------
+        list[VariantResult]
+            Outcome of each variant, in the order of the variants. Variants that
+            succeeded in a previous run are read from the checkpoint.
+
+        Raises
+        ------
+        ValueError
+            If a variant refers to a parameter that the design does not have.
+        GeometryRuntimeError
+            If some variants could not be run because all the modelers exited.
+        """
+        if self._baseline is None:
+            self._baseline = {
+                parameter.name: parameter.dimension_value
+                for parameter in self._designs[0].parameters
+            }
+        unknown = {name for values in self._variants for name in values} - self._baseline.keys()
+        if unknown:
+            raise ValueError(f"The design has no parameters named {sorted(unknown)}.")
+
+        results = self._read_checkpoint()
+        pending = SimpleQueue()
+        for index in range(len(self._variants)):
+            if index not in results:
+                pending.put(index)
+
+        if self._output_directory is not None:
+            self._output_directory.mkdir(parents=True, exist_ok=True)
+
+        designs = list(self._designs)
+        with ThreadPoolExecutor(max_workers=2) as writer:
+            # A design whose modeler exits puts its variant back in the queue. The
+            # designs still running may have stopped already, so they are dispatched
+            # again until no variant is left or no modeler is running.
+            while designs and not pending.empty():
+                with ThreadPoolExecutor(max_workers=len(designs)) as runner:
+                    workers = [
+                        (design, runner.submit(self._run_design, design, pending, writer))
+                        for design in designs
+                    ]
+
+                designs = []
+                for design, worker in workers:
+                    outcomes, running = worker.result()
+                    if running:
+                        designs.append(design)
+                    for outcome in outcomes:
+                        result = outcome.result() if isinstance(outcome, Future) else outcome
+                        results[result.index] = result
+
+        if not pending.empty():
+            raise GeometryRuntimeError(
+                f"{len(self._variants) - len(results)} variants were not run because all the "
+                "modelers exited. Run the sweep again to resume from the checkpoint."
+            )
+
+        return [results[index] for index in range(len(self._variants))]
+
+    def _run_design(
+        self, design: "Design", pending: SimpleQueue, writer: ThreadPoolExecutor
+    ) -> tuple[list[VariantResult | Future], bool]:
+        """Run variants on a design until none are left or its modeler exits.
+
+        The outcomes are returned along with whether the modeler is still running.
+        """
+        parameters = None
+        changed = set()
+        outcomes = []
+        while True:
+            try:
+                index = pending.get_nowait()
+            except Empty:
+                return outcomes, True
+
+            try:
+                if parameters is None:
+                    parameters = {parameter.name: parameter for parameter in design.parameters}
+                result, data = self._run_variant(design, parameters, changed, index)
+            except GeometryExitedError as err:
+                design._grpc_client.log.error(f"Parameter sweep stopped on this modeler: {err}")
+                pending.put(index)
+                return outcomes, False
+
+            # Write the download in the background, so the next variant can start
+            if data is None:
+                outcomes.append(self._finish(design, result, None))
+            else:
+                outcomes.append(writer.submit(self._finish, design, result, data))
+
+    def _run_variant(
+        self, design: "Design", parameters: dict[str, Parameter], changed: set[str], index: int
+    ) -> tuple[VariantResult, bytes | None]:
+        """Set the parameters of a variant, evaluate it and export it.
+
+        Parameters changed by the previous variants on the design and missing from
+        this one are set back to their initial values, so that the outcome does not
+        depend on the variants run before. ``changed`` is updated accordingly.
+        """
+        values = self._variants[index]
+        result = VariantResult(index, values)
+        reset = {name: self._baseline[name] for name in changed - values.keys()}
+        dimensions = [
+            Parameter(parameters[name].id, name, parameters[name].dimension_type, value)
+            for name, value in (values | reset).items()
+        ]
+
+        try:
+            # Parameters are only known to be back to their initial values once set
+            changed.update(values)
+            statuses = design.set_parameters(dimensions)
+            changed.difference_update(
+                dimension.name
+                for dimension, status in zip(dimensions, statuses)
+                if dimension.name in reset and status is ParameterUpdateStatus.SUCCESS
+            )
+            failed = {
+                dimension.name: status.name
+                for dimension, status in zip(dimensions, statuses)
+                if status is not ParameterUpdateStatus.SUCCESS
+            }
+            if failed:
+                result.error = f"Parameters not updated: {failed}"
+                return result, None
+
+            if self._evaluate is not None:
+                result.result = self._evaluate(design, values)
+
+            data = None
+            if self._export_format is not None:
+                result.file = self._file_location(index)
+                data = design._export_bytes(result.file, self._export_format)
+        except GeometryExitedError:
+            raise
+        except Exception as err:
+            result.error = f"{type(err).__name__}: {err}"
+            return result, None
+
+        return result, data
+
+    def _file_location(self, index: int) -> Path:
+        """Location of the downloaded design of a variant."""
+        from ansys.geometry.core.designer.design import DESIGN_FILE_FORMAT_EXTENSIONS
+
+        extension = DESIGN_FILE_FORMAT_EXTENSIONS[self._export_format][0]
+        return self._output_directory / f"variant_{index}.{extension}"
+
+    def _finish(self, design: "Design", result: VariantResult, data: bytes | None) -> VariantResult:
+        """Write the download of a variant and record its outcome in the checkpoint."""
+        if data is not None:
+            try:
+                design._write_download(data, result.file)
+            except Exception as err:
+                result.error = f"{type(err).__name__}: {err}"
+
+        if self._checkpoint is not None:
+            record = {
+                "index": result.index,
+                "values": result.values,
+                "result": result.result,
+                "file": None if result.file is None else str(result.file),
+                "error": result.error,
+            }
+            # Values and results that JSON cannot represent are stored as strings
+            line = json.dumps(record, default=str)
+            with self._lock, self._checkpoint.open("a") as file:
+                file.write(line + "\n")
+
+        return result
+
+    def _read_checkpoint(self) -> dict[int, VariantResult]:
+        """Read the variants that succeeded in a previous run with the same values."""
+        results = {}
+        if self._checkpoint is None or not self._checkpoint.exists():
+            return results
+
+        with self._checkpoint.open() as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = record["index"]
+                if record["error"] is not None or index >= len(self._variants):
+                    continue
+                # Values are compared as written, so that quantities match their strings
+                values = json.loads(json.dumps(self._variants[index], default=str))
+                if record.get("values") != values:
+                    continue
+                results[index] = VariantResult(
+                    index,
+                    self._variants[index],
+                    result=record["result"],
+                    file=None if record["file"] is None else Path(record["file"]),
+                )
+        return results
@@ -717,6 +717,11 @@ class GeometryPlotter(PlotterInterface):
         -------
         ~pathlib.Path
             Path to the exported glb file.
+
+        Notes
+        -----
+        Use the ``Design.export_to_glb()`` method to export a design without
+        a render window and with a single mesh for repeated bodies.
         """
         # Export to GLB requires merging the object into a single mesh
         LOG.debug(
@@ -45,6 +45,8 @@ class LocationUV(Enum):
 class BoxUV:
     """Provides the implementation for ``BoxUV`` class."""
 
+    __slots__ = ("_interval_u", "_interval_v")
+
     def __init__(self, range_u: Interval = None, range_v: Interval = None) -> None:
         """Root constructor for BoxUV."""
         if range_u is not None:
@@ -49,6 +49,8 @@ class ParamUV:
     Geometry service.
     """
 
+    __slots__ = ("_u", "_v")
+
     def __init__(self, u: Real, v: Real) -> None:
         """Initialize ``ParamUV`` class."""
         self._u = u
@@ -148,6 +150,8 @@ class Interval:
         End value of the interval.
     """
 
+    __slots__ = ("_start", "_end", "not_empty")
+
     @check_input_types
     def __init__(self, start: Real, end: Real) -> None:
         """Initialize ``Interval`` class."""
@@ -397,6 +401,8 @@ class Parameterization:
         Interval of the parameterization.
     """
 
+    __slots__ = ("_form", "_type", "_interval")
+
     @check_input_types
     def __init__(self, form: ParamForm, type: ParamType, interval: Interval) -> None:
         """Initialize ``Parameterization`` class."""
@@ -32,6 +32,7 @@ from ansys.geometry.core.sketch.gears import DummyGear, SpurGear
 from ansys.geometry.core.sketch.nurbs import SketchNurbs
 from ansys.geometry.core.sketch.polygon import Polygon
 from ansys.geometry.core.sketch.segment import SketchSegment
+from ansys.geometry.core.sketch.segment_array import SketchSegmentArray
 from ansys.geometry.core.sketch.sketch import Sketch
 from ansys.geometry.core.sketch.slot import Slot
 from ansys.geometry.core.sketch.trapezoid import Trapezoid
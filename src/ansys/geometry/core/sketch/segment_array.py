@@ -0,0 +1,241 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides for creating and managing array-backed sets of segments."""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pint import Quantity, Unit
+
+from ansys.geometry.core.math.plane import Plane
+from ansys.geometry.core.math.point import Point2D
+from ansys.geometry.core.misc.checks import (
+    check_input_types,
+    check_pint_unit_compatibility,
+    graphics_required,
+)
+from ansys.geometry.core.misc.measurements import DEFAULT_UNITS
+from ansys.geometry.core.sketch.edge import SketchEdge
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyvista as pv
+
+
+class SketchSegmentArray(SketchEdge):
+    """Provides a compact, array-backed representation of many line segments.
+
+    Unlike a list of ``SketchSegment`` objects, the segments are held as two
+    arrays of 2D coordinates, which makes it possible to sketch contours with
+    many thousands of vertices (for example, measured or generated data).
+
+    Parameters
+    ----------
+    starts : ~numpy.ndarray
+        ``(n, 2)`` array with the starting point of each segment.
+    ends : ~numpy.ndarray
+        ``(n, 2)`` array with the ending point of each segment.
+    unit : ~pint.Unit, default: DEFAULT_UNITS.LENGTH
+        Units of the coordinates given.
+    plane : Plane, optional
+        Plane containing the sketched segments, which is the global XY plane
+        by default.
+    """
+
+    @check_input_types
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        unit: Unit | None = None,
+        plane: Plane = Plane(),
+    ):
+        """Initialize the ``SketchSegmentArray`` class."""
+        unit = unit if unit else DEFAULT_UNITS.LENGTH
+        check_pint_unit_compatibility(unit, DEFAULT_UNITS.LENGTH)
+
+        starts = np.array(starts, dtype=np.float64)
+        ends = np.array(ends, dtype=np.float64)
+        if starts.ndim != 2 or starts.shape[1] != 2 or starts.shape != ends.shape:
+            raise ValueError(
+                "Parameters 'starts' and 'ends' must be arrays of the same (n, 2) shape."
+            )
+        if len(starts) == 0:
+            raise ValueError("At least one segment must be provided.")
+        if not (np.isfinite(starts).all() and np.isfinite(ends).all()):
+            raise ValueError("Parameters 'starts' and 'ends' must only contain finite values.")
+        if np.any(np.all(starts == ends, axis=1)):
+            raise ValueError(
+                "Some segments have the same 'start' and 'end' values. No segment can be created."
+            )
+
+        # Store the coordinates in base units, as the rest of the math classes do
+        self._to_base = Quantity(1, unit).to_base_units()
+        self._starts = starts * self._to_base.m
+        self._ends = ends * self._to_base.m
+        self._starts.flags.writeable = False
+        self._ends.flags.writeable = False
+        self._unit = unit
+        self._plane = plane
+
+    @property
+    def unit(self) -> Unit:
+        """Unit of the segment coordinates."""
+        return self._unit
+
+    @property
+    def plane(self) -> Plane:
+        """Plane containing the segments."""
+        return self._plane
+
+    @property
+    def starts(self) -> np.ndarray:
+        """``(n, 2)`` array with the starting point of each segment in the segment units."""
+        return self._starts / self._to_base.m
+
+    @property
+    def ends(self) -> np.ndarray:
+        """``(n, 2)`` array with the ending point of each segment in the segment units."""
+        return self._ends / self._to_base.m
+
+    @property
+    def n_segments(self) -> int:
+        """Number of segments."""
+        return len(self._starts)
+
+    def __len__(self) -> int:
+        """Get the number of segments."""
+        return self.n_segments
+
+    @property
+    def start(self) -> Point2D:
+        """Starting point of the first segment."""
+        return Point2D(self.starts[0], self._unit)
+
+    @property
+    def end(self) -> Point2D:
+        """Ending point of the last segment."""
+        return Point2D(self.ends[-1], self._unit)
+
+    @property
+    def length(self) -> Quantity:
+        """Total length of the segments."""
+        length = np.hypot(*(self._ends - self._starts).T).sum()
+        return Quantity(length, self._to_base.u).to(self._unit)
+
+    @check_input_types
+    def contains_point(self, point: Point2D, tol: float = 1e-6) -> bool:
+        """Check if any of the segments contains the given point within a tolerance.
+
+        Parameters
+        ----------
+        point : Point2D
+            Point to check.
+        tol : float, default: 1e-6
+            Tolerance for the check, in base units.
+
+        Returns
+        -------
+        bool
+            ``True`` if the point lies on any of the segments, ``False`` otherwise.
+        """
+        directions = self._ends - self._starts
+        offsets = np.asarray(point) - self._starts
+        params = np.clip(
+            np.einsum("ij,ij->i", offsets, directions)
+            / np.einsum("ij,ij->i", directions, directions),
+            0.0,
+            1.0,
+        )
+        distances = np.linalg.norm(offsets - params[:, np.newaxis] * directions, axis=1)
+        return bool(np.any(distances <= tol))
+
+    def global_coordinates(
+        self, plane: Plane | None = None, unit: Unit | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the global 3D coordinates of the segments.
+
+        Parameters
+        ----------
+        plane : Plane, default: None
+            Plane for positioning the segments. By default, the plane containing
+            the segments is used.
+        unit : ~pint.Unit, default: None
+            Unit of the coordinates returned. By default, base units are used.
+
+        Returns
+        -------
+        tuple[~numpy.ndarray, ~numpy.ndarray]
+            ``(n, 3)`` arrays with the global starting and ending point of each
+            segment.
+        """
+        plane = plane if plane is not None else self._plane
+        origin = np.asarray(plane.origin, dtype=np.float64)
+        rotation = np.array([plane.direction_x, plane.direction_y], dtype=np.float64)
+        factor = 1.0 if unit is None else Quantity(1, self._to_base.u).m_as(unit)
+        return (
+            (origin + self._starts @ rotation) * factor,
+            (origin + self._ends @ rotation) * factor,
+        )
+
+    @property
+    @graphics_required
+    def visualization_polydata(self) -> "pv.PolyData":
+        """VTK polydata representation for PyVista visualization.
+
+        The representation lies in the X/Y plane within
+        the standard global Cartesian coordinate system.
+
+        Returns
+        -------
+        pyvista.PolyData
+            VTK pyvista.Polydata configuration.
+        """
+        import pyvista as pv
+
+        n_segments = self.n_segments
+        to_default = Quantity(1, DEFAULT_UNITS.LENGTH).to_base_units().m
+        points = np.zeros((2 * n_segments, 3), dtype=np.float64)
+        points[0::2, :2] = self._starts / to_default
+        points[1::2, :2] = self._ends / to_default
+        lines = np.column_stack(
+            [
+                np.full(n_segments, 2),
+                np.arange(0, 2 * n_segments, 2),
+                np.arange(1, 2 * n_segments, 2),
+            ]
+        )
+        return pv.PolyData(points, lines=lines.ravel())
+
+    def plane_change(self, plane: "Plane") -> None:
+        """Redefine the plane containing ``SketchSegmentArray`` objects.
+
+        Parameters
+        ----------
+        plane : Plane
+            Desired new plane that is to contain the sketched segments.
+
+        Notes
+        -----
+        This implies that their 3D definition might suffer changes.
+        """
+        self._plane = plane
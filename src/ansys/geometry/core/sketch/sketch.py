@@ -22,9 +22,12 @@
 
 """Provides for creating and managing a sketch."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Hashable
+import operator
+from typing import TYPE_CHECKING, Any
 
-from pint import Quantity
+import numpy as np
+from pint import Quantity, Unit
 
 from ansys.geometry.core.math.constants import ZERO_POINT2D
 from ansys.geometry.core.math.plane import Plane
@@ -42,14 +45,17 @@ from ansys.geometry.core.sketch.gears import DummyGear, SpurGear
 from ansys.geometry.core.sketch.nurbs import SketchNurbs
 from ansys.geometry.core.sketch.polygon import Polygon
 from ansys.geometry.core.sketch.segment import SketchSegment
+from ansys.geometry.core.sketch.segment_array import SketchSegmentArray
 from ansys.geometry.core.sketch.slot import Slot
 from ansys.geometry.core.sketch.trapezoid import Trapezoid
 from ansys.geometry.core.sketch.triangle import Triangle
-from ansys.geometry.core.typing import Real
+from ansys.geometry.core.typing import Real, RealSequence
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyvista import PolyData
 
+    from ansys.geometry.core._grpc._version import GeometryApiProtos
+
 SketchObject = SketchEdge | SketchFace
 """Type to refer to both ``SketchEdge`` and ``SketchFace``."""
 
@@ -62,6 +68,7 @@ class Sketch:
     _edges: list[SketchEdge]
     _current_sketch_context: list[SketchObject]
     _tags: dict[str, list[SketchObject]]
+    _compiled: dict[Hashable, tuple[tuple, Any]]
 
     @check_input_types
     def __init__(
@@ -80,6 +87,10 @@ class Sketch:
         # sketch objects and collections of sketch objects
         self._tags = {}
 
+        # compiled geometry messages, keyed by converter, together with the
+        # plane, edges and faces they were built from
+        self._compiled = {}
+
     @property
     def plane(self) -> Plane:
         """Sketch plane configuration."""
@@ -115,6 +126,76 @@ class Sketch:
         [face.plane_change(plane) for face in self.faces]
         [edge.plane_change(plane) for edge in self.edges]
 
+    def compile(self, version: "GeometryApiProtos | str") -> Any:
+        """Compile the sketch into the geometry message sent to the service.
+
+        The message is built once and reused by every operation consuming this
+        sketch (for example, ``Component.extrude_sketch``) until the sketch changes,
+        which makes it cheap to reuse the same sketch across many operations.
+
+        Parameters
+        ----------
+        version : GeometryApiProtos | str
+            Protocol version to compile the sketch for. It must be the version
+            used by the client the message is sent with, that is
+            ``modeler.client.services.version``.
+
+        Returns
+        -------
+        Geometries
+            gRPC geometries message for the sketch.
+
+        Notes
+        -----
+        The returned message is shared and must not be modified. Any sketch
+        operation or a change of the sketch plane invalidates it.
+        """
+        from ansys.geometry.core._grpc._version import GeometryApiProtos
+
+        if isinstance(version, str):
+            version = GeometryApiProtos.from_string(version)
+
+        if version is GeometryApiProtos.V0:
+            from ansys.geometry.core._grpc._services.v0.conversions import (
+                from_sketch_to_grpc_geometries,
+            )
+        else:
+            from ansys.geometry.core._grpc._services.v1.conversions import (
+                from_sketch_to_grpc_geometries,
+            )
+
+        return from_sketch_to_grpc_geometries(self)
+
+    def _get_compiled(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Get a compiled message of the sketch, building it if the sketch changed.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the compilation (for example, the converter used).
+        build : Callable[[], Any]
+            Function building the message from the current state of the sketch.
+
+        Returns
+        -------
+        Any
+            Compiled message.
+        """
+        # Sketch objects are never modified in place, so the sketch is unchanged
+        # as long as it holds the very same plane, edges and faces
+        snapshot = (self._plane, *self._edges, *self._faces)
+        cached = self._compiled.get(key)
+        if (
+            cached is not None
+            and len(cached[0]) == len(snapshot)
+            and all(map(operator.is_, cached[0], snapshot))
+        ):
+            return cached[1]
+
+        message = build()
+        self._compiled[key] = (snapshot, message)
+        return message
+
     @check_input_types
     def translate_sketch_plane(self, translation: Vector3D) -> "Sketch":
         """Translate the origin location of the active sketch plane.
@@ -321,6 +402,85 @@ class Sketch:
         segment = SketchSegment(self._single_point_context_reference(), end)
         return self.edge(segment, tag)
 
+    @check_input_types
+    def polyline(
+        self,
+        points: np.ndarray | list[RealSequence],
+        closed: bool = False,
+        unit: Unit | None = None,
+        tag: str | None = None,
+    ) -> "Sketch":
+        """Add a polyline through an array of points to the sketch plane.
+
+        The polyline is stored as a single array-backed ``SketchSegmentArray``
+        edge, which avoids creating a ``SketchSegment`` object per vertex.
+
+        Parameters
+        ----------
+        points : ~numpy.ndarray | list[RealSequence]
+            ``(n, 2)`` array with the vertices of the polyline.
+        closed : bool, default: False
+            Whether to close the polyline with a segment from the last vertex
+            to the first one.
+        unit : ~pint.Unit, default: DEFAULT_UNITS.LENGTH
+            Units of the coordinates given.
+        tag : str, default: None
+            User-defined label for identifying the edge.
+
+        Returns
+        -------
+        Sketch
+            Revised sketch state ready for further sketch actions.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 2 or len(points) < 2:
+            raise ValueError("Parameter 'points' must be an (n, 2) array with at least 2 points.")
+
+        if closed:
+            # Do not create a zero-length closing segment if the loop is already closed
+            if np.array_equal(points[0], points[-1]):
+                points = points[:-1]
+            return self.segments_from_array(points, np.roll(points, -1, axis=0), unit, tag)
+
+        return self.segments_from_array(points[:-1], points[1:], unit, tag)
+
+    @check_input_types
+    def segments_from_array(
+        self,
+        starts: np.ndarray | list[RealSequence],
+        ends: np.ndarray | list[RealSequence],
+        unit: Unit | None = None,
+        tag: str | None = None,
+    ) -> "Sketch":
+        """Add a set of segments given by arrays of points to the sketch plane.
+
+        The segments are stored as a single array-backed ``SketchSegmentArray``
+        edge, which avoids creating a ``SketchSegment`` object per segment.
+
+        Parameters
+        ----------
+        starts : ~numpy.ndarray | list[RealSequence]
+            ``(n, 2)`` array with the starting point of each segment.
+        ends : ~numpy.ndarray | list[RealSequence]
+            ``(n, 2)`` array with the ending point of each segment.
+        unit : ~pint.Unit, default: DEFAULT_UNITS.LENGTH
+            Units of the coordinates given.
+        tag : str, default: None
+            User-defined label for identifying the edge.
+
+        Returns
+        -------
+        Sketch
+            Revised sketch state ready for further sketch actions.
+        """
+        segments = SketchSegmentArray(
+            np.asarray(starts, dtype=np.float64),
+            np.asarray(ends, dtype=np.float64),
+            unit,
+            self._plane,
+        )
+        return self.edge(segments, tag)
+
     @check_input_types
     def segment_from_point_and_vector(
         self, start: Point2D, vector: Vector2D, tag: str | None = None
@@ -24,10 +24,15 @@
 
 from typing import TYPE_CHECKING, Union
 
+import numpy as np
+from pint import Quantity
+
 from ansys.geometry.core.connection import GrpcClient
 from ansys.geometry.core.errors import GeometryRuntimeError
+from ansys.geometry.core.misc.auxiliary import get_bounding_box_corners
 from ansys.geometry.core.misc.checks import min_backend_version
-from ansys.geometry.core.misc.measurements import Distance
+from ansys.geometry.core.misc.measurements import DEFAULT_UNITS, Distance
+from ansys.geometry.core.typing import Real
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.body import Body
@@ -127,3 +132,106 @@ class MeasurementTools:
             backend_version=self._grpc_client.backend_version,
         )
         return Gap(response.get("distance"))
+
+    @min_backend_version(25, 2, 0)
+    def min_distance_matrix(
+        self,
+        objects_a: list[Union["Body", "Face", "Edge"]],
+        objects_b: list[Union["Body", "Face", "Edge"]] | None = None,
+        max_distance: Distance | Quantity | Real | None = None,
+        as_pairs: bool = False,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the gaps between every object of a list and every object of another.
+
+        When a maximum distance is given, the bounding boxes of the objects are
+        retrieved in bulk first, and the pairs whose bounding boxes are further apart
+        than that distance are not measured. The remaining pairs are measured with
+        several requests in flight at a time.
+
+        Parameters
+        ----------
+        objects_a : list[Union[Body, Face, Edge]]
+            Objects of the rows of the matrix.
+        objects_b : list[Union[Body, Face, Edge]], default: None
+            Objects of the columns of the matrix. If ``None``, the gaps between the
+            objects of ``objects_a`` are measured, and each pair is measured once.
+        max_distance : Distance | ~pint.Quantity | Real, default: None
+            Distance beyond which pairs are of no interest. If ``None``, all pairs
+            are measured.
+        as_pairs : bool, default: False
+            Whether to return only the pairs closer than ``max_distance``, instead of
+            the full matrix.
+
+        Returns
+        -------
+        ~numpy.ndarray | tuple[~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray]
+            If ``as_pairs=False``, matrix of the gaps, with one row per object of
+            ``objects_a`` and one column per object of ``objects_b``. Pairs that are
+            not measured hold ``inf``. If ``as_pairs=True``, row indices, column
+            indices and gaps of the pairs closer than ``max_distance``. When
+            ``objects_b`` is ``None``, each pair appears once, with the lower index
+            first.
+
+        Notes
+        -----
+        Gaps are given in server units, that is meters.
+
+        Warnings
+        --------
+        This method is only available starting on Ansys release 25R2.
+        """
+        symmetric = objects_b is None
+        if symmetric:
+            objects_b = objects_a
+
+        candidates = np.ones((len(objects_a), len(objects_b)), dtype=bool)
+        if symmetric:
+            candidates = np.triu(candidates, k=1)
+
+        limit = np.inf
+        if max_distance is not None:
+            max_distance = (
+                max_distance if isinstance(max_distance, Distance) else Distance(max_distance)
+            )
+            limit = max_distance.value.m_as(DEFAULT_UNITS.SERVER_LENGTH)
+            min_a, max_a = get_bounding_box_corners(objects_a)
+            min_b, max_b = (min_a, max_a) if symmetric else get_bounding_box_corners(objects_b)
+            candidates &= _box_gaps(min_a, max_a, min_b, max_b) <= limit
+
+        rows, cols = np.nonzero(candidates)
+        response = self._grpc_client.services.measurement_tools.min_distances_between_objects(
+            pairs=[(objects_a[i].id, objects_b[j].id) for i, j in zip(rows, cols)],
+            backend_version=self._grpc_client.backend_version,
+        )
+        distances = np.asarray(response.get("distances"), dtype=np.float64)
+
+        if as_pairs:
+            close = distances <= limit
+            return rows[close], cols[close], distances[close]
+
+        matrix = np.full(candidates.shape, np.inf)
+        matrix[rows, cols] = distances
+        if symmetric:
+            matrix[cols, rows] = distances
+            np.fill_diagonal(matrix, 0.0)
+        return matrix
+
+
+def _box_gaps(
+    min_a: np.ndarray, max_a: np.ndarray, min_b: np.ndarray, max_b: np.ndarray
+) -> np.ndarray:
+    """Get the distances between two sets of axis-aligned boxes.
+
+    The distance between the boxes of two objects is a lower bound of the distance
+    between the objects.
+    """
+    gaps = np.empty((len(min_a), len(min_b)))
+    # Process the rows in chunks to bound the memory used by the broadcast
+    for start in range(0, len(min_a), 256):
+        stop = start + 256
+        axis_gaps = np.maximum(
+            min_b[None, :, :] - max_a[start:stop, None, :],
+            min_a[start:stop, None, :] - max_b[None, :, :],
+        )
+        gaps[start:stop] = np.linalg.norm(np.maximum(axis_gaps, 0.0), axis=2)
+    return gaps
@@ -24,14 +24,17 @@
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pint
 
 import ansys.geometry.core as pyansys_geometry
 from ansys.geometry.core.connection import GrpcClient
 from ansys.geometry.core.errors import GeometryRuntimeError
+from ansys.geometry.core.math.bbox_index import BoundingBoxIndex
 from ansys.geometry.core.misc.auxiliary import (
     build_edge_id_map,
     get_bodies_from_ids,
+    get_bounding_box_corners,
     get_design_from_body,
     get_faces_from_ids,
 )
@@ -535,6 +538,12 @@ class RepairTools:
         list[InterfenceProblemAreas]
             List of objects representing interference problem areas.
 
+        Notes
+        -----
+        The bounding boxes of the bodies are retrieved in bulk first. Only the bodies
+        whose bounding box overlaps the bounding box of another body are sent to the
+        server for the interference check.
+
         Warnings
         --------
         This method is only available starting on Ansys release 25R2.
@@ -548,8 +557,15 @@ class RepairTools:
         check_type_all_elements_in_iterable(bodies, Body)
         check_type(cut_smaller_body, bool)
 
+        # Bodies whose bounding box overlaps no other box cannot interfere with any body
+        index = BoundingBoxIndex(*get_bounding_box_corners(bodies))
+        firsts, seconds = index.overlapping_pairs()
+        candidates = np.union1d(firsts, seconds)
+        if len(candidates) == 0:
+            return []
+
         parent_design = get_design_from_body(bodies[0])
-        body_ids = [body.id for body in bodies]
+        body_ids = [bodies[i].id for i in candidates]
         response = self._grpc_client.services.repair_tools.find_interferences(
             bodies=body_ids, cut_smaller_body=cut_smaller_body
         )
@@ -23,7 +23,7 @@
 """Unit tests for beam entities."""
 
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from ansys.geometry.core.designer.beam import (
     Beam,
@@ -34,6 +34,7 @@ from ansys.geometry.core.designer.beam import (
     BeamType,
     SectionAnchorType,
 )
+from ansys.geometry.core.designer.selection import _NamedSelectionIndex
 from ansys.geometry.core.math import UNITVECTOR3D_X, UNITVECTOR3D_Y, Frame, Point3D
 from ansys.geometry.core.misc import UNITS, Distance
 from ansys.geometry.core.shapes import ParamUV
@@ -44,6 +45,20 @@ class _DummyParent:
         self.name = name
 
 
+def _design_with_named_selections(*named_selections) -> SimpleNamespace:
+    index = _NamedSelectionIndex()
+    for named_selection in named_selections:
+        index.add(named_selection)
+    return SimpleNamespace(_get_named_selections_containing=index.get)
+
+
+def _named_selection(name: str, beams: list[Beam]) -> Mock:
+    named_selection = Mock()
+    named_selection.name = name
+    named_selection._member_ids.return_value = {"beams": [beam.id for beam in beams]}
+    return named_selection
+
+
 def test_beam_enums_are_stable():
     """Test beam-related enums and values."""
     assert BeamType.BEAM.value == 0
@@ -200,10 +215,10 @@ def test_beam_get_named_selections_filters_membership():
             parent_component=parent,
         )
 
-    ns1 = SimpleNamespace(name="ns1", beams=[target_beam])
-    ns2 = SimpleNamespace(name="ns2", beams=[other_beam])
-    ns3 = SimpleNamespace(name="ns3", beams=[target_beam, other_beam])
-    fake_design = SimpleNamespace(named_selections=[ns1, ns2, ns3])
+    ns1 = _named_selection("ns1", [target_beam])
+    ns2 = _named_selection("ns2", [other_beam])
+    ns3 = _named_selection("ns3", [target_beam, other_beam])
+    fake_design = _design_with_named_selections(ns1, ns2, ns3)
 
     with patch(
         "ansys.geometry.core.designer.beam.get_design_from_component", return_value=fake_design
@@ -234,8 +249,8 @@ def test_beam_get_named_selections_returns_empty_when_no_match():
             parent_component=parent,
         )
 
-    ns1 = SimpleNamespace(name="ns1", beams=[other_beam])
-    fake_design = SimpleNamespace(named_selections=[ns1])
+    ns1 = _named_selection("ns1", [other_beam])
+    fake_design = _design_with_named_selections(ns1)
 
     with patch(
         "ansys.geometry.core.designer.beam.get_design_from_component", return_value=fake_design
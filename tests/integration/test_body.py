@@ -482,6 +482,37 @@ def test_clear_body_cache_for_part(modeler: Modeler):
         matching_component._clear_cached_bodies.assert_called_once()
 
 
+def test_body_topology_cache(modeler: Modeler):
+    """Test that faces, edges and vertices are cached until the body is modified."""
+    design = modeler.create_design("body_topology_cache")
+    sketch = Sketch()
+    sketch.box(Point2D([0, 0]), 10, 10)
+    body = design.extrude_sketch("box", sketch, 10)
+
+    bodies_svc = body._grpc_client.services.bodies
+    with (
+        patch.object(bodies_svc, "get_faces", wraps=bodies_svc.get_faces) as faces_spy,
+        patch.object(bodies_svc, "get_edges", wraps=bodies_svc.get_edges) as edges_spy,
+    ):
+        faces = body.faces
+        assert len(faces) == 6
+        for face in faces:
+            assert body.faces.index(face) == faces.index(face)
+        assert body.edges is not body.edges
+        assert body.edges == body.edges
+        assert faces_spy.call_count == 1
+        assert edges_spy.call_count == 1
+
+        # Modifying the returned list does not alter the cache
+        faces.pop()
+        assert len(body.faces) == 6
+
+        # Any operation resetting the tessellation cache resets the topology too
+        body.translate(UnitVector3D([1, 0, 0]), 1)
+        assert body.faces[0] is not faces[0]
+        assert faces_spy.call_count == 2
+
+
 def test_find_and_add_body_matching_part_id(modeler: Modeler):
     """Test _find_and_add_body() adds new body when parent part is found."""
     design = modeler.create_design("add_body_part")
@@ -1158,6 +1189,26 @@ def test_create_block_body(modeler: Modeler):
     assert nested_block.parent_component.id == nested.id
 
 
+def test_create_block_bodies(modeler: Modeler):
+    """Test the creation of several block bodies at once."""
+    design = modeler.create_design("BlocksTest")
+    starts = np.array([[0, 0, 0], [2, 0, 0]])
+    blocks = design.create_blocks(["first", "second"], starts, starts + [1, 2, 3])
+
+    assert [block.name for block in blocks] == ["first", "second"]
+    assert design.bodies == blocks
+    for block in blocks:
+        assert len(block.faces) == 6
+        assert block.volume.m == 6.0
+
+    # A single end corner is shared by all the blocks
+    starts = [Point3D([0, 0, 0]), Point3D([2, 0, 0]), Point3D([0, 2, 0])]
+    blocks = design.create_blocks("shared", starts, Point3D([3, 3, 3]))
+
+    assert [block.name for block in blocks] == ["shared"] * 3
+    assert [block.volume.m for block in blocks] == [27.0, 9.0, 9.0]
+
+
 def test_body_mirror(modeler: Modeler):
     """Test the mirroring of a body."""
     design = modeler.create_design("Design1")
@@ -65,6 +65,7 @@ from ansys.geometry.core.math import (
 from ansys.geometry.core.misc import DEFAULT_UNITS, UNITS, Accuracy, Angle, Distance, checks
 from ansys.geometry.core.misc.auxiliary import DEFAULT_COLOR
 from ansys.geometry.core.misc.options import FMDExportOptions
+from ansys.geometry.core.parameters import ParameterSweep
 from ansys.geometry.core.parameters.parameter import ParameterType, ParameterUpdateStatus
 from ansys.geometry.core.shapes import (
     Circle,
@@ -872,6 +873,87 @@ def test_read_existing_design_plane_retrieval_paths(
         assert design.shared_topology == shared_type
 
 
+def test_read_existing_design_lazy_sections(modeler: Modeler):
+    """Test __read_existing_design() creates secondary sections on first access."""
+    design = modeler.create_design("read_existing_lazy_sections")
+
+    class FailingOnceMaterial(dict):
+        """Material whose properties cannot be read the first time."""
+
+        failed = False
+
+        def get(self, key, default=None):
+            if key == "material_properties" and not self.failed:
+                self.failed = True
+                raise GeometryRuntimeError("failed")
+            return super().get(key, default)
+
+    design_response = {
+        "design_id": "d1",
+        "main_part_id": "p_main",
+        "name": "existing_design",
+    }
+    assembly_response = {
+        "parts": [{"id": "p_main", "name": "Main"}],
+        "transformed_parts": [],
+        "components": [],
+        "bodies": [],
+        "materials": iter(
+            [
+                {"name": "steel", "material_properties": []},
+                FailingOnceMaterial(name="aluminum", material_properties=[]),
+                {"name": "copper", "material_properties": []},
+            ]
+        ),
+        "beams": iter([]),
+        "named_selections": iter([{"id": "ns1", "name": "my_ns"}]),
+        "component_coordinate_systems": iter([]),
+        "design_points": [],
+        "datum_planes": [],
+        "design_curves": [],
+        "component_shared_topologies": [],
+        "datum_points": [],
+    }
+
+    with (
+        patch.object(
+            design._grpc_client.services.designs, "get_active", return_value=design_response
+        ),
+        patch.object(
+            design._grpc_client.services.designs,
+            "get_assembly",
+            return_value=assembly_response,
+        ),
+    ):
+        design._Design__read_existing_design()
+
+    # Only the design tree is created when reading the design
+    assert sorted(design._pending_sections) == [
+        "beams",
+        "coordinate_systems",
+        "materials",
+        "named_selections",
+    ]
+    assert design._materials == []
+    assert design._named_selections == {}
+
+    # Each section is created once, on first access
+    assert [ns.name for ns in design.named_selections] == ["my_ns"]
+    assert design.named_selections[0].id == "ns1"
+    assert "named_selections" not in design._pending_sections
+
+    # A section that fails partway is not attached, and it is retried from its first item
+    with pytest.raises(GeometryRuntimeError, match="failed"):
+        design.materials
+    assert design._materials == []
+    assert "materials" in design._pending_sections
+
+    assert [material.name for material in design.materials] == ["steel", "aluminum", "copper"]
+    assert design.beams == []
+    assert design.coordinate_systems == []
+    assert design._pending_sections == {}
+
+
 def test_design_selection(modeler: Modeler):
     """Test to validate the designer selection for edges and __repr__ method."""
     sketch = Sketch()
@@ -1385,6 +1467,84 @@ def test_remove_member_from_imported_named_selection(modeler: Modeler):
     assert len(design.named_selections[4].edges) == 6
 
 
+def test_create_named_selections(modeler: Modeler):
+    """Test for creating and updating several ``NamedSelection`` at once."""
+    design = modeler.create_design("named_selections_bulk")
+    box = design.extrude_sketch("box", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    box2 = design.extrude_sketch("box2", Sketch().box(Point2D([5, 0]), 1, 1), 1)
+    dp = design.add_design_point("dp", Point3D([1, 0, 0]))
+
+    created = design.create_named_selections(
+        {f"face_{i}": [face] for i, face in enumerate(box.faces)} | {"mixed": [box2, dp]}
+    )
+    assert [ns.name for ns in created] == [f"face_{i}" for i in range(6)] + ["mixed"]
+    assert len(design.named_selections) == 7
+    for face, ns in zip(box.faces, created):
+        assert [ns_face.id for ns_face in ns.faces] == [face.id]
+        assert ns.faces[0].surface_type == face.surface_type
+    assert [body.id for body in created[-1].bodies] == [box2.id]
+    assert [point.id for point in created[-1].design_points] == [dp.id]
+    assert [ns.name for ns in box2.get_named_selections()] == ["mixed"]
+
+    # Update several named selections at once
+    design.update_named_selections(
+        add={"face_0": [box2.faces[0]], created[-1]: [box]},
+        remove={"face_0": [box.faces[0]], "mixed": [dp]},
+    )
+    assert len(design.named_selections) == 7
+    assert [face.id for face in created[0].faces] == [box2.faces[0].id]
+    assert {body.id for body in created[-1].bodies} == {box.id, box2.id}
+    assert created[-1].design_points == []
+    assert [ns.name for ns in box.get_named_selections()] == ["mixed"]
+
+    with pytest.raises(ValueError, match="No entities are provided"):
+        design.create_named_selections({"empty": []})
+    with pytest.raises(ValueError, match="does not exist"):
+        design.update_named_selections(add={"missing": [box]})
+    with pytest.raises(GeometryRuntimeError, match="cannot be empty after removal"):
+        design.update_named_selections(remove={"face_1": [box.faces[1]]})
+
+    # Named selections whose originals were deleted before a failure use their new
+    # versions, and the new versions of the others are deleted again
+    service = design._grpc_client.services.named_selection
+    delete_named_selections = service.delete_named_selections
+    first_id, second_id = created[1].id, created[2].id
+    deleted_ids = []
+
+    def fail_after_first_deletion(**kwargs):
+        deleted_ids.append(kwargs["ids"])
+        if len(deleted_ids) == 1:
+            delete_named_selections(ids=kwargs["ids"][:1], completed=kwargs["completed"])
+            raise GeometryRuntimeError("failed")
+        return delete_named_selections(**kwargs)
+
+    with patch.object(service, "delete_named_selections", side_effect=fail_after_first_deletion):
+        with pytest.raises(GeometryRuntimeError, match="failed"):
+            design.update_named_selections(
+                add={"face_1": [box2.faces[1]], "face_2": [box2.faces[2]]}
+            )
+    assert deleted_ids[0] == [first_id, second_id]
+    assert len(deleted_ids) == 2 and second_id not in deleted_ids[1]
+    assert created[1].id != first_id
+    assert {face.id for face in created[1].faces} == {box.faces[1].id, box2.faces[1].id}
+    assert created[2].id == second_id
+    assert [face.id for face in created[2].faces] == [box.faces[2].id]
+    assert len(design.named_selections) == 7
+
+    # Named selections created before a failure are deleted again
+    create_named_selections = service.create_named_selections
+
+    def fail_after_first_creation(**kwargs):
+        create_named_selections(selections=kwargs["selections"][:1], completed=kwargs["completed"])
+        raise GeometryRuntimeError("failed")
+
+    with patch.object(service, "create_named_selections", side_effect=fail_after_first_creation):
+        with pytest.raises(GeometryRuntimeError, match="failed"):
+            design.create_named_selections({"extra_0": [box], "extra_1": [box2]})
+    assert len(design.named_selections) == 7
+    assert len(modeler.read_existing_design().named_selections) == 7
+
+
 def test_old_backend_version(modeler: Modeler, fake_modeler_old_backend_242: Modeler):
     """Test named selection compatibility with older backend version."""
     # Try to verify name selection using earlier backend version
@@ -1409,6 +1569,29 @@ def test_empty_named_selection(modeler: Modeler):
         )
 
 
+def test_named_selection_members_after_body_changes(modeler: Modeler):
+    """Test the members of named selections are resolved to the current entities."""
+    design = modeler.create_design("NamedSelectionMembers_Test")
+    box = design.extrude_sketch("box", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    box_2 = design.extrude_sketch("box_2", Sketch().box(Point2D([0, 0]), 5, 5), 5)
+
+    ns_1 = design.create_named_selection("NS1", faces=[box.faces[0], box_2.faces[1]])
+    ns_2 = design.create_named_selection("NS2", edges=[box_2.edges[0]])
+    assert [face.id for face in ns_1.faces] == [box.faces[0].id, box_2.faces[1].id]
+    assert [edge.id for edge in ns_2.edges] == [box_2.edges[0].id]
+
+    # Modifying a body resolves its members again, while a new body is found as well
+    box_2.translate(UNITVECTOR3D_X, 1)
+    box_3 = design.extrude_sketch("box_3", Sketch().box(Point2D([10, 0]), 1, 1), 1)
+    ns_3 = design.create_named_selection("NS3", faces=[box_2.faces[1], box_3.faces[0]])
+    assert [face.id for face in ns_3.faces] == [box_2.faces[1].id, box_3.faces[0].id]
+    assert ns_3.faces[0] in box_2.faces
+
+    design.delete_body(box)
+    ns_4 = design.create_named_selection("NS4", bodies=[box_2, box_3])
+    assert [body.id for body in ns_4.bodies] == [box_2.id, box_3.id]
+
+
 def test_named_selection_contents(modeler: Modeler):
     """Test for verifying the correct contents of a ``NamedSelection``."""
     # Create your design on the server side
@@ -2893,6 +3076,51 @@ def test_get_collision(modeler: Modeler):
     assert body2.get_collision(body3) == CollisionType.NONE
 
 
+def test_get_collisions(modeler: Modeler):
+    """Test the collision states of all the pairs of bodies of a design."""
+    design = modeler.open_file(FILES_DIR / "MixingTank.scdocx")
+    bodies = design.bodies[:3]
+
+    collisions = design.get_collisions(bodies)
+    assert (bodies[0], bodies[1], CollisionType.TOUCH) in collisions
+    assert all(collision is not CollisionType.NONE for _, _, collision in collisions)
+    assert all(first.get_collision(second) is collision for first, second, collision in collisions)
+
+    index = design.get_bounding_box_index(bodies)
+    assert len(index) == 3
+    assert index.items == bodies
+
+    boxes = design.get_bounding_boxes(bodies)
+    assert len(boxes) == 3
+    assert np.allclose(boxes.min_corners[0], bodies[0].bounding_box.min_corner)
+    assert np.allclose(boxes.max_corners[0], bodies[0].bounding_box.max_corner)
+
+
+def test_shape_cache(modeler: Modeler):
+    """Test that face shapes are shared through the client cache until the body moves."""
+    design = modeler.create_design("ShapeCache")
+    sketch = Sketch()
+    sketch.box(Point2D([0, 0]), 10, 10)
+    body = design.extrude_sketch("Box", sketch, 10)
+
+    modeler.client.shape_cache.clear()
+    shapes = [face.shape for face in body.faces]
+    assert modeler.client.shape_cache.info().size == 6
+
+    # New face objects of the same body reuse the cached shapes
+    body._template._topology.clear()
+    assert [face.shape for face in body.faces] == shapes
+    assert modeler.client.shape_cache.info().hits >= 6
+
+    # Moving the body invalidates the cached shapes
+    body.translate(UNITVECTOR3D_X, 1)
+    body._template._topology.clear()
+    misses = modeler.client.shape_cache.info().misses
+    moved = [face.shape for face in body.faces]
+    assert all(shape not in shapes for shape in moved)
+    assert modeler.client.shape_cache.info().misses == misses + 6
+
+
 def test_set_fill_style(modeler: Modeler):
     """Test the setting the fill style of a body."""
     design = modeler.create_design("RVE")
@@ -2937,6 +3165,31 @@ def test_sphere_creation(modeler: Modeler):
     assert nested_sphere.parent_component.id == nested.id
 
 
+def test_bulk_sphere_and_extrusion_creation(modeler: Modeler):
+    """Test the creation of several spheres and extrusions at once."""
+    design = modeler.create_design("BulkCreation")
+    centers = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0]])
+    spheres = design.create_spheres("sphere", centers, [1, 1, 2])
+
+    assert [sphere.name for sphere in spheres] == ["sphere"] * 3
+    assert design.bodies == spheres
+    assert spheres[0].volume.m == pytest.approx(np.pi * 4 / 3, rel=1e-6)
+    assert spheres[2].volume.m == pytest.approx(np.pi * 32 / 3, rel=1e-6)
+
+    nested = design.add_component("NestedExtrusions")
+    sketches = [Sketch().box(Point2D([10 * i, 0]), 2, 2) for i in range(3)]
+    boxes = nested.extrude_sketches(["a", "b", "c"], sketches, [1, 2, 3], direction="-")
+
+    assert [box.name for box in boxes] == ["a", "b", "c"]
+    assert nested.bodies == boxes
+    for i, box in enumerate(boxes):
+        assert box.parent_component.id == nested.id
+        assert box.volume.m == pytest.approx(4 * (i + 1), rel=1e-6)
+
+    with pytest.raises(ValueError, match="does not match the number of bodies to create"):
+        nested.extrude_sketches("box", sketches, [1, 2])
+
+
 def test_sweep_sketch(modeler: Modeler):
     """Test revolving a circle profile around a circular axis to make a
     donut.
@@ -3324,6 +3577,77 @@ def test_unitless_design_parameters(modeler: Modeler):
     assert test_parameters[2].dimension_value == Quantity(2, "")
 
 
+def test_set_design_parameters(modeler: Modeler):
+    """Test setting several design parameters with a single synchronization."""
+    design = modeler.open_file(FILES_DIR / "blockswithparameters.dsco")
+    test_parameters = design.parameters
+
+    # Update two parameters at once and verify the statuses
+    test_parameters[1].dimension_value = 0.0006
+    test_parameters[3].dimension_value = Quantity(50, UNITS.mm)
+    statuses = design.set_parameters([test_parameters[1], test_parameters[3]])
+    assert statuses == [ParameterUpdateStatus.SUCCESS, ParameterUpdateStatus.SUCCESS]
+
+    parameters = {parameter.name: parameter for parameter in design.parameters}
+    assert parameters["p2"].dimension_value.m == pytest.approx(0.0006, rel=1e-8)
+
+    # Defer the synchronization until the end of the block
+    n_bodies = len(design.get_all_bodies())
+    with design.suspend_sync():
+        test_parameters[1].dimension_value = 0.0005
+        assert design.set_parameter(test_parameters[1]) == ParameterUpdateStatus.SUCCESS
+        assert design.set_parameters([test_parameters[3]]) == [ParameterUpdateStatus.SUCCESS]
+        assert design._sync_pending
+
+    assert not design._sync_pending
+    assert len(design.get_all_bodies()) == n_bodies
+    assert design.set_parameters([]) == []
+
+
+def test_parameter_sweep(modeler: Modeler, tmp_path_factory: pytest.TempPathFactory):
+    """Test running a parameter sweep with a checkpoint and downloads."""
+    design = modeler.open_file(FILES_DIR / "blockswithparameters.dsco")
+    output_dir = tmp_path_factory.mktemp("parameter_sweep")
+    checkpoint = output_dir / "sweep.jsonl"
+
+    variants = [
+        {"p2": 0.0005},
+        {"p2": Quantity(600, UNITS.mm**2)},
+        {"p1": 0.0006},
+    ]
+    sweep = ParameterSweep(
+        design,
+        variants,
+        evaluate=lambda design, values: len(design.get_all_bodies()),
+        export_format=DesignFileFormat.SCDOCX,
+        output_directory=output_dir,
+        checkpoint=checkpoint,
+    )
+    results = sweep.run()
+
+    # The first parameter is constrained, so the last variant fails
+    assert [result.succeeded for result in results] == [True, True, False]
+    assert "CONSTRAINED_PARAMETERS" in results[2].error
+    for result in results[:2]:
+        assert result.result == len(design.get_all_bodies())
+        assert result.file.exists()
+
+    # Resuming only reruns the failed variant
+    results = sweep.run()
+    assert [result.succeeded for result in results] == [True, True, False]
+    assert len(checkpoint.read_text().splitlines()) == 4
+
+    # Outcomes recorded for other values are not reused
+    variants[1] = {"p2": Quantity(700, UNITS.mm**2)}
+    results = ParameterSweep(design, variants, checkpoint=checkpoint).run()
+    assert [result.succeeded for result in results] == [True, True, False]
+    assert results[1].values == variants[1]
+    assert len(checkpoint.read_text().splitlines()) == 6
+
+    with pytest.raises(ValueError, match="no parameters named"):
+        ParameterSweep(design, [{"Unknown": 1.0}]).run()
+
+
 def test_cached_bodies(modeler: Modeler):
     """Test that bodies are cached correctly.
 
@@ -3357,7 +3681,7 @@ def test_cached_bodies(modeler: Modeler):
         assert body1 is body2  # We are comparing the memory addresses
         assert id(body1) == id(body2)
 
-    design.extrude_sketch(
+    new_body = design.extrude_sketch(
         name="CylinderBody2",
         sketch=sketch_cylinder,
         distance=Distance(20, unit=UNITS.m),
@@ -3365,9 +3689,20 @@ def test_cached_bodies(modeler: Modeler):
     )
     my_bodies_3 = design.bodies
 
+    # Existing bodies keep their identity and the new one is appended, while
+    # the list handed out before the creation is left untouched
+    assert len(my_bodies) == 2
+    assert my_bodies_3 is not my_bodies
+    assert my_bodies_3[-1] is new_body
     for body1, body3 in zip(my_bodies, my_bodies_3):
-        assert body1 is not body3
-        assert id(body1) != id(body3)
+        assert body1 is body3
+
+    # Copying and deleting bodies only updates the affected entries
+    copied_body = new_body.copy(design, "CylinderBody3")
+    assert design.bodies[-1] is copied_body
+    design.delete_body(new_body)
+    assert design.bodies == [*my_bodies, copied_body]
+    assert all(body1 is body2 for body1, body2 in zip(my_bodies, design.bodies))
 
 
 def test_extrude_sketch_with_cut_request(modeler: Modeler):
@@ -3561,6 +3896,26 @@ def test_get_edge_bounding_box(modeler: Modeler):
     assert center.z.m == 1
 
 
+def test_topology_table(modeler: Modeler):
+    """Test getting the topology of a design as a columnar table."""
+    design = modeler.create_design("topology_table")
+    box = design.extrude_sketch("box", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    comp = design.add_component("comp")
+    comp.extrude_sketch("cylinder", Sketch().circle(Point2D([3, 0]), 1), 2)
+
+    table = design.topology_table()
+
+    faces, edges, vertices = table.faces, table.edges, table.vertices
+    assert len(faces["id"]) == len(box.faces) + 3
+    assert sorted(faces["id"][faces["body"] == box.id]) == sorted(face.id for face in box.faces)
+    assert np.isclose(faces["area"][faces["body"] == box.id].sum(), 6)
+    assert np.all(faces["bbox_min"] <= faces["bbox_max"])
+    assert len(edges["id"][edges["body"] == box.id]) == 12
+    assert np.isclose(edges["length"][edges["body"] == box.id].sum(), 12)
+    assert len(vertices["id"][vertices["body"] == box.id]) == 8
+    assert SurfaceType.SURFACETYPE_CYLINDER.value in faces["surface_type"]
+
+
 def _entity(entity_id: str) -> Mock:
     entity = Mock()
     entity.id = entity_id
@@ -3586,22 +3941,18 @@ def _named_selection(*, backend_version=(27, 1, 0), bodies=None):
 
 def test_named_selection_faces_fallback_to_id_lookup():
     """Test faces property falls back to ID lookup when metadata build fails."""
-    import ansys.geometry.core.designer.selection as selection_module
-
     ns = _named_selection()
     faces = [Mock()]
 
     ns._verified = True
     ns._faces = None
     ns._ids_cached["faces"] = ["face-1"]
+    ns._design._get_entities_from_ids.return_value = faces
 
-    with (
-        patch.object(ns, "_NamedSelection__build_faces_from_metadata", return_value=None),
-        patch.object(selection_module, "get_faces_from_ids", return_value=faces) as get_faces_spy,
-    ):
+    with patch.object(ns, "_NamedSelection__build_faces_from_metadata", return_value=None):
         assert ns.faces is faces
 
-    get_faces_spy.assert_called_once_with(ns._design, ["face-1"])
+    ns._design._get_entities_from_ids.assert_called_once_with("faces", ["face-1"])
 
 
 def test_named_selection_build_faces_from_metadata_returns_none_when_body_missing():
@@ -4462,6 +4813,26 @@ def test_body_get_named_selections(modeler: Modeler):
             assert len(ns_list) == 0  # No named selection for this body
 
 
+def test_get_named_selections_uses_reverse_index(modeler: Modeler):
+    """Test that entities find their named selections without reading every selection."""
+    design = modeler.create_design("named_selections_reverse_index")
+    box1 = design.extrude_sketch("box1", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    box2 = design.extrude_sketch("box2", Sketch().box(Point2D([2, 2]), 1, 1), 1)
+    ns1 = design.create_named_selection("ns1", bodies=[box1])
+    ns2 = design.create_named_selection("ns2", bodies=[box1, box2])
+
+    # Members of named selections created in this session are already known
+    with patch.object(
+        design._grpc_client.services.named_selection, "get_named_selection"
+    ) as get_spy:
+        assert box1.get_named_selections() == [ns1, ns2]
+        assert box2.get_named_selections() == [ns2]
+        get_spy.assert_not_called()
+
+    design.delete_named_selection(ns1)
+    assert box1.get_named_selections() == [ns2]
+
+
 def test_vertices_get_named_selections(modeler: Modeler):
     """Test getting named selections associated with vertices."""
     design = modeler.create_design("vertex_named_selections")
@@ -28,6 +28,7 @@ import pytest
 from ansys.geometry.core import Modeler
 from ansys.geometry.core.math import Point2D, Vector3D
 from ansys.geometry.core.math.point import Point3D
+from ansys.geometry.core.misc.auxiliary import get_shapes_from_edges, get_shapes_from_faces
 from ansys.geometry.core.misc.units import UNITS, Quantity
 from ansys.geometry.core.sketch import Sketch
 
@@ -57,6 +58,35 @@ def test_edges_startend_cylinder(modeler: Modeler):
         assert edge.shape.start == edge.shape.end
 
 
+def test_edges_and_faces_batched_shapes(modeler: Modeler):
+    design = modeler.create_design("BatchedShapes")
+    sketch = Sketch()
+    sketch.box(Point2D([0, 0], UNITS.m), Quantity(2, UNITS.m), Quantity(1, UNITS.m))
+    body = design.extrude_sketch("BoxBody", sketch, Quantity(3, UNITS.m))
+
+    # Shapes requested in a single batch are cached in the entities
+    edges = body.edges
+    shapes = get_shapes_from_edges(edges)
+    assert len(shapes) == 12
+    for edge, shape in zip(edges, shapes):
+        assert edge.shape is shape
+        assert np.isclose(shape.length.m, Vector3D.from_points(shape.start, shape.end).magnitude)
+
+    faces = body.faces
+    shapes = get_shapes_from_faces(faces)
+    assert len(shapes) == 6
+    for face, shape in zip(faces, shapes):
+        assert face.shape is shape
+
+    # And match the shapes requested entity by entity
+    for edge, other in zip(edges, design.bodies[0].edges):
+        assert np.allclose(edge.shape.start, other.shape.start)
+        assert np.allclose(edge.shape.end, other.shape.end)
+        assert edge.shape.interval == other.shape.interval
+    for face, other in zip(faces, design.bodies[0].faces):
+        assert face.shape.box_uv == other.shape.box_uv
+
+
 def test_edges_get_vertices(modeler: Modeler):
     # Create a simple design with a box
     design = modeler.create_design("BoxVertices")
@@ -1251,6 +1251,28 @@ def test_move_translate_component(modeler: Modeler):
     assert np.isin(expected_vertices, translated_vertices).all()
 
 
+def test_move_translate_resets_cached_data(modeler: Modeler):
+    """Test that moving a named selection invalidates the cached data of its bodies."""
+    design = modeler.create_design("move_translate_cache")
+    body = design.extrude_sketch("box", Sketch().box(Point2D([0, 0]), 2, 2), 2)
+
+    # Cache the topology and the tessellation of the body
+    ns = design.create_named_selection("ns_cache", bodies=[body])
+    assert len(body.faces) == 6
+    body.get_raw_tessellation()
+    assert body._template._raw_tessellation is not None
+    revision = design.revision
+
+    success = modeler.geometry_commands.move_translate(ns, UNITVECTOR3D_Z, Distance(2, UNITS.m))
+    assert success
+
+    # The cached data was discarded and the moved geometry is read again
+    assert design.revision > revision
+    assert body._template._raw_tessellation is None
+    vertices = [vertex for edge in body.edges for vertex in (edge.start, edge.end)]
+    assert min(vertex.z.m for vertex in vertices) == pytest.approx(2.0)
+
+
 def test_move_translate_faces_and_edges(modeler: Modeler):
     """Test move_translate with direct face and edge inputs (no NamedSelection)."""
     is_v0 = modeler._grpc_client.services.version == GeometryApiProtos.V0
@@ -89,3 +89,34 @@ def test_min_distance_between_face_and_body(modeler: Modeler):
     body2.translate(UnitVector3D([0, 0, 1]), 1)
     gap = modeler.measurement_tools.min_distance_between_objects(body1.faces[0], body2)
     assert np.isclose(1.41421356237, gap.distance._value)
+
+
+def test_min_distance_matrix(modeler: Modeler):
+    """Test the gaps between several bodies at once."""
+    design = modeler.create_design("min_distance_matrix")
+
+    bodies = [
+        design.extrude_sketch(f"box{i}", Sketch().box(Point2D([x, 0]), 1, 1), 1)
+        for i, x in enumerate((0, 2, 5))
+    ]
+
+    matrix = modeler.measurement_tools.min_distance_matrix(bodies)
+    assert np.allclose(matrix, [[0.0, 1.0, 4.0], [1.0, 0.0, 2.0], [4.0, 2.0, 0.0]])
+
+    # Pairs further apart than the maximum distance are not measured
+    matrix = modeler.measurement_tools.min_distance_matrix(
+        bodies[:1], bodies[1:], max_distance=Distance(1.5)
+    )
+    assert np.isclose(matrix[0, 0], 1.0)
+    assert np.isinf(matrix[0, 1])
+
+    rows, cols, gaps = modeler.measurement_tools.min_distance_matrix(
+        bodies, max_distance=2.5, as_pairs=True
+    )
+    assert rows.tolist() == [0, 1]
+    assert cols.tolist() == [1, 2]
+    assert np.allclose(gaps, [1.0, 2.0])
+
+    # Faces and bodies can be mixed
+    matrix = modeler.measurement_tools.min_distance_matrix([bodies[0].faces[0]], [bodies[1]])
+    assert np.isclose(matrix[0, 0], 1.0)
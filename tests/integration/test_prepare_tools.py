@@ -49,6 +49,21 @@ def test_volume_extract_from_faces(modeler: Modeler):
     assert len(created_bodies) == 1
 
 
+def test_volume_extract_from_faces_suspended_sync(modeler: Modeler):
+    """Test a volume is created from the provided faces while the sync is suspended."""
+    design = modeler.open_file(FILES_DIR / "hollowCylinder.scdocx")
+
+    body = design.bodies[0]
+    inside_faces = [body.faces[0]]
+    sealing_faces = [body.faces[1], body.faces[2]]
+    with design.suspend_sync():
+        created_bodies = modeler.prepare_tools.extract_volume_from_faces(
+            sealing_faces, inside_faces
+        )
+        assert len(created_bodies) == 1
+        assert created_bodies[0].id in [body.id for body in design.get_all_bodies()]
+
+
 def test_volume_extract_from_edge_loops(modeler: Modeler):
     """Test a volume is created from the provided edges."""
     design = modeler.open_file(FILES_DIR / "hollowCylinder.scdocx")
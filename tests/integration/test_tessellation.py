@@ -348,6 +348,82 @@ def test_get_design_tessellation(modeler: Modeler):
     assert design._design_tess == design_tess
 
 
+def test_design_tessellation_revision(modeler: Modeler):
+    """Test that the design tessellation is not reused once the design changes."""
+    design = modeler.create_design("tessellation_revision")
+    box = design.extrude_sketch("box", Sketch().box(Point2D([0, 0]), 2, 2), 2)
+
+    revision = design.revision
+    design_tess = design.get_raw_tessellation()
+    assert design.get_raw_tessellation() is design_tess
+    assert design.revision == revision
+
+    # Creating a body changes the design
+    cyl = design.extrude_sketch("cylinder", Sketch().circle(Point2D([1, 0]), 0.5), 2)
+    assert design.revision > revision
+    design_tess = design.get_raw_tessellation()
+    assert set(design_tess) == {box.id, cyl.id}
+
+    # Renaming a body does not change its geometry
+    revision = design.revision
+    cyl.set_name("renamed")
+    assert design.revision == revision
+    assert design.get_raw_tessellation() is design_tess
+
+    # Moving a body changes the design tessellation and the shapes of its faces only
+    face = box.faces[0]
+    shape = face.shape
+    cyl_shape = cyl.faces[0].shape
+    box.translate(UnitVector3D([1, 0, 0]), 1)
+    assert design.revision == revision
+    assert design.get_raw_tessellation() is not design_tess
+    assert face.shape is not shape
+    assert cyl.faces[0].shape is cyl_shape
+
+
+def test_get_instanced_tessellation(modeler: Modeler):
+    """Test tessellating the instances of a component with a single mesh."""
+    design = modeler.create_design("instanced_tessellation")
+    bolt = design.add_component("bolt")
+    bolt.extrude_sketch("head", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    for i in range(1, 3):
+        instance = design.add_component(f"bolt_{i}", template=bolt)
+        instance.modify_placement(translation=Vector3D([2 * i, 0, 0]))
+
+    tessellation = design.get_instanced_tessellation()
+    assert len(tessellation.meshes) == 1
+    assert len(tessellation.instances) == 3
+
+    flat = tessellation.expand()
+    for body in design.get_all_bodies():
+        body_tess = body.get_raw_tessellation()
+        for face_id, face_tess in body_tess.items():
+            assert flat[body.id][face_id]["vertices"] == pytest.approx(face_tess["vertices"])
+
+    if are_graphics_available():
+        polydata = design.tessellate()
+        assert polydata.n_cells == 3 * bolt.bodies[0].tessellate(merge=True).n_cells
+        assert polydata.bounds[1] == pytest.approx(4.5)
+
+
+def test_export_to_glb(modeler: Modeler, tmp_path):
+    """Test exporting the instances of a component to a GLB file."""
+    pygltflib = pytest.importorskip("pygltflib")
+
+    design = modeler.create_design("glb_export")
+    bolt = design.add_component("bolt")
+    bolt.extrude_sketch("head", Sketch().box(Point2D([0, 0]), 1, 1), 1)
+    instance = design.add_component("bolt_1", template=bolt)
+    instance.modify_placement(translation=Vector3D([2, 0, 0]))
+
+    file_location = design.export_to_glb(tmp_path, quantize=True)
+    assert file_location == tmp_path / "glb_export.glb"
+
+    document = pygltflib.GLTF2().load_binary(str(file_location))
+    assert len(document.meshes) == 1
+    assert len(document.nodes) == 2
+
+
 def test_get_body_raw_tessellation(modeler: Modeler):
     """Test getting the raw tessellation from a body."""
 
@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests the ``InstancedTessellation`` class."""
+
+import numpy as np
+import pytest
+
+from ansys.geometry.core.designer import InstancedTessellation
+from ansys.geometry.core.math import IDENTITY_MATRIX44, Matrix44
+
+TRANSLATION = Matrix44([[1, 0, 0, 10], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+
+
+def _square_mesh() -> dict:
+    return {
+        "face-0": {
+            "vertices": [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0],
+            "faces": [3, 0, 1, 2, 3, 0, 2, 3],
+            "is_edge": False,
+        },
+        "edge-0": {"vertices": [0, 0, 0, 1, 0, 0], "is_edge": True},
+    }
+
+
+def test_instanced_tessellation_expand():
+    """Test expanding the shared meshes into one mesh per body occurrence."""
+    tessellation = InstancedTessellation(
+        {"master": _square_mesh()},
+        [("body-0", "master", IDENTITY_MATRIX44), ("body-1", "master", TRANSLATION)],
+    )
+    assert repr(tessellation) == "InstancedTessellation(meshes=1, instances=2)"
+
+    flat = tessellation.expand()
+    assert list(flat) == ["body-0", "body-1"]
+    assert flat["body-0"]["face-0"]["vertices"].tolist() == _square_mesh()["face-0"]["vertices"]
+    assert flat["body-1"]["face-0"]["vertices"][::3].tolist() == [10, 11, 11, 10]
+    assert flat["body-1"]["face-0"]["faces"] == [3, 0, 1, 2, 3, 0, 2, 3]
+    assert flat["body-1"]["edge-0"]["vertices"].tolist() == [10, 0, 0, 11, 0, 0]
+
+    with pytest.raises(ValueError, match="unknown meshes"):
+        InstancedTessellation({}, [("body-0", "master", IDENTITY_MATRIX44)])
+
+
+def test_instanced_tessellation_to_polydata():
+    """Test merging all the body occurrences into a single mesh."""
+    pytest.importorskip("pyvista")
+
+    tessellation = InstancedTessellation(
+        {"master": _square_mesh()},
+        [("body-0", "master", IDENTITY_MATRIX44), ("body-1", "master", TRANSLATION)],
+    )
+    polydata = tessellation.to_polydata()
+    assert polydata.n_points == 12
+    assert polydata.n_cells == 6
+    assert polydata.n_lines == 2
+    assert np.allclose(polydata.bounds, [0, 11, 0, 1, 0, 0])
+    assert np.isclose(polydata.area, 2.0)
+
+    assert InstancedTessellation({}, []).to_polydata().n_points == 0
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_instanced_tessellation_to_glb(tmp_path, quantize):
+    """Test writing the shared meshes and their placements to a GLB file."""
+    pygltflib = pytest.importorskip("pygltflib")
+
+    tessellation = InstancedTessellation(
+        {"master": _square_mesh()},
+        [("body-0", "master", IDENTITY_MATRIX44), ("body-1", "master", TRANSLATION)],
+    )
+    file_location = tessellation.to_glb(tmp_path / "design.glb", quantize=quantize)
+
+    document = pygltflib.GLTF2().load_binary(str(file_location))
+    assert len(document.meshes) == 1
+    assert [node.name for node in document.nodes] == ["body-0", "body-1"]
+    assert [node.mesh for node in document.nodes] == [0, 0]
+    assert document.extensionsRequired == (["KHR_mesh_quantization"] if quantize else [])
+
+    # Decode the positions of the second occurrence back to world space
+    primitive = document.meshes[0].primitives[0]
+    accessor = document.accessors[primitive.attributes.POSITION]
+    view = document.bufferViews[accessor.bufferView]
+    dtype, width = (np.int16, 4) if quantize else (np.float32, 3)
+    positions = np.frombuffer(
+        document.binary_blob(), dtype=dtype, count=accessor.count * width, offset=view.byteOffset
+    ).reshape(-1, width)[:, :3]
+    matrix = np.reshape(document.nodes[1].matrix, (4, 4)).T
+    world = positions @ matrix[:3, :3].T + matrix[:3, 3]
+    assert world == pytest.approx(
+        tessellation.expand()["body-1"]["face-0"]["vertices"].reshape(-1, 3)
+    )
+    assert document.accessors[primitive.indices].count == 6
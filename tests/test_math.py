@@ -36,6 +36,8 @@ from ansys.geometry.core.math import (
     ZERO_VECTOR2D,
     ZERO_VECTOR3D,
     BoundingBox,
+    BoundingBoxArray,
+    BoundingBoxIndex,
     Frame,
     Matrix,
     Matrix33,
@@ -1397,3 +1399,135 @@ def test_bounding_box_no_intersection():
     firstboxbounding = BoundingBox(Point3D([-1, -1, -1]), Point3D([2, 2, 1]), Point3D([0, 0, 0]))
     secondboxbounding = BoundingBox(Point3D([2, 2, 2]), Point3D([3, 3, 3]), Point3D([4, 4, 4]))
     assert BoundingBox.intersect_bboxes(firstboxbounding, secondboxbounding) is None
+
+
+def test_bounding_box_array():
+    """Test the vectorized operations of ``BoundingBoxArray``."""
+    boxes = BoundingBoxArray.from_corners([[0, 0, 0], [2, 0, 0]], [[1, 1, 1], [4, 2, 1]])
+    assert len(boxes) == 2
+    assert np.allclose(boxes.centers, [[0.5, 0.5, 0.5], [3, 1, 0.5]])
+    assert np.allclose(boxes.sizes, [[1, 1, 1], [2, 2, 1]])
+    assert np.allclose(boxes.volumes, [1, 4])
+    assert not boxes.is_empty.any()
+
+    box = boxes[1]
+    assert isinstance(box, BoundingBox)
+    assert box == BoundingBox(Point3D([2, 0, 0]), Point3D([4, 2, 1]))
+    assert box.center == Point3D([3, 1, 0.5])
+    assert len(boxes[[True, False]]) == 1
+    assert np.allclose(BoundingBoxArray.from_bounding_boxes([box]).corners, boxes[1:].corners)
+
+    contained = boxes.contains_points([[0.5, 0.5, 0.5], [2, 2, 1], [1.5, 0.5, 0.5]])
+    assert np.array_equal(contained, [[True, False, False], [False, True, False]])
+
+    cell = BoundingBox(Point3D([0.5, 0.5, 0.5]), Point3D([2.5, 1.5, 1.5]))
+    assert np.array_equal(boxes.overlaps(cell), [[True], [True]])
+    assert np.array_equal(boxes.overlaps(boxes), [[True, False], [False, True]])
+
+    union = boxes.union(cell)
+    assert np.allclose(union.min_corners, [[0, 0, 0], [0.5, 0, 0]])
+    assert np.allclose(union.max_corners, [[2.5, 1.5, 1.5], [4, 2, 1.5]])
+
+    intersection = boxes.intersection(boxes[::-1])
+    assert intersection.is_empty.all()
+    assert np.allclose(intersection.volumes, 0)
+    intersection = boxes.intersection(cell)
+    assert np.allclose(intersection.volumes, [0.125, 0.25])
+    assert np.allclose(intersection.union(boxes).corners, boxes.corners)
+
+    bounds = boxes.bounds()
+    assert bounds == BoundingBox(Point3D([0, 0, 0]), Point3D([4, 2, 1]))
+    assert boxes.intersection(boxes[[1, 1]]).bounds() == boxes[1]
+
+    index = boxes.to_index(items=["a", "b"])
+    assert np.array_equal(index.query_point([3, 1, 1]), [1])
+
+    with pytest.raises(ValueError, match="shape"):
+        BoundingBoxArray(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="must not exceed"):
+        BoundingBoxArray.from_corners([[1, 1, 1]], [[0, 0, 0]])
+    with pytest.raises(ValueError, match="Cannot combine"):
+        boxes.union(boxes[[0, 1, 0]])
+    with pytest.raises(ValueError, match="cannot be indexed"):
+        boxes.intersection(boxes[::-1]).to_index()
+    with pytest.raises(ValueError, match="Cannot bound"):
+        boxes[[False, False]].bounds()
+    with pytest.raises(ValueError, match="Cannot bound"):
+        boxes.intersection(boxes[::-1]).bounds()
+
+
+def _random_boxes(count: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    min_corners = rng.random((count, 3)) * 10
+    return min_corners, min_corners + rng.random((count, 3))
+
+
+def test_bounding_box_index_overlapping_pairs():
+    """Test that the index finds the same overlapping pairs as a brute-force check."""
+    min_corners, max_corners = _random_boxes(500)
+    index = BoundingBoxIndex(min_corners, max_corners, leaf_size=4)
+
+    overlap = np.all(
+        (min_corners[:, None] <= max_corners[None]) & (max_corners[:, None] >= min_corners[None]),
+        axis=2,
+    )
+    expected_rows, expected_cols = np.nonzero(np.triu(overlap, k=1))
+    rows, cols = index.overlapping_pairs()
+    assert np.array_equal(rows, expected_rows)
+    assert np.array_equal(cols, expected_cols)
+
+    other_min, other_max = _random_boxes(50, seed=1)
+    other = BoundingBoxIndex(other_min, other_max)
+    overlap = np.all(
+        (min_corners[:, None] <= other_max[None]) & (max_corners[:, None] >= other_min[None]),
+        axis=2,
+    )
+    expected_rows, expected_cols = np.nonzero(overlap)
+    rows, cols = index.overlapping_pairs(other)
+    assert np.array_equal(rows, expected_rows)
+    assert np.array_equal(cols, expected_cols)
+
+
+def test_bounding_box_index_queries():
+    """Test the box, point, ray and nearest queries of the index."""
+    # Unit cubes one unit apart along X
+    min_corners = np.array([[2.0 * i, 0, 0] for i in range(20)])
+    boxes = [BoundingBox(Point3D(low), Point3D(low + 1)) for low in min_corners]
+    index = BoundingBoxIndex.from_bounding_boxes(boxes, items=boxes)
+    assert len(index) == 20
+    assert index.items is boxes
+
+    assert np.array_equal(index.query_box([3, 0, 0], [6.5, 1, 1]), [1, 2, 3])
+    assert np.array_equal(index.query_point(Point3D([4.5, 0.5, 0.5])), [2])
+    assert np.array_equal(index.query_point([5, 1, 1]), [2])
+    assert len(index.query_point([5.5, 0.5, 0.5])) == 0
+
+    hits, distances = index.query_ray([40, 0.5, 0.5], [-1, 0, 0], max_distance=4.5)
+    assert np.array_equal(hits, [19, 18])
+    assert np.allclose(distances, [1, 3])
+    hits, distances = index.query_ray([4.5, 0.5, -1], UnitVector3D([0, 0, 1]))
+    assert np.array_equal(hits, [2])
+    assert np.allclose(distances, [1])
+    assert len(index.query_ray([4.5, 2, -1], [0, 0, 1])[0]) == 0
+
+    closest, distances = index.nearest([5.5, 0.5, 0.5], count=3)
+    assert set(closest[:2]) == {2, 3}
+    assert np.allclose(distances, [0.5, 0.5, 2.5])
+
+    with pytest.raises(ValueError, match="zero vector"):
+        index.query_ray([0, 0, 0], [0, 0, 0])
+    with pytest.raises(ValueError, match="must not exceed"):
+        BoundingBoxIndex(min_corners + 1, min_corners)
+    with pytest.raises(ValueError, match="one item per bounding box"):
+        BoundingBoxIndex(min_corners, min_corners + 1, items=boxes[:1])
+
+
+def test_bounding_box_index_empty():
+    """Test that an empty index answers every query with no boxes."""
+    index = BoundingBoxIndex(np.empty((0, 3)), np.empty((0, 3)))
+
+    assert len(index) == 0
+    assert len(index.query_box([0, 0, 0], [1, 1, 1])) == 0
+    assert len(index.query_ray([0, 0, 0], [1, 0, 0])[0]) == 0
+    assert len(index.nearest([0, 0, 0])[0]) == 0
+    assert all(len(positions) == 0 for positions in index.overlapping_pairs())
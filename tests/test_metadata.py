@@ -20,6 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import subprocess
+import sys
+
+import pytest
+
 from ansys.geometry.core import __version__
 
 
@@ -34,3 +39,24 @@ def test_pkg_version():
     read_version = importlib_metadata.version("ansys-geometry-core")
 
     assert __version__ == read_version
+
+
+def test_lazy_public_namespace():
+    # Run in a fresh interpreter: the package is already fully imported in this one
+    code = (
+        "import sys\n"
+        "import ansys.geometry.core as pygeom\n"
+        "assert 'ansys.geometry.core.modeler' not in sys.modules\n"
+        "assert 'Modeler' in dir(pygeom)\n"
+        "from ansys.geometry.core import LOG, Modeler, launch_modeler\n"
+        "assert 'ansys.geometry.core.modeler' in sys.modules\n"
+        "assert pygeom.Modeler is Modeler\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_public_namespace_unknown_attribute():
+    import ansys.geometry.core as pygeom
+
+    with pytest.raises(AttributeError, match="has no attribute 'NotAnAttribute'"):
+        pygeom.NotAnAttribute
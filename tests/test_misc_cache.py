@@ -0,0 +1,91 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests the ``LRUCache`` class."""
+
+import pytest
+
+from ansys.geometry.core.misc import CacheInfo, LRUCache
+
+
+def test_lru_cache_eviction():
+    """Test that the least recently used entries are dropped first."""
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Using "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b", default=-1) == -1
+
+    # Replacing an entry marks it as used
+    cache.put("a", 10)
+    cache.put("d", 4)
+    assert cache.get("a") == 10
+    assert "c" not in cache
+
+
+def test_lru_cache_info():
+    """Test the statistics of the cache."""
+    cache = LRUCache(10)
+    assert cache.info() == CacheInfo(hits=0, misses=0, max_size=10, size=0)
+    assert cache.info().hit_ratio == 0.0
+
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    info = cache.info()
+    assert info == CacheInfo(hits=2, misses=1, max_size=10, size=1)
+    assert info.hit_ratio == pytest.approx(2 / 3)
+    assert repr(cache) == "LRUCache(size=1, max_size=10, hits=2, misses=1)"
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, max_size=10, size=0)
+
+
+def test_lru_cache_max_size():
+    """Test changing and disabling the maximum size of the cache."""
+    cache = LRUCache(5)
+    for key in range(5):
+        cache.put(key, key)
+
+    # Shrinking the cache drops the oldest entries
+    cache.max_size = 2
+    assert cache.max_size == 2
+    assert [key in cache for key in range(5)] == [False, False, False, True, True]
+
+    # A size of zero disables the cache
+    cache.max_size = 0
+    assert len(cache) == 0
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+    with pytest.raises(ValueError, match="must not be negative"):
+        LRUCache(-1)
+    with pytest.raises(ValueError, match="must not be negative"):
+        cache.max_size = -1
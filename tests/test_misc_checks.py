@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 import warnings
+import weakref
 
 import numpy as np
 from pint import Quantity
@@ -469,6 +470,80 @@ def test_min_version_backend():
         case_no_version(mock_object)
 
 
+def test_ensure_design_is_active():
+    """Test that the active design check finds the design of any entity."""
+    from ansys.geometry.core.misc.checks import ensure_design_is_active
+
+    class MockDesign:
+        def __init__(self):
+            self._design_ref = weakref.ref(self)
+            self.is_closed = False
+
+    class MockBody:
+        def __init__(self, design):
+            self._design_ref = design._design_ref
+
+    class MockDesignPoint:
+        def __init__(self, parent_component):
+            self._parent_component = parent_component
+
+    class MockFace:
+        def __init__(self, body):
+            self._body = body
+
+    @ensure_design_is_active
+    def operation(entity):
+        return True
+
+    design = MockDesign()
+    body = MockBody(design)
+    for entity in (design, body, MockDesignPoint(design), MockFace(body)):
+        assert operation(entity)
+
+    design.is_closed = True
+    with pytest.raises(GeometryRuntimeError, match="The design has been closed"):
+        operation(MockFace(body))
+
+    with pytest.raises(ValueError, match="Unable to find the design reference."):
+        operation(object())
+
+
+def test_bump_design_revision():
+    """Test that the revision of the design increases after changing it, even on failure."""
+    from ansys.geometry.core.misc.checks import bump_design_revision
+
+    class MockDesign:
+        def __init__(self):
+            self._design_ref = weakref.ref(self)
+            self.revision = 0
+
+        def _bump_revision(self):
+            self.revision += 1
+
+    class MockBody:
+        def __init__(self, design):
+            self._design_ref = design._design_ref
+
+    @bump_design_revision
+    def operation(entity, fail=False):
+        if fail:
+            raise RuntimeError("Operation failed.")
+        return entity._design_ref().revision
+
+    design = MockDesign()
+    body = MockBody(design)
+
+    # The revision is increased once the operation is done
+    assert operation(body) == 0
+    assert design.revision == 1
+    assert operation(design) == 1
+    assert design.revision == 2
+
+    with pytest.raises(RuntimeError, match="Operation failed."):
+        operation(body, fail=True)
+    assert design.revision == 3
+
+
 def test_deprecated_method_decorator():
     """Test the deprecated method decorator."""
 
@@ -167,6 +167,17 @@ def test_contains_value():
     assert reversed_interval.contains_value(11, 0.5) is False
 
 
+def test_parameter_space_slots():
+    """Test that parameter-space value classes do not carry an instance ``__dict__``."""
+    interval = Interval(0, 1)
+    box = BoxUV(interval, Interval(2, 3))
+    param = ParamUV(0.5, 0.5)
+    for obj in (interval, box, param):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        interval.foo = 1
+
+
 def test_planar_surface():
     """Test the planar surface functionality."""
     with pytest.raises(
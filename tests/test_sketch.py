@@ -46,6 +46,7 @@ from ansys.geometry.core.sketch import (
     SketchFace,
     SketchNurbs,
     SketchSegment,
+    SketchSegmentArray,
     Slot,
     SpurGear,
     Triangle,
@@ -1363,3 +1364,89 @@ def test_partial_ellipse_sketch_errors():
         sketch.partial_ellipse(
             Point2D([0, 0], UNITS.m), 2 * UNITS.m, 1 * UNITS.m, np.pi / 4, np.pi / 4
         )
+
+
+def test_sketch_compile():
+    """Test that the compiled geometry of a sketch is reused until the sketch changes."""
+    sketch = Sketch()
+    sketch.circle(Point2D([0, 0]), 10 * UNITS.mm)
+
+    # Compiling again returns the very same message
+    compiled = sketch.compile("v1")
+    assert sketch.compile("v1") is compiled
+    assert len(compiled.circles) == 1
+
+    # Each protocol version has its own compiled message
+    compiled_v0 = sketch.compile("v0")
+    assert compiled_v0 is not compiled
+    assert sketch.compile("v0") is compiled_v0
+
+    # Adding a sketch object invalidates the compiled message
+    sketch.segment(Point2D([20, 0]), Point2D([30, 0]))
+    recompiled = sketch.compile("v1")
+    assert recompiled is not compiled
+    assert len(recompiled.lines) == 1
+    assert sketch.compile("v1") is recompiled
+
+    # Changing the sketch plane invalidates the compiled message
+    sketch.translate_sketch_plane_by_offset(z=Distance(1, UNITS.mm))
+    moved = sketch.compile("v1")
+    assert moved is not recompiled
+    assert moved.circles[0].center.z != recompiled.circles[0].center.z
+
+
+def test_sketch_polyline():
+    """Test array-backed polyline and segment creation in a sketch."""
+    sketch = Sketch()
+    points = np.array([[0, 0], [10, 0], [10, 10], [0, 10]])
+
+    # An open polyline has one segment less than points
+    sketch.polyline(points, unit=UNITS.mm, tag="open")
+    polyline = sketch.edges[-1]
+    assert isinstance(polyline, SketchSegmentArray)
+    assert sketch.get("open") == [polyline]
+    assert len(polyline) == 3
+    assert polyline.start == Point2D([0, 0], UNITS.mm)
+    assert polyline.end == Point2D([0, 10], UNITS.mm)
+    assert polyline.length == Quantity(30, UNITS.mm)
+    assert np.allclose(polyline.starts, points[:-1])
+    assert np.allclose(polyline.ends, points[1:])
+    assert polyline.contains_point(Point2D([10, 5], UNITS.mm))
+    assert not polyline.contains_point(Point2D([5, 5], UNITS.mm))
+
+    # Chained sketch operations continue from the end of the polyline
+    sketch.segment_to_point(Point2D([0, 20], UNITS.mm))
+    assert sketch.edges[-1].start == Point2D([0, 10], UNITS.mm)
+
+    # A closed polyline adds the closing segment, without duplicating it
+    sketch.polyline(points, closed=True, unit=UNITS.mm)
+    assert len(sketch.edges[-1]) == 4
+    assert sketch.edges[-1].end == Point2D([0, 0], UNITS.mm)
+    sketch.polyline(np.vstack([points, points[:1]]), closed=True, unit=UNITS.mm)
+    assert len(sketch.edges[-1]) == 4
+
+    # Disconnected segments
+    sketch.segments_from_array([[0, 0], [5, 5]], [[1, 0], [5, 6]], unit=UNITS.mm)
+    assert len(sketch.edges[-1]) == 2
+    assert sketch.edges[-1].length == Quantity(2, UNITS.mm)
+
+    # All segments are converted to lines
+    assert len(sketch.compile("v1").lines) == 3 + 1 + 4 + 4 + 2
+
+    # Changing the plane moves the segments
+    sketch.plane = Plane(Point3D([0, 0, 1], UNITS.m))
+    starts, _ = sketch.edges[-1].global_coordinates()
+    assert np.allclose(starts[:, 2], 1)
+
+    if are_graphics_available():
+        assert polyline.visualization_polydata.n_cells == 3
+
+    # Errors
+    with pytest.raises(ValueError, match="at least 2 points"):
+        sketch.polyline([[0, 0]])
+    with pytest.raises(ValueError, match="same \\(n, 2\\) shape"):
+        sketch.segments_from_array([[0, 0]], [[1, 1], [2, 2]])
+    with pytest.raises(ValueError, match="finite values"):
+        sketch.segments_from_array([[0, np.nan]], [[1, 1]])
+    with pytest.raises(ValueError, match="same 'start' and 'end' values"):
+        sketch.polyline([[0, 0], [1, 1], [1, 1]])
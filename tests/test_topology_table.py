@@ -0,0 +1,89 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests the ``TopologyTable`` class."""
+
+import numpy as np
+import pytest
+
+from ansys.geometry.core.designer import CurveType, SurfaceType, TopologyTable
+
+
+def _sample_table() -> TopologyTable:
+    bodies = [
+        {
+            "id": "body-0",
+            "faces": [{"id": "face-0", "surface_type": 1, "is_reversed": False}],
+            "edges": [
+                {"id": "edge-0", "curve_type": 1, "is_reversed": False},
+                {"id": "edge-1", "curve_type": 2, "is_reversed": True},
+            ],
+            "vertices": [{"id": "vertex-0", "position": (0.0, 0.0, 0.0)}],
+        }
+    ]
+    faces = [{"id": "face-0", "area": 2.0, "min_corner": (0, 0, 0), "max_corner": (1, 2, 0)}]
+    edges = [
+        {"id": "edge-0", "length": 1.0, "min_corner": (0, 0, 0), "max_corner": (1, 0, 0)},
+        {"id": "edge-1", "length": 3.0, "min_corner": (0, 0, 0), "max_corner": (1, 1, 0)},
+    ]
+    return TopologyTable._from_service_data(bodies, faces, edges)
+
+
+def test_topology_table(tmp_path):
+    """Test building, saving and loading a ``TopologyTable``."""
+    table = _sample_table()
+    assert repr(table) == "TopologyTable(faces=1, edges=2, vertices=1)"
+
+    assert table.faces["body"].tolist() == ["body-0"]
+    assert SurfaceType(table.faces["surface_type"][0]) == SurfaceType.SURFACETYPE_PLANE
+    assert table.faces["bbox_max"].shape == (1, 3)
+    assert table.edges["length"].sum() == 4.0
+    assert CurveType(table.edges["curve_type"][1]) == CurveType.CURVETYPE_CIRCLE
+    assert table.edges["is_reversed"].tolist() == [False, True]
+    assert table.vertices["position"].shape == (1, 3)
+
+    # Columns are read-only snapshots
+    with pytest.raises(ValueError):
+        table.edges["length"][0] = 5.0
+
+    # Round trip through an .npz file
+    table.save(tmp_path / "topology.npz")
+    loaded = TopologyTable.load(tmp_path / "topology.npz")
+    for kind in ("faces", "edges", "vertices"):
+        for name, column in getattr(table, kind).items():
+            np.testing.assert_array_equal(getattr(loaded, kind)[name], column)
+
+    with pytest.raises(ValueError, match="The edges table is missing the columns"):
+        TopologyTable(faces=table.faces, edges={"id": table.edges["id"]}, vertices=table.vertices)
+
+    edges = {**table.edges, "length": table.edges["length"][:1]}
+    with pytest.raises(ValueError, match="The columns of the edges table differ in length"):
+        TopologyTable(faces=table.faces, edges=edges, vertices=table.vertices)
+
+
+def test_topology_table_to_arrow():
+    """Test converting a ``TopologyTable`` to Arrow tables."""
+    pytest.importorskip("pyarrow")
+
+    arrow_table = _sample_table().to_arrow("edges")
+    assert arrow_table.num_rows == 2
+    assert {"bbox_min_x", "bbox_min_y", "bbox_min_z"}.issubset(arrow_table.column_names)
@@ -50,6 +50,7 @@ from ansys.geometry.core._grpc._services.v0.conversions import (
     from_sketch_circle_to_grpc_circle,
     from_sketch_ellipse_to_grpc_ellipse,
     from_sketch_polygon_to_grpc_polygon,
+    from_sketch_segment_array_to_grpc_lines,
     from_sketch_segment_to_grpc_line,
     from_sketch_shapes_to_grpc_geometries,
     from_surface_to_grpc_surface,
@@ -75,6 +76,7 @@ from ansys.geometry.core.sketch.edge import SketchEdge
 from ansys.geometry.core.sketch.ellipse import SketchEllipse
 from ansys.geometry.core.sketch.polygon import Polygon
 from ansys.geometry.core.sketch.segment import SketchSegment
+from ansys.geometry.core.sketch.segment_array import SketchSegmentArray
 
 
 def test_sketch_shapes_to_grpc_geometries_multiple_faces():
@@ -889,6 +891,38 @@ def test_segment_message_conversion():
     assert grpc_line_message.end.z == 1.0
 
 
+def test_segment_array_message_conversion():
+    """Test conversion between :class: `SketchSegmentArray
+    <ansys.geometry.core.sketch.segment_array.SketchSegmentArray>` and expected gRPC
+    message types.
+    """
+    segments = SketchSegmentArray(
+        np.array([[30, 400], [500, 600]]),
+        np.array([[500, 600], [30, 400]]),
+        UNITS.mm,
+    )
+    grpc_line_messages = from_sketch_segment_array_to_grpc_lines(
+        segments, Plane(Point3D([10, 100, 1000], UNITS.mm))
+    )
+
+    # Same result as the equivalent SketchSegment conversions
+    assert len(grpc_line_messages) == 2
+    for grpc_line_message, (start, end) in zip(
+        grpc_line_messages, [([30, 400], [500, 600]), ([500, 600], [30, 400])]
+    ):
+        expected = from_sketch_segment_to_grpc_line(
+            SketchSegment(Point2D(start, UNITS.mm), Point2D(end, UNITS.mm)),
+            Plane(Point3D([10, 100, 1000], UNITS.mm)),
+        )
+        for point, expected_point in [
+            (grpc_line_message.start, expected.start),
+            (grpc_line_message.end, expected.end),
+        ]:
+            assert point.x == pytest.approx(expected_point.x)
+            assert point.y == pytest.approx(expected_point.y)
+            assert point.z == pytest.approx(expected_point.z)
+
+
 def test_polygon_message_conversion():
     """Test conversion between :class:`Polygon
     <ansys.geometry.core.sketch.polygon.Polygon>` and expected gRPC message